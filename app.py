@@ -5,6 +5,7 @@ Version 2.1 avec Graphiques Plotly et Assistant Multi-Passes
 import streamlit as st
 import pandas as pd
 import sys
+import time
 from pathlib import Path
 
 # Ajouter le dossier src au path
@@ -21,6 +22,14 @@ from src.validation import (
     validate_solution_feasibility,
     suggest_improvements
 )
+from src.pareto_solver import ParetoSolver
+from src.interactive_solver import InteractiveSolver
+from src.background_jobs import (
+    SolveJob,
+    SOLVE_JOB_POLL_SECONDS,
+    SOLVE_JOB_PREVIEW,
+    QUICK_PREVIEW_SECONDS
+)
 from src.multipass_solver import (
     MultiPassSolver,
     ConflictAnalyzer,
@@ -34,7 +43,8 @@ from src.visualizations import (
     create_consecutive_days_chart,
     create_quality_comparison_chart,
     create_gantt_chart,
-    create_statistics_overview
+    create_statistics_overview,
+    create_convergence_chart
 )
 from src.ui_components import (
     render_participant_editor,
@@ -43,6 +53,7 @@ from src.ui_components import (
     render_solution_tabs,
     render_help_section
 )
+from src.profiler import SamplingProfiler, profile_directory
 
 # Configuration de la page
 st.set_page_config(
@@ -109,6 +120,30 @@ def initialize_session_state():
     if 'solver_info' not in st.session_state:
         st.session_state.solver_info = {}
 
+
+def start_render_profiling():
+    """
+    Profileur du rendu des résultats (ESTIVALES_PROFILE_DIR, phase 'render'),
+    None si inactif; écrit d'abord le profil d'un rendu interrompu (st.rerun, st.stop)
+    """
+    interrupted = st.session_state.pop('render_profiler', None)
+    if interrupted is not None:
+        interrupted.write('render')
+    directory = profile_directory()
+    if not directory:
+        return None
+    profiler = SamplingProfiler(directory)
+    profiler.push('render')
+    st.session_state.render_profiler = profiler
+    return profiler
+
+
+def finish_render_profiling(profiler):
+    """Écrit le profil du rendu des résultats"""
+    if profiler is not None:
+        st.session_state.pop('render_profiler', None)
+        profiler.write('render')
+
 initialize_session_state()
 
 # ======================================================
@@ -679,6 +714,44 @@ with col_config1:
         st.caption("✅ 1 meilleure variante par profil")
     else:
         st.caption("⚠️ Toutes les variantes affichées")
+    
+    # Ordre d'énumération: meilleurs scores d'abord
+    quality_order = st.checkbox(
+        "🏅 Meilleures variantes d'abord",
+        value=True,
+        help="""Énumère par score qualité décroissant.
+        
+        ✅ Coché (recommandé) : si la limite ou le timeout est atteint,
+        les variantes gardées sont les meilleures de l'espace
+        ❌ Décoché : ordre du solver (préfixe arbitraire si tronqué)
+        """
+    )
+    st.session_state.enumeration_order = 'quality' if quality_order else 'arbitrary'
+    
+    # Variantes les plus différentes au lieu de l'énumération complète
+    if st.checkbox(
+        "🌈 Variantes les plus différentes",
+        value=False,
+        help="""Cherche quelques variantes deux à deux aussi différentes que
+        possible (nombre de participations qui changent), au lieu d'énumérer
+        toutes les variantes puis d'en afficher 10 souvent presque identiques.
+        
+        Une petite résolution par variante (max 1s). Le nombre de variantes
+        est la limite de profils (10 si illimité)."""
+    ):
+        st.session_state.enumeration_order = 'diverse'
+    
+    # Front de Pareto au lieu des variantes pondérées
+    st.session_state.pareto_mode = st.checkbox(
+        "📐 Front de Pareto",
+        value=False,
+        help="""Calcule les compromis non dominés entre lésion max, total lésé,
+        fatigue et équipes incomplètes (aucun poids arbitraire).
+        
+        ✅ Coché : quelques compromis à comparer, calcul rapide
+        ❌ Décoché : variantes énumérées autour de l'optimum pondéré
+        """
+    )
 
 with col_config2:
     # Score minimum pour filtrer
@@ -688,16 +761,55 @@ with col_config2:
         max_value=100,
         value=0,
         step=5,
-        help="""Filtre les profils APRÈS le calcul selon leur score qualité.
+        help="""Ne garde que les profils dont le score qualité atteint ce seuil.
         
         - 0 : Tous les profils (défaut)
         - 50-69 : Qualité acceptable
         - 70+ : Bonne à excellente qualité
         
-        IMPORTANT: Le filtrage se fait après le solve pour ne pas manquer
-        des solutions que OR-Tools considère optimales mais qui ont un bon score."""
+        Par défaut, les profils sont filtrés après l'énumération."""
     )
     st.session_state.min_quality_score = min_quality_score
+    
+    if min_quality_score > 0:
+        st.session_state.score_filter_in_solver = st.checkbox(
+            "🧮 Seuil dans le solver",
+            value=False,
+            help="""Compile le seuil dans le solver: les profils sous le seuil ne
+            sont jamais générés, et la lésion max peut dépasser l'optimum si le
+            score reste au-dessus du seuil (aucun bon profil n'est manqué)."""
+        )
+    else:
+        st.session_state.score_filter_in_solver = False
+    
+    # Bande d'énumération autour de l'optimum
+    band_labels = {
+        'max_shortage': "Même lésion max (tout le reste libre)",
+        'objective': "Objectif à ε près de l'optimum",
+        'total_shortage': "Total lésé à k jours près"
+    }
+    enumeration_band = st.selectbox(
+        "🎚️ Bande d'énumération",
+        options=list(band_labels.keys()),
+        format_func=lambda b: band_labels[b],
+        help="""Restreint les variantes énumérées autour de la solution optimale.
+        
+        Sur les groupes peu contraints, 'Même lésion max' peut produire des
+        milliers de variantes : une bande garde l'énumération exhaustive
+        rapide. Le nombre de variantes exclues est affiché après le calcul."""
+    )
+    st.session_state.enumeration_band = enumeration_band
+    
+    if enumeration_band == 'objective':
+        st.session_state.band_epsilon = st.number_input(
+            "ε (unités d'objectif, 1000 = 1 jour lésé)",
+            min_value=0, max_value=100000, value=1000, step=500
+        )
+    elif enumeration_band == 'total_shortage':
+        st.session_state.band_total_shortage = st.number_input(
+            "k (jours lésés en plus de l'optimum)",
+            min_value=0, max_value=20, value=1, step=1
+        )
 
 with col_config3:
     # Limite du nombre de profils
@@ -721,6 +833,17 @@ with col_config3:
         st.caption("🔄 Mode exhaustif")
     
     st.session_state.max_solutions = max_solutions if max_solutions else 99999
+    
+    # Comptes exacts de variantes par profil
+    st.session_state.count_variants = st.checkbox(
+        "🧮 Compter toutes les variantes",
+        value=False,
+        help="""Nombre EXACT de variantes de chaque profil affiché, calculé
+        sans les énumérer (même quand il y en a des millions). Peut être long
+        sur les grands groupes.
+        
+        ❌ Décoché : nombre de variantes trouvées par l'énumération"""
+    )
 
 # Timeout
 st.markdown("#### ⏱️ Temps de Calcul")
@@ -736,6 +859,21 @@ timeout = st.slider(
     - 300s: Recommandé (exhaustif)
     - 600s: Maximum pour cas complexes"""
 )
+quick_preview = st.checkbox(
+    "⚡ Aperçu rapide",
+    value=st.session_state.get('quick_preview', True),
+    help=f"""Affiche en {QUICK_PREVIEW_SECONDS:.0f}s des plannings provisoires
+    (meilleurs trouvés jusque-là), remplacés par les résultats complets
+    dès la fin du calcul."""
+)
+st.session_state.quick_preview = quick_preview
+deterministic = st.checkbox(
+    "🔁 Résultats reproductibles",
+    value=st.session_state.get('deterministic', False),
+    help="""Mêmes participants et paramètres → mêmes variantes, dans le même
+    ordre (recherche séquentielle à graine fixe, plus lente)."""
+)
+st.session_state.deterministic = deterministic
 
 # ======================================================
 # SECTION 3: VALIDATION ET SUGGESTIONS
@@ -828,110 +966,236 @@ if st.button("🚀 Calculer les Variantes", type="primary", width="stretch"):
         max_solutions=st.session_state.max_solutions,
         timeout_seconds=float(timeout),
         search_mode='unique_profiles' if st.session_state.get('unique_profiles_mode', True) else 'all',
-        min_quality_score=st.session_state.get('min_quality_score', 50)
+        min_quality_score=st.session_state.get('min_quality_score', 50),
+        score_filter_in_solver=st.session_state.get('score_filter_in_solver', False),
+        enumeration_band=st.session_state.get('enumeration_band', 'max_shortage'),
+        band_epsilon=int(st.session_state.get('band_epsilon', 1000)),
+        band_total_shortage=int(st.session_state.get('band_total_shortage', 1)),
+        enumeration_order=st.session_state.get('enumeration_order', 'quality'),
+        count_variants=st.session_state.get('count_variants', False),
+        keep_enumeration=True,
+        latency_budget=QUICK_PREVIEW_SECONDS if st.session_state.get('quick_preview', True) else 0.0,
+        deterministic=st.session_state.get('deterministic', False),
+        **st.session_state.get('objective_weights', {})
     )
-    
-    # Zone de progression
-    progress_container = st.empty()
-    status_text = st.empty()
-    
-    # Utiliser le MultiPassSolver
-    multipass = MultiPassSolver(config)
-    
-    # Callback de progression
-    def progress_callback(phase, message):
-        if phase == "pass1":
-            status_text.info(f"🏐 **Pass 1 - Optimisation**: {message}")
-        elif phase == "pass2":
-            status_text.warning(f"🏐 **Pass 2 - Énumération**: {message}")
-        elif phase == "pass3":
-            status_text.info(f"🏐 **Pass 3 - Relaxation**: {message}")
-    
-    # Lancer la résolution multi-passes avec spinner
-    with st.spinner("🏐 Calcul en cours..."):
-        status_text.text("🔨 Construction du modèle...")
+    # Échantillon, voisinage et édition rapide liés aux anciens résultats
+    # (roster saisi gardé tel quel: la relaxation multipass modifie les vœux)
+    st.session_state.solved_participants = participants
+    st.session_state.solved_weights = dict(st.session_state.get('objective_weights', {}))
+    st.session_state.pop('profile_samples', None)
+    st.session_state.pop('neighborhood', None)
+    st.session_state.pop('interactive_solver', None)
+    st.session_state.pop('interactive_result', None)
+    
+    if st.session_state.get('pareto_mode', False):
+        # Front de Pareto: quelques compromis non dominés au lieu des variantes pondérées
+        with st.spinner("📐 Calcul du front de Pareto..."):
+            front, front_status, front_info = ParetoSolver(config).solve_front(
+                participants,
+                active_tournaments
+            )
         
-        result = multipass.solve_multipass(
+        st.session_state.pareto_front = [point.to_dict() for point in front]
+        st.session_state.variant_counts = {}
+        st.session_state.convergence = None
+        st.session_state.solutions = [point.solution for point in front]
+        st.session_state.solver_info = front_info
+        st.session_state.candidates = []  # Pas d'aide au choix multipass en mode Pareto
+        
+        if front:
+            message = f"📐 {len(front)} compromis non dominé(s) ({front_info['num_solves']} résolutions)"
+            if front_info['front_complete']:
+                st.success(message)
+            else:
+                st.warning(f"{message} - front partiel (timeout)")
+        else:
+            st.error(f"❌ Aucune solution trouvée ({front_status})")
+    
+    else:
+        st.session_state.pareto_front = None
+        st.session_state.variant_counts = {}
+        st.session_state.convergence = None
+        
+        # Calcul en arrière-plan: survit aux reruns, annulable (suivi plus bas)
+        previous_job = st.session_state.get('solve_job')
+        if previous_job is not None and previous_job.running:
+            previous_job.cancel()
+        solve_job = SolveJob(
+            config,
             participants,
             active_tournaments,
-            progress_callback=progress_callback
+            previous_info=st.session_state.get('previous_enumeration')
         )
+        solve_job.start()
+        st.session_state.solve_job = solve_job
+
+# Suivi du calcul en arrière-plan: progression, résultats partiels, annulation
+solve_job = st.session_state.get('solve_job')
+if solve_job is not None and solve_job.running:
+    phase, message = solve_job.progress
+    if phase == "pass1":
+        st.info(f"🏐 **Pass 1 - Optimisation**: {message}")
+    elif phase == "pass2":
+        st.warning(f"🏐 **Pass 2 - Énumération**: {message}")
+    elif phase == "pass3":
+        st.info(f"🏐 **Pass 3 - Relaxation**: {message}")
+    elif phase == "provisional":
+        st.info(f"⚡ **Aperçu rapide**: {message}")
+    else:
+        st.text(f"🔨 {message}")
+    
+    partial = solve_job.partial_solutions()
+    st.caption(
+        f"⏳ Calcul en cours depuis {solve_job.elapsed:.0f}s - "
+        f"{len(partial)} variante(s) trouvée(s) pour l'instant"
+    )
+    if solve_job.showing_provisional:
+        relaxed = solve_job.provisional_info.get('relaxed')
+        st.warning(
+            "🕐 **Plannings provisoires** (meilleurs trouvés en "
+            f"{QUICK_PREVIEW_SECONDS:.0f}s, non prouvés)"
+            + (" - vœux stricts assouplis" if relaxed else "")
+            + " : remplacés par les résultats complets à la fin du calcul"
+        )
+    if partial:
+        st.dataframe(
+            pd.DataFrame([
+                {'Variante': i + 1, 'Score': s.get_quality_score(), 'Vœux non respectés': len(s.violated_wishes)}
+                for i, s in enumerate(partial[:SOLVE_JOB_PREVIEW])
+            ]),
+            hide_index=True
+        )
+    
+    if st.button("⏹️ Annuler le calcul", disabled=solve_job.cancelled):
+        solve_job.cancel()
     
-    status_text.empty()
+    time.sleep(SOLVE_JOB_POLL_SECONDS)
+    st.rerun()
+
+elif solve_job is not None:
+    # Calcul terminé (ou annulé): appliquer le résultat une seule fois
+    st.session_state.solve_job = None
+    participants = solve_job.participants
+    active_tournaments = solve_job.tournaments
+    config = solve_job.config
+    
+    if solve_job.error is not None:
+        st.error(f"❌ Erreur pendant le calcul: {solve_job.error}")
     
-    # Traiter le résultat
-    if result.status == 'success':
-        st.success(result.message)
+    else:
+        result = solve_job.result
+        
+        # Énumération gardée pour re-résoudre incrémentalement après une édition
+        st.session_state.previous_enumeration = (
+            result.solver_info if 'enumeration' in result.solver_info else None
+        )
+        st.session_state.variant_counts = result.solver_info.get('variant_counts', {})
+        st.session_state.variant_counts_unfiltered = result.solver_info.get(
+            'variant_counts_unfiltered', False
+        )
+        # Séries de convergence (incumbent/borne, profils/s) du dernier calcul
+        st.session_state.convergence = result.solver_info.get('convergence')
         
-        # Filtrer par score minimum SI configuré
-        solutions_avant_filtre = result.solutions
-        min_score = st.session_state.get('min_quality_score', 0)
+        if result.solver_info.get('incremental'):
+            st.caption(
+                f"⚡ Re-résolution incrémentale : {result.solver_info['kept']} variante(s) "
+                f"reprise(s), {result.solver_info['delta']} nouvelle(s)"
+            )
         
-        if min_score > 0:
-            solutions_filtrees = [
-                s for s in solutions_avant_filtre 
-                if s.get_quality_score() >= min_score
-            ]
+        # Variantes diverses: écart minimal garanti entre deux variantes
+        min_distance = result.solver_info.get('min_pairwise_distance')
+        if min_distance is not None:
+            st.caption(
+                f"🌈 Deux variantes affichées diffèrent d'au moins {min_distance} participation(s)"
+            )
+        
+        # Variantes exclues par la bande d'énumération
+        band_excluded = result.solver_info.get('band_excluded')
+        if band_excluded is not None:
+            prefix = "" if result.solver_info.get('band_excluded_exact') else "≥ "
+            st.caption(f"🎚️ Bande d'énumération : {prefix}{band_excluded} variante(s) exclue(s)")
+        
+        # Traiter le résultat
+        if result.status == 'success':
+            st.success(result.message)
             
-            if len(solutions_filtrees) < len(solutions_avant_filtre):
-                st.info(f"🔍 Filtrage par score ≥{min_score}: {len(solutions_avant_filtre)} → {len(solutions_filtrees)} profils conservés")
+            # Filtrer par score minimum SI configuré
+            solutions_avant_filtre = result.solutions
+            min_score = st.session_state.get('min_quality_score', 0)
             
-            st.session_state.solutions = solutions_filtrees
-        else:
-            st.session_state.solutions = solutions_avant_filtre
-        
-        st.session_state.solver_info = {'pass': result.pass_number}
+            if min_score > 0:
+                solutions_filtrees = [
+                    s for s in solutions_avant_filtre 
+                    if s.get_quality_score() >= min_score
+                ]
+                
+                if len(solutions_filtrees) < len(solutions_avant_filtre):
+                    st.info(f"🔍 Filtrage par score ≥{min_score}: {len(solutions_avant_filtre)} → {len(solutions_filtrees)} profils conservés")
+                
+                st.session_state.solutions = solutions_filtrees
+            else:
+                st.session_state.solutions = solutions_avant_filtre
+            
+            st.session_state.solver_info = {'pass': result.pass_number}
+            
+            # TOUJOURS sauvegarder les candidats pour permettre le choix manuel
+            if result.candidates_if_failed:
+                st.session_state.candidates = result.candidates_if_failed
+                st.session_state.active_tournaments = active_tournaments
+                st.session_state.participants_for_relax = participants
+                st.info("💡 Des solutions ont été trouvées automatiquement. Vous pouvez affiner en choisissant manuellement dans 'Aide au Choix' ci-dessous.")
+            
+            if result.relaxed_participants:
+                st.info(f"ℹ️ Participants lésés automatiquement: {', '.join(result.relaxed_participants)}")
         
-        # TOUJOURS sauvegarder les candidats pour permettre le choix manuel
-        if result.candidates_if_failed:
+        elif result.status == 'need_user_choice':
+            st.warning(result.message)
+            
+            # Sauvegarder TOUJOURS solutions (même vide) pour afficher l'Aide au Choix
+            st.session_state.solutions = result.solutions if result.solutions else []
             st.session_state.candidates = result.candidates_if_failed
+            st.session_state.solver_info = {'pass': result.pass_number}
             st.session_state.active_tournaments = active_tournaments
             st.session_state.participants_for_relax = participants
-            st.info("💡 Des solutions ont été trouvées automatiquement. Vous pouvez affiner en choisissant manuellement dans 'Aide au Choix' ci-dessous.")
-        
-        if result.relaxed_participants:
-            st.info(f"ℹ️ Participants lésés automatiquement: {', '.join(result.relaxed_participants)}")
-    
-    elif result.status == 'need_user_choice':
-        st.warning(result.message)
-        
-        # Sauvegarder TOUJOURS solutions (même vide) pour afficher l'Aide au Choix
-        st.session_state.solutions = result.solutions if result.solutions else []
-        st.session_state.candidates = result.candidates_if_failed
-        st.session_state.solver_info = {'pass': result.pass_number}
-        st.session_state.active_tournaments = active_tournaments
-        st.session_state.participants_for_relax = participants
-        
-        st.info("👇 Voir la section 'Aide au Choix' ci-dessous pour sélectionner qui léser")
-    
-    elif result.status == 'impossible':
-        st.error(result.message)
-        
-        # Diagnostic automatique
-        diagnostics = ConflictAnalyzer.analyze_why_no_solution(
-            participants,
-            active_tournaments,
-            config
-        )
-        
-        diagnostic_message = format_diagnostic_message(diagnostics)
-        st.markdown(diagnostic_message)
+            
+            st.info("👇 Voir la section 'Aide au Choix' ci-dessous pour sélectionner qui léser")
         
-        # Sauvegarder solutions partielles si elles existent
-        if result.solutions:
-            st.info(f"ℹ️ {len(result.solutions)} solution(s) partielle(s) trouvée(s) malgré tout")
-            st.session_state.solutions = result.solutions
-            st.session_state.solver_info = {'pass': result.pass_number}
-    
-    else:  # partial_success
-        st.warning(result.message)
-        if result.solutions:
+        elif result.status == 'impossible':
+            st.error(result.message)
+            
+            # Diagnostic automatique
+            diagnostics = ConflictAnalyzer.analyze_why_no_solution(
+                participants,
+                active_tournaments,
+                config
+            )
+            
+            diagnostic_message = format_diagnostic_message(diagnostics)
+            st.markdown(diagnostic_message)
+            
+            # Sauvegarder solutions partielles si elles existent
+            if result.solutions:
+                st.info(f"ℹ️ {len(result.solutions)} solution(s) partielle(s) trouvée(s) malgré tout")
+                st.session_state.solutions = result.solutions
+                st.session_state.solver_info = {'pass': result.pass_number}
+        
+        elif result.status == 'cancelled':
+            # Résultats partiels gardés: le travail déjà fait n'est pas perdu
+            st.warning(result.message)
             st.session_state.solutions = result.solutions
             st.session_state.solver_info = {'pass': result.pass_number}
+        
+        else:  # partial_success
+            st.warning(result.message)
+            if result.solutions:
+                st.session_state.solutions = result.solutions
+                st.session_state.solver_info = {'pass': result.pass_number}
 
 # ======================================================
 # SECTION 5: RÉSULTATS ET AIDE AU CHOIX
 # ======================================================
+render_profiler = start_render_profiling()
+
 # Afficher si on a des solutions OU des candidats à léser
 if st.session_state.solutions or ('candidates' in st.session_state and st.session_state.candidates):
     st.markdown("---")
@@ -939,6 +1203,16 @@ if st.session_state.solutions or ('candidates' in st.session_state and st.sessio
     
     solutions = st.session_state.solutions if st.session_state.solutions else []
     
+    # Front de Pareto: tableau des compromis (critères minimisés)
+    if st.session_state.get('pareto_front'):
+        st.subheader("📐 Front de Pareto")
+        st.caption("Chaque ligne est un compromis : aucun autre ne fait mieux sur tous les critères.")
+        st.dataframe(
+            pd.DataFrame(st.session_state.pareto_front),
+            width="stretch",
+            hide_index=True
+        )
+    
     # Reconstruire active_tournaments pour l'affichage
     active_tournaments = [
         Tournament(**t) for t in TOURNAMENTS
@@ -1355,13 +1629,21 @@ if st.session_state.solutions or ('candidates' in st.session_state and st.sessio
     else:
         st.info(f"ℹ️ Mode exploration : toutes les variantes affichées ({len(filtered)} solutions)")
     
+    # Comptes exacts par profil (si calculés), sinon variantes énumérées;
+    # avec une bande ou un score minimum, le DP compte aussi ce qu'ils excluent
+    variant_counts = st.session_state.get('variant_counts') or {}
+    counts_label = (
+        "variantes, toutes bandes confondues"
+        if variant_counts and st.session_state.get('variant_counts_unfiltered') else "variantes"
+    )
+    
     # Sélecteur de profil pour filtrer
     profil_labels = []
     profil_signatures = []
     for idx, (signature, solutions) in enumerate(profils_dict.items(), 1):
         profil_str = ", ".join([f"{nom} (-{jours}j)" for nom, jours in signature])
-        nb_variantes = len(solutions)
-        profil_labels.append(f"Profil #{idx} : {profil_str} ({nb_variantes} variantes)")
+        nb_variantes = variant_counts.get(signature, len(solutions))
+        profil_labels.append(f"Profil #{idx} : {profil_str} ({nb_variantes} {counts_label})")
         profil_signatures.append(signature)
     
     # Sélecteur de profil seulement si mode exploration
@@ -1393,7 +1675,7 @@ if st.session_state.solutions or ('candidates' in st.session_state and st.sessio
             profil_str = ", ".join([f"{nom} (-{jours}j)" for nom, jours in signature])
             
             # Nombre de variantes pour ce profil
-            nb_variantes = len(solutions)
+            nb_variantes = variant_counts.get(signature, len(solutions))
             
             # Score max
             score_max = max(s.get_quality_score() for s in solutions)
@@ -1402,15 +1684,187 @@ if st.session_state.solutions or ('candidates' in st.session_state and st.sessio
             total_lese = sum(jours for _, jours in signature)
             
             # Afficher le profil avec des métriques
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+            col1, col2, col3, col4, col5 = st.columns([3, 1, 1, 1, 1])
             with col1:
                 st.markdown(f"**Profil #{idx}** : {profil_str}")
             with col2:
-                st.metric("Variantes", nb_variantes)
+                st.metric(
+                    "Variantes", f"{nb_variantes:,}".replace(",", " "),
+                    help=(
+                        "Toutes bandes confondues : le compte ignore la bande "
+                        "d'énumération et le score minimum"
+                        if counts_label != "variantes" else None
+                    )
+                )
             with col3:
                 st.metric("Total lésé", f"{total_lese}j")
             with col4:
                 st.metric("Score max", f"{score_max:.0f}/100")
+            with col5:
+                if st.button(
+                    "🎲 Échantillon",
+                    key=f"sample_profile_{idx}",
+                    help="Tire jusqu'à 50 variantes au hasard (quasi uniformes) parmi "
+                         "TOUTES les variantes de ce profil, sans les énumérer"
+                ):
+                    reference = solutions[0]
+                    sampler = TournamentSolver(SolverConfig(
+                        include_o3=st.session_state.include_o3,
+                        allow_incomplete=st.session_state.allow_incomplete,
+                        timeout_seconds=60.0
+                    ))
+                    with st.spinner("🎲 Échantillonnage des variantes..."):
+                        samples, _, sample_info = sampler.sample_profile_variants(
+                            reference.participants,
+                            reference.tournaments,
+                            {nom: -jours for nom, jours in signature}
+                        )
+                    st.session_state.profile_samples = (signature, samples, sample_info)
+                    st.session_state.pop('neighborhood', None)
+    
+    # Échantillon de variantes d'un profil (remplace l'affichage)
+    profile_samples = st.session_state.get('profile_samples')
+    if profile_samples and profile_samples[0] in profils_dict:
+        signature, samples, sample_info = profile_samples
+        filtered = sorted(samples, key=lambda s: -s.get_quality_score())
+        col_sample1, col_sample2 = st.columns([4, 1])
+        with col_sample1:
+            st.success(
+                f"🎲 {len(samples)} variantes tirées au hasard parmi "
+                f"{sample_info['variant_count']:,}".replace(",", " ") +
+                f" ({sample_info['elapsed_time']:.1f}s)"
+            )
+        with col_sample2:
+            if st.button("✖️ Fermer l'échantillon"):
+                del st.session_state.profile_samples
+                st.rerun()
+    
+    # Voisinage d'une variante choisie (la référence reste en Option 1)
+    neighborhood = st.session_state.get('neighborhood')
+    if neighborhood:
+        reference, neighbors, neighbor_info = neighborhood
+        filtered = [reference] + neighbors
+        col_neigh1, col_neigh2 = st.columns([4, 1])
+        with col_neigh1:
+            st.success(
+                f"🔍 {len(neighbors)} variante(s) à au plus {neighbor_info['radius']} "
+                f"changement(s) de l'Option 1 ({neighbor_info['elapsed_time']:.2f}s)"
+            )
+        with col_neigh2:
+            if st.button("✖️ Fermer le voisinage"):
+                del st.session_state.neighborhood
+                st.rerun()
+    
+    # Pondérations: reclassement instantané des variantes affichées
+    with st.expander("⚖️ Pondérations (reclassement instantané)"):
+        defaults = SolverConfig()
+        col_w1, col_w2, col_w3 = st.columns(3)
+        with col_w1:
+            weight_wishes = st.number_input(
+                "Jour lésé", min_value=0, max_value=50000, step=100,
+                value=st.session_state.get('objective_weights', {}).get(
+                    'weight_wishes', defaults.weight_wishes
+                )
+            )
+        with col_w2:
+            weight_fatigue = st.number_input(
+                "Fatigue", min_value=0, max_value=50000, step=100,
+                value=st.session_state.get('objective_weights', {}).get(
+                    'weight_fatigue', defaults.weight_fatigue
+                )
+            )
+        with col_w3:
+            weight_incomplete = st.number_input(
+                "Équipe incomplète", min_value=0, max_value=50000, step=10,
+                value=st.session_state.get('objective_weights', {}).get(
+                    'weight_incomplete', defaults.weight_incomplete
+                )
+            )
+        st.session_state.objective_weights = {
+            'weight_wishes': int(weight_wishes),
+            'weight_fatigue': int(weight_fatigue),
+            'weight_incomplete': int(weight_incomplete)
+        }
+        st.caption(
+            "Les variantes déjà trouvées sont reclassées sans recalcul; "
+            "« ⚡ Recalculer » ci-dessous ré-optimise avec ces poids."
+        )
+    
+    # Poids du dernier calcul (défauts de SolverConfig si non modifiés)
+    solved_weights = {
+        name: st.session_state.get('solved_weights', {}).get(name, getattr(defaults, name))
+        for name in st.session_state.objective_weights
+    }
+    if st.session_state.objective_weights != solved_weights:
+        filtered, rerank_info = TournamentSolver(
+            SolverConfig(**st.session_state.objective_weights)
+        ).rerank(filtered)
+        st.caption(
+            f"⚖️ Variantes reclassées selon les nouveaux poids "
+            f"({rerank_info['elapsed_time'] * 1000:.0f} ms)"
+        )
+    
+    # Édition rapide: forçages et vœux stricts sans reconstruire le modèle
+    with st.expander("⚡ Édition rapide (forcer / interdire un tournoi, vœux stricts)"):
+        interactive = st.session_state.get('interactive_solver')
+        if interactive is None:
+            reference = st.session_state.solutions[0]
+            interactive = InteractiveSolver(
+                SolverConfig(
+                    include_o3=st.session_state.include_o3,
+                    allow_incomplete=st.session_state.allow_incomplete
+                ),
+                st.session_state.get('solved_participants', reference.participants),
+                reference.tournaments
+            )
+            st.session_state.interactive_solver = interactive
+        
+        col_edit1, col_edit2, col_edit3, col_edit4 = st.columns([2, 1, 1, 1])
+        with col_edit1:
+            edit_name = st.selectbox("Participant", [p.nom for p in interactive.participants])
+        with col_edit2:
+            edit_tournament = st.selectbox("Tournoi", [t.id for t in interactive.tournaments])
+        with col_edit3:
+            edit_action = st.radio("Action", ["Forcer", "Interdire", "Libérer"], horizontal=True)
+        with col_edit4:
+            if st.button("✅ Appliquer"):
+                if edit_action == "Libérer":
+                    interactive.unpin(edit_name, edit_tournament)
+                else:
+                    interactive.pin(edit_name, edit_tournament, edit_action == "Forcer")
+        
+        strict_names = st.multiselect(
+            "Vœux stricts",
+            [p.nom for p in interactive.participants],
+            default=[nom for nom, strict in interactive.strict.items() if strict]
+        )
+        for nom in interactive.strict:
+            interactive.set_strict(nom, nom in strict_names)
+        
+        if interactive.pins:
+            st.caption("📌 " + ", ".join(
+                f"{nom} {'joue' if plays else 'ne joue pas'} {tid}"
+                for (nom, tid), plays in interactive.pins.items()
+            ))
+        
+        if st.button("⚡ Recalculer", type="primary"):
+            interactive.set_weights(**st.session_state.objective_weights)
+            st.session_state.interactive_result = interactive.solve()
+    
+    interactive_result = st.session_state.get('interactive_result')
+    if interactive_result:
+        edited_solution, edited_status, edited_info = interactive_result
+        if edited_solution is None:
+            st.error(
+                f"❌ Édition impossible ({edited_status}) : "
+                + ", ".join(edited_info['conflicts'])
+            )
+        else:
+            filtered = [edited_solution]
+            st.success(
+                f"⚡ Solution optimale avec les éditions "
+                f"(lésion max {edited_info['max_shortage']}j, {edited_info['elapsed_time']:.2f}s)"
+            )
     
     # Comparatif des 10 meilleures variantes
     st.markdown("---")
@@ -1423,6 +1877,27 @@ if st.session_state.solutions or ('candidates' in st.session_state and st.sessio
     else:
         st.info("Une seule variante disponible - voir détails ci-dessous")
     
+    # Convergence du solver: un plateau bien avant la limite = timeout réductible
+    convergence = st.session_state.get('convergence')
+    if convergence:
+        with st.expander("📈 Convergence du solver", expanded=False):
+            st.plotly_chart(
+                create_convergence_chart(convergence), use_container_width=True, key="conv_chart"
+            )
+            last_improvement = convergence.get('pass1_last_improvement')
+            if last_improvement is not None and convergence.get('pass1_time_limit'):
+                st.caption(
+                    f"PASS 1 : dernière amélioration à {last_improvement:.2f}s "
+                    f"sur {convergence['pass1_time_limit']:.1f}s allouées"
+                )
+            last_profile = convergence.get('pass2_last_new_profile')
+            if last_profile is not None and convergence.get('pass2_time_limit'):
+                st.caption(
+                    f"PASS 2 : dernier nouveau profil à {last_profile:.2f}s "
+                    f"sur {convergence['pass2_time_limit']:.1f}s allouées "
+                    f"({convergence.get('pass2_solutions_per_second', 0):.0f} solutions/s)"
+                )
+    
     # Affichage des variantes
     st.markdown("---")
     st.subheader("📋 Variantes Proposées")
@@ -1627,6 +2102,38 @@ if st.session_state.solutions or ('candidates' in st.session_state and st.sessio
                     f"{avg_days:.1f} jours"
                 )
                 
+                # Variantes proches de celle-ci
+                st.markdown("### 🔍 Variantes Proches")
+                col_neigh1, col_neigh2, col_neigh3 = st.columns(3)
+                with col_neigh1:
+                    radius = st.slider(
+                        "Changements max",
+                        min_value=2, max_value=8, value=4, step=1,
+                        key=f"neighborhood_radius_{i}",
+                        help="Nombre max de participations qui changent "
+                             "(échanger deux joueurs d'une équipe = 2)"
+                    )
+                with col_neigh2:
+                    same_profile = st.checkbox(
+                        "Même profil de lésés",
+                        value=False,
+                        key=f"neighborhood_profile_{i}"
+                    )
+                with col_neigh3:
+                    if st.button("🔍 Voir les variantes proches", key=f"neighborhood_{i}"):
+                        explorer = TournamentSolver(SolverConfig(
+                            include_o3=st.session_state.include_o3,
+                            allow_incomplete=st.session_state.allow_incomplete,
+                            max_solutions=st.session_state.get('max_solutions', 50),
+                            timeout_seconds=10.0
+                        ))
+                        neighbors, _, neighbor_info = explorer.explore_neighborhood(
+                            solution, radius, same_profile
+                        )
+                        st.session_state.neighborhood = (solution, neighbors, neighbor_info)
+                        st.session_state.pop('profile_samples', None)
+                        st.rerun()
+                
                 # Bouton d'export
                 if st.button(f"💾 Exporter cette solution", key=f"export_{i}"):
                     csv = df_recap.to_csv(index=False)
@@ -1640,6 +2147,8 @@ else:
     # Pas de solutions, seulement Aide au Choix affichée
     st.info("ℹ️ Aucune solution trouvée. Utilisez l'Aide au Choix ci-dessus pour débloquer la situation.")
 
+finish_render_profiling(render_profiler)
+
 # ======================================================
 # FOOTER
 # ======================================================
@@ -0,0 +1,3 @@
+"""
+Benchmarks de performance du solver (scripts à lancer manuellement)
+"""
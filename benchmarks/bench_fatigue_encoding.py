@@ -0,0 +1,70 @@
+"""
+Benchmark: encodage de la fatigue 'window' vs 'run_length'
+
+Compare pour chaque instance du corpus:
+- la taille du modèle PASS 1 (variables, contraintes)
+- le temps de construction du modèle
+- le temps de résolution PASS 1 et l'objectif obtenu
+
+Usage:
+    python -m benchmarks.bench_fatigue_encoding
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ortools.sat.python import cp_model
+
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from benchmarks.corpus import build_corpus
+
+ENCODINGS = ['window', 'run_length']
+TIME_LIMIT = 30.0
+REPEATS = 3
+
+
+def run_benchmark():
+    """Lance le benchmark et affiche un tableau comparatif"""
+    header = (
+        f"{'Instance':<16}{'Encodage':<12}{'Vars':>7}{'Contr.':>8}"
+        f"{'Build(s)':>10}{'Pass1(s)':>10}{'Objectif':>10}  Statut"
+    )
+    print(header)
+    print("-" * len(header))
+    
+    for name, participants, tournaments in build_corpus():
+        for encoding in ENCODINGS:
+            config = SolverConfig(allow_incomplete=True, fatigue_encoding=encoding)
+            solver = TournamentSolver(config)
+            
+            build_times = []
+            solve_times = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                model, _, _ = solver._build_model(participants, tournaments)
+                build_times.append(time.perf_counter() - start)
+                
+                cp_solver = solver._create_pass1_solver(TIME_LIMIT)
+                start = time.perf_counter()
+                status = cp_solver.Solve(model)
+                solve_times.append(time.perf_counter() - start)
+            
+            proto = model.Proto()
+            objective = (
+                int(cp_solver.ObjectiveValue())
+                if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) else '-'
+            )
+            print(
+                f"{name:<16}{encoding:<12}{len(proto.variables):>7}"
+                f"{len(proto.constraints):>8}"
+                f"{sorted(build_times)[REPEATS // 2]:>10.3f}"
+                f"{sorted(solve_times)[REPEATS // 2]:>10.3f}"
+                f"{objective:>10}  {cp_solver.StatusName(status)}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,80 @@
+"""
+Benchmark: formulation 'x_vars' vs 'schedule_table'
+
+Compare pour chaque instance du corpus:
+- le nombre de programmes admissibles (vs 2^tournois par participant)
+- la taille du modèle PASS 1 (variables, contraintes)
+- le temps de résolution PASS 1 et l'objectif obtenu (doit être identique)
+- le débit d'énumération PASS 2 (solutions comptées en ENUM_TIME secondes)
+
+Usage:
+    python -m benchmarks.bench_formulation
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ortools.sat.python import cp_model
+
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from src.schedules import enumerate_schedules
+from benchmarks.corpus import build_corpus
+
+FORMULATIONS = ['x_vars', 'schedule_table']
+TIME_LIMIT = 30.0
+ENUM_TIME = 5.0
+REPEATS = 3
+
+
+def run_benchmark():
+    """Lance le benchmark et affiche un tableau comparatif"""
+    header = (
+        f"{'Instance':<16}{'Formulation':<16}{'Vars':>7}{'Contr.':>8}"
+        f"{'Pass1(s)':>10}{'Objectif':>10}{'Pass2 sol/s':>13}  Statut"
+    )
+    
+    for name, participants, tournaments in build_corpus():
+        schedules = sum(len(enumerate_schedules(p, tournaments)) for p in participants)
+        subsets = len(participants) * 2 ** len(tournaments)
+        print(f"\n{name}: {schedules} programmes admissibles / {subsets} sous-ensembles")
+        print(header)
+        print("-" * len(header))
+        
+        for formulation in FORMULATIONS:
+            config = SolverConfig(allow_incomplete=True, formulation=formulation)
+            solver = TournamentSolver(config)
+            
+            solve_times = []
+            for _ in range(REPEATS):
+                model, _, auxiliary_vars = solver._build_model(participants, tournaments)
+                cp_solver = solver._create_pass1_solver(TIME_LIMIT)
+                start = time.perf_counter()
+                status = cp_solver.Solve(model)
+                solve_times.append(time.perf_counter() - start)
+            
+            proto = model.Proto()
+            solved = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+            objective = int(cp_solver.ObjectiveValue()) if solved else '-'
+            
+            throughput = '-'
+            if solved:
+                target = int(cp_solver.Value(auxiliary_vars["max_shortage"]))
+                enum_model, _, _ = solver._build_model_for_enumeration(
+                    participants, tournaments, target
+                )
+                count, exact = solver._count_solutions(enum_model, ENUM_TIME)
+                throughput = f"{count}" if exact else f"{count / ENUM_TIME:.0f}"
+            
+            print(
+                f"{name:<16}{formulation:<16}{len(proto.variables):>7}"
+                f"{len(proto.constraints):>8}"
+                f"{sorted(solve_times)[REPEATS // 2]:>10.3f}"
+                f"{objective:>10}{throughput:>13}  {cp_solver.StatusName(status)}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,202 @@
+"""
+Benchmark différentiel: chaque mode du solver contre l'oracle par force brute
+
+Sur de petites instances (src/brute_force.py parcourt toutes les
+affectations), vérifie que chaque mode retrouve exactement les profils
+de l'optimum (et leurs comptes en mode 'all') et mesure son temps:
+accélération par rapport à l'oracle et au mode par défaut. Toute
+optimisation de l'énumération doit garder la colonne OK intacte.
+
+Usage:
+    python -m benchmarks.bench_oracle [resultats.json]
+"""
+import json
+import sys
+import time
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import __version__
+from src.brute_force import brute_force_profiles
+from src.constants import SEARCH_STRATEGIES, SOLVER_PROFILES
+from src.models import Participant, SolverConfig
+from src.solver import TournamentSolver
+from src.variant_counter import solution_profile_key
+from benchmarks.corpus import active_tournaments
+from benchmarks.generator import generate_roster
+
+TIME_LIMIT = 60.0
+REPEATS = 3
+
+DEFAULT_OUTPUT = "bench_oracle.json"
+
+# Graines des plannings générés (4 joueurs); la 16 fait baisser un vœu de
+# façon à créer des plannings hors de l'ancien espace ET sous l'ancienne
+# lésion max (énumérés deux fois par l'ancien incrémental)
+GENERATED_SEEDS = (0, 1, 2, 16)
+
+# Modes comparés: (champs de SolverConfig, attendu)
+# - 'profiles': exactement les profils de l'oracle
+# - 'counts': exactement les variantes de l'oracle (mode 'all')
+# - 'variant_counts': info['variant_counts'] == comptes de l'oracle
+# - 'subset': une partie des profils (sélection diverse)
+ORACLE_MODES = {
+    'default': ({}, 'profiles'),
+    'all': ({'search_mode': 'all'}, 'counts'),
+    'quality': ({'enumeration_order': 'quality'}, 'profiles'),
+    'diverse': ({'enumeration_order': 'diverse'}, 'subset'),
+    'schedule_table': ({'formulation': 'schedule_table'}, 'profiles'),
+    'run_length': ({'fatigue_encoding': 'run_length'}, 'profiles'),
+    'count_variants': ({'count_variants': True}, 'variant_counts'),
+    'deterministic': ({'deterministic': True}, 'profiles'),
+    'incremental': ({'keep_enumeration': True}, 'profiles'),
+    # Chaque planning gardé ou delta une seule fois (pas seulement ses profils)
+    'incremental_all': ({'keep_enumeration': True, 'search_mode': 'all'}, 'counts'),
+    **{
+        f'strategy_{name}': ({'search_strategy': name}, 'profiles')
+        for name in SEARCH_STRATEGIES if name != SolverConfig.search_strategy
+    },
+    **{
+        f'profile_{name}': ({'solver_profile': name}, 'profiles')
+        for name in SOLVER_PROFILES if name != 'default'
+    },
+}
+
+
+def oracle_instances():
+    """Petites instances (au plus 2^18 affectations), strictes et incomplètes"""
+    tournaments = active_tournaments(include_o3=False)
+    instances = [
+        ('couple_strict', [
+            Participant("Alice", "F", "Bob", 1, 1, "O3", False),
+            Participant("Bob", "M", "Alice", 2, 0, "O3", False),
+            Participant("Clara", "F", None, 1, 0, "E2", True),
+        ]),
+        ('trio_femmes', [
+            Participant("Alice", "F", None, 1, 1, "O3", False),
+            Participant("Betty", "F", None, 2, 1, "O3", False),
+            Participant("Clara", "F", None, 1, 1, "E2", False),
+            Participant("Dan", "M", None, 1, 0, "O3", False),
+        ]),
+    ]
+    instances += [
+        (f'genere_{seed}', generate_roster(4, seed=seed)) for seed in GENERATED_SEEDS
+    ]
+    return [
+        (f'{name}_{"incomplet" if allow_incomplete else "complet"}',
+         participants, tournaments, allow_incomplete)
+        for name, participants in instances
+        for allow_incomplete in (False, True)
+    ]
+
+
+def _incremental_previous(participants):
+    """
+    Roster avant l'édition rejouée en modes 'incremental*': un vœu d'open
+    en plus (l'édition baisse un vœu, le delta est non vide en général)
+    """
+    edited = replace(participants[0], voeux_open=participants[0].voeux_open + 1)
+    return [edited] + list(participants[1:])
+
+
+def run_mode(mode: str, participants, tournaments, allow_incomplete: bool):
+    """
+    Résout l'instance dans un mode
+    
+    Returns:
+        Tuple (solutions, info, temps)
+    """
+    overrides, _ = ORACLE_MODES[mode]
+    config = SolverConfig(
+        allow_incomplete=allow_incomplete,
+        max_solutions=0,
+        timeout_seconds=TIME_LIMIT,
+        **overrides
+    )
+    solver = TournamentSolver(config)
+    
+    if overrides.get('keep_enumeration'):
+        # Calcul précédent hors chrono: seule la re-résolution est mesurée
+        _, _, previous_info = solver.solve(_incremental_previous(participants), tournaments)
+        start = time.perf_counter()
+        solutions, _, info = solver.solve_incremental(participants, tournaments, previous_info)
+    else:
+        start = time.perf_counter()
+        solutions, _, info = solver.solve(participants, tournaments)
+    return solutions, info, time.perf_counter() - start
+
+
+def matches_oracle(mode: str, solutions, info, oracle) -> bool:
+    """Le résultat du mode est-il celui qu'attend l'oracle ?"""
+    _, expected = ORACLE_MODES[mode]
+    found = Counter(solution_profile_key(s) for s in solutions)
+    if oracle.optimal_max_shortage is None:
+        return not solutions
+    if expected == 'counts':
+        return found == Counter(oracle.profile_counts)
+    if expected == 'variant_counts':
+        return set(found) == oracle.profiles and info.get('variant_counts') == oracle.profile_counts
+    if expected == 'subset':
+        return bool(found) and set(found) <= oracle.profiles
+    return set(found) == oracle.profiles
+
+
+def run_benchmark(output: str = DEFAULT_OUTPUT):
+    """Compare chaque mode à l'oracle, affiche les accélérations et écrit le JSON"""
+    rows = []
+    failures = 0
+    
+    print(f"{'Instance':<26} {'Mode':<36} {'OK':>3} {'Temps':>8} {'vs oracle':>10} {'vs défaut':>10}")
+    for name, participants, tournaments, allow_incomplete in oracle_instances():
+        start = time.perf_counter()
+        oracle = brute_force_profiles(participants, tournaments, allow_incomplete)
+        oracle_time = time.perf_counter() - start
+        
+        default_time = None
+        for mode in ORACLE_MODES:
+            times = []
+            for _ in range(REPEATS):
+                solutions, info, elapsed = run_mode(mode, participants, tournaments, allow_incomplete)
+                times.append(elapsed)
+            elapsed = min(times)
+            ok = matches_oracle(mode, solutions, info, oracle)
+            failures += not ok
+            if mode == 'default':
+                default_time = elapsed
+            
+            row = {
+                'instance': name,
+                'mode': mode,
+                'matches_oracle': ok,
+                'time': elapsed,
+                'oracle_time': oracle_time,
+                'oracle_assignments': oracle.num_assignments,
+                'oracle_profiles': len(oracle.profile_counts),
+                'oracle_variants': oracle.num_variants,
+                'speedup_vs_oracle': oracle_time / elapsed if elapsed else None,
+                'speedup_vs_default': default_time / elapsed if elapsed else None,
+            }
+            rows.append(row)
+            print(
+                f"{name:<26} {mode[:36]:<36} {'✓' if ok else '✗':>3} {elapsed:>7.3f}s "
+                f"{row['speedup_vs_oracle'] or 0:>9.1f}x {row['speedup_vs_default'] or 0:>9.2f}x"
+            )
+    
+    report = {
+        'version': __version__,
+        'time_limit': TIME_LIMIT,
+        'repeats': REPEATS,
+        'failures': failures,
+        'results': rows,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n{failures} écart(s) avec l'oracle. Résultats écrits dans {output}")
+    return report
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT)
@@ -0,0 +1,128 @@
+"""
+Benchmark: montée en charge sur des plannings synthétiques (10 à 300 participants)
+
+Pour chaque taille, sur un planning généré (benchmarks.generator):
+- construction du modèle PASS 1
+- temps PASS 1 / PASS 2 et profils trouvés par seconde en PASS 2
+- pic de mémoire du processus (RSS)
+- nombre de sondes de relaxation de solve_multipass (planning avec vœux stricts)
+
+Les résultats sont écrits en JSON pour comparer les versions entre elles.
+
+Usage:
+    python -m benchmarks.bench_scaling [resultats.json]
+"""
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src import __version__
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from src.multipass_solver import MultiPassSolver
+from src.time_budget import TimeBudget, PhaseHistory
+from benchmarks.corpus import active_tournaments
+from benchmarks.generator import generate_roster
+
+SIZES = [10, 20, 40, 80, 150, 300]
+TIME_LIMIT = 60.0
+SEED = 0
+
+# Part de vœux stricts du planning passé à solve_multipass (sondes)
+MULTIPASS_STRICT_RATIO = 0.3
+
+DEFAULT_OUTPUT = "bench_scaling.json"
+
+
+def peak_rss_mb():
+    """Pic de mémoire résidente du processus (Mo), None hors Unix"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Ko sous Linux, octets sous macOS
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def measure_size(num_participants: int, tournaments) -> dict:
+    """Mesures d'une taille de planning"""
+    participants = generate_roster(num_participants, seed=SEED)
+    config = SolverConfig(allow_incomplete=True, timeout_seconds=TIME_LIMIT)
+    solver = TournamentSolver(config)
+    
+    start = time.perf_counter()
+    solver._build_model(participants, tournaments)
+    build_time = time.perf_counter() - start
+    
+    # Historique neuf: les tailles précédentes n'allongent pas la PASS 1
+    solutions, status, info = solver.solve(
+        participants, tournaments, budget=TimeBudget(TIME_LIMIT, history=PhaseHistory())
+    )
+    pass2_time = info.get('pass2_wall_time')
+    
+    strict = generate_roster(num_participants, seed=SEED, strict_ratio=MULTIPASS_STRICT_RATIO)
+    budget = TimeBudget(TIME_LIMIT, history=PhaseHistory())
+    start = time.perf_counter()
+    result = MultiPassSolver(config).solve_multipass(strict, tournaments, budget=budget)
+    multipass_time = time.perf_counter() - start
+    
+    return {
+        'participants': num_participants,
+        'build_time': build_time,
+        'status': status,
+        'pass1_time': info.get('pass1_wall_time', info.get('wall_time')),
+        'pass2_time': pass2_time,
+        'profiles': len(solutions),
+        'profiles_per_second': len(solutions) / pass2_time if pass2_time else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'multipass_status': result.status,
+        'multipass_pass': result.pass_number,
+        'multipass_probes': sum(1 for phase, _ in budget.allocations if phase == 'probe'),
+        'multipass_time': multipass_time,
+    }
+
+
+def run_benchmark(output: str = DEFAULT_OUTPUT):
+    """Lance le benchmark, affiche le tableau et écrit le JSON"""
+    tournaments = active_tournaments(include_o3=False)
+    rows = []
+    
+    print(f"{'Taille':>6} {'Build':>8} {'PASS 1':>8} {'PASS 2':>8} {'Prof/s':>8} "
+          f"{'RSS Mo':>8} {'Sondes':>7} {'Multi':>8}")
+    for size in SIZES:
+        row = measure_size(size, tournaments)
+        rows.append(row)
+        rate = row['profiles_per_second']
+        rss = row['peak_rss_mb']
+        print(
+            f"{size:>6} {row['build_time']:>7.3f}s {row['pass1_time']:>7.3f}s "
+            f"{(row['pass2_time'] or 0.0):>7.3f}s "
+            f"{'-' if rate is None else f'{rate:.1f}':>8} "
+            f"{'-' if rss is None else f'{rss:.0f}':>8} "
+            f"{row['multipass_probes']:>7} {row['multipass_time']:>7.2f}s"
+        )
+    
+    report = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': SEED,
+        'time_limit': TIME_LIMIT,
+        'results': rows,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nRésultats écrits dans {output}")
+    return report
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT)
@@ -0,0 +1,76 @@
+"""
+Benchmark: stratégies de recherche PASS 1 (config.search_strategy)
+
+Mesure le temps jusqu'à l'optimum prouvé de la PASS 1 pour chaque
+stratégie sur le corpus, puis recommande la stratégie par défaut:
+celle qui prouve l'optimum sur toutes les instances avec le plus petit
+temps cumulé (la médiane serait dominée par les petites instances).
+
+Usage:
+    python -m benchmarks.bench_search_strategy
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ortools.sat.python import cp_model
+
+from src.constants import SEARCH_STRATEGIES
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from benchmarks.corpus import build_corpus
+
+TIME_LIMIT = 30.0
+REPEATS = 3
+
+
+def time_to_optimal(strategy: str, participants, tournaments):
+    """Temps médian de la PASS 1 (None si l'optimum n'est pas prouvé)"""
+    solver = TournamentSolver(SolverConfig(allow_incomplete=True, search_strategy=strategy))
+    times = []
+    
+    for _ in range(REPEATS):
+        model, _, _ = solver._build_model(participants, tournaments)
+        cp_solver = solver._create_pass1_solver(TIME_LIMIT)
+        start = time.perf_counter()
+        status = cp_solver.Solve(model)
+        if status != cp_model.OPTIMAL:
+            return None
+        times.append(time.perf_counter() - start)
+    
+    return statistics.median(times)
+
+
+def run_benchmark():
+    """Lance le benchmark et affiche la stratégie recommandée"""
+    corpus = build_corpus()
+    results = {strategy: [] for strategy in SEARCH_STRATEGIES}
+    
+    print(f"{'Instance':<16}" + "".join(f"{s[:20]:>22}" for s in SEARCH_STRATEGIES))
+    for name, participants, tournaments in corpus:
+        row = f"{name:<16}"
+        for strategy in SEARCH_STRATEGIES:
+            elapsed = time_to_optimal(strategy, participants, tournaments)
+            results[strategy].append(elapsed)
+            row += f"{'timeout' if elapsed is None else f'{elapsed:.3f}s':>22}"
+        print(row)
+    
+    complete = {
+        strategy: sum(times)
+        for strategy, times in results.items()
+        if all(t is not None for t in times)
+    }
+    if not complete:
+        print("\nAucune stratégie ne prouve l'optimum sur tout le corpus")
+        return None
+    
+    best = min(complete, key=complete.get)
+    print(f"\nStratégie recommandée: {best} (total {complete[best]:.3f}s)")
+    return best
+
+
+if __name__ == "__main__":
+    run_benchmark()
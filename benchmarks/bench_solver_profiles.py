@@ -0,0 +1,78 @@
+"""
+Benchmark: profils de paramètres CP-SAT (config.solver_profile)
+
+Mesure le temps jusqu'à l'optimum prouvé de la PASS 1 pour chaque profil
+sur le corpus, puis recommande le profil par défaut: celui qui prouve
+l'optimum sur toutes les instances avec le plus petit temps médian.
+Le nombre de workers suit os.cpu_count(): relancer sur la machine cible.
+
+Usage:
+    python -m benchmarks.bench_solver_profiles
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ortools.sat.python import cp_model
+
+from src.constants import SOLVER_PROFILES
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from benchmarks.corpus import build_corpus
+
+TIME_LIMIT = 30.0
+REPEATS = 3
+
+
+def time_to_optimal(profile: str, participants, tournaments):
+    """Temps médian de la PASS 1 (None si l'optimum n'est pas prouvé)"""
+    solver = TournamentSolver(SolverConfig(allow_incomplete=True, solver_profile=profile))
+    times = []
+    
+    for _ in range(REPEATS):
+        model, _, _ = solver._build_model(participants, tournaments)
+        cp_solver = solver._create_pass1_solver(TIME_LIMIT)
+        start = time.perf_counter()
+        status = cp_solver.Solve(model)
+        if status != cp_model.OPTIMAL:
+            return None
+        times.append(time.perf_counter() - start)
+    
+    return statistics.median(times)
+
+
+def run_benchmark():
+    """Lance le benchmark et affiche le profil recommandé"""
+    corpus = build_corpus()
+    results = {profile: [] for profile in SOLVER_PROFILES}
+    
+    print(f"{os.cpu_count()} cœur(s)")
+    print(f"{'Instance':<16}" + "".join(f"{p[:18]:>20}" for p in SOLVER_PROFILES))
+    for name, participants, tournaments in corpus:
+        row = f"{name:<16}"
+        for profile in SOLVER_PROFILES:
+            elapsed = time_to_optimal(profile, participants, tournaments)
+            results[profile].append(elapsed)
+            row += f"{'timeout' if elapsed is None else f'{elapsed:.3f}s':>20}"
+        print(row)
+    
+    complete = {
+        profile: statistics.median(times)
+        for profile, times in results.items()
+        if all(t is not None for t in times)
+    }
+    if not complete:
+        print("\nAucun profil ne prouve l'optimum sur tout le corpus")
+        return None
+    
+    best = min(complete, key=complete.get)
+    print(f"\nProfil recommandé: {best} (médiane {complete[best]:.3f}s)")
+    return best
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,60 @@
+"""
+Corpus de plannings de référence pour les benchmarks
+"""
+import copy
+from typing import List, Tuple
+
+from src.models import Participant, Tournament
+from src.constants import DEFAULT_PARTICIPANTS, PARTICIPANT_COLUMNS, TOURNAMENTS
+
+
+def default_participants() -> List[Participant]:
+    """Participants par défaut de l'application"""
+    return [
+        Participant.from_dict(dict(zip(PARTICIPANT_COLUMNS, row)))
+        for row in DEFAULT_PARTICIPANTS
+    ]
+
+
+def active_tournaments(include_o3: bool) -> List[Tournament]:
+    """Tournois actifs"""
+    return [Tournament(**t) for t in TOURNAMENTS if include_o3 or t['id'] != 'O3']
+
+
+def _doubled(participants: List[Participant]) -> List[Participant]:
+    """Duplique un planning (les couples restent internes à chaque copie)"""
+    doubled = list(participants)
+    for p in participants:
+        p_copy = copy.copy(p)
+        p_copy.nom = f"{p.nom} bis"
+        p_copy.couple = f"{p.couple} bis" if p.couple else None
+        doubled.append(p_copy)
+    return doubled
+
+
+def _with_strict(participants: List[Participant], every: int) -> List[Participant]:
+    """Active Respect_Voeux pour un participant sur `every`"""
+    strict = []
+    for idx, p in enumerate(participants):
+        p_copy = copy.copy(p)
+        p_copy.respect_voeux = idx % every == 0
+        strict.append(p_copy)
+    return strict
+
+
+def build_corpus() -> List[Tuple[str, List[Participant], List[Tournament]]]:
+    """
+    Retourne le corpus de benchmark: liste de (nom, participants, tournois).
+    
+    Instances dérivées des données par défaut (13 participants):
+    avec/sans O3, avec vœux stricts, et roster doublé (26 participants).
+    """
+    default = default_participants()
+    
+    return [
+        ("defaut", default, active_tournaments(False)),
+        ("defaut_o3", default, active_tournaments(True)),
+        ("defaut_strict", _with_strict(default, 4), active_tournaments(False)),
+        ("double", _doubled(default), active_tournaments(False)),
+        ("double_o3", _doubled(default), active_tournaments(True)),
+    ]
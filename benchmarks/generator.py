@@ -0,0 +1,110 @@
+"""
+Générateur de plannings synthétiques pour les benchmarks de montée en charge
+
+Les distributions par défaut reprennent celles de DEFAULT_PARTICIPANTS
+(13 personnes): trois quarts des participants en couple, vœux surtout
+à 1-2 étapes, disponibilités majoritairement jusqu'à l'O3. Même graine,
+même planning.
+"""
+from typing import Dict, List, Optional
+import random
+
+from src.models import Participant
+from src.constants import VALID_TOURNAMENT_IDS
+
+# Part des participants en couple (10 sur 13 dans DEFAULT_PARTICIPANTS)
+COUPLES_RATIO = 0.75
+
+# Part de femmes
+FEMALE_RATIO = 0.5
+
+# Part de participants avec Respect_Voeux
+STRICT_RATIO = 0.0
+
+# Poids des vœux (nombre d'étapes / d'opens souhaités)
+ETAPE_WISH_WEIGHTS = {0: 1, 1: 4, 2: 8}
+OPEN_WISH_WEIGHTS = {0: 4, 1: 6, 2: 3}
+
+# Poids des disponibilités (dernier tournoi possible)
+DISPO_WEIGHTS = {'E2': 1, 'E3': 4, 'O3': 8}
+
+
+def _draw(rng: random.Random, weights: Dict) -> object:
+    """Tirage pondéré d'une clé de weights"""
+    keys = list(weights)
+    return rng.choices(keys, weights=[weights[k] for k in keys])[0]
+
+
+def _partner_dispo(rng: random.Random, dispo: str, weights: Dict) -> str:
+    """
+    Disponibilité du partenaire: au plus un tournoi d'écart (au-delà,
+    validate_participants_data signale une grande différence)
+    """
+    idx = VALID_TOURNAMENT_IDS.index(dispo)
+    close = {
+        d: w for d, w in weights.items()
+        if abs(VALID_TOURNAMENT_IDS.index(d) - idx) <= 1
+    }
+    return _draw(rng, close)
+
+
+def generate_roster(
+    num_participants: int,
+    seed: int = 0,
+    couples_ratio: float = COUPLES_RATIO,
+    female_ratio: float = FEMALE_RATIO,
+    strict_ratio: float = STRICT_RATIO,
+    etape_wish_weights: Optional[Dict[int, int]] = None,
+    open_wish_weights: Optional[Dict[int, int]] = None,
+    dispo_weights: Optional[Dict[str, int]] = None
+) -> List[Participant]:
+    """
+    Génère un planning synthétique valide
+    
+    Args:
+        num_participants: Nombre de participants
+        seed: Graine (même graine et paramètres → même planning)
+        couples_ratio: Part des participants en couple (couples H/F,
+            bornée par le genre minoritaire)
+        female_ratio: Part de femmes
+        strict_ratio: Part de participants avec Respect_Voeux
+        etape_wish_weights: Poids des vœux d'étapes {nombre: poids}
+        open_wish_weights: Poids des vœux d'opens {nombre: poids}
+        dispo_weights: Poids des disponibilités {tournoi: poids}
+    
+    Returns:
+        Liste de participants (noms P001, P002...)
+    """
+    rng = random.Random(seed)
+    etape_wish_weights = etape_wish_weights or ETAPE_WISH_WEIGHTS
+    open_wish_weights = open_wish_weights or OPEN_WISH_WEIGHTS
+    dispo_weights = dispo_weights or DISPO_WEIGHTS
+    
+    num_women = round(num_participants * female_ratio)
+    genres = ['F'] * num_women + ['M'] * (num_participants - num_women)
+    rng.shuffle(genres)
+    
+    participants = []
+    for idx, genre in enumerate(genres):
+        participants.append(Participant(
+            nom=f"P{idx + 1:03d}",
+            genre=genre,
+            couple=None,
+            voeux_etape=_draw(rng, etape_wish_weights),
+            voeux_open=_draw(rng, open_wish_weights),
+            dispo_jusqu_a=_draw(rng, dispo_weights),
+            respect_voeux=rng.random() < strict_ratio
+        ))
+    
+    # Couples H/F bidirectionnels, disponibilités proches
+    women = [p for p in participants if p.genre == 'F']
+    men = [p for p in participants if p.genre == 'M']
+    rng.shuffle(women)
+    rng.shuffle(men)
+    num_couples = min(round(num_participants * couples_ratio / 2), len(women), len(men))
+    for woman, man in zip(women[:num_couples], men[:num_couples]):
+        woman.couple = man.nom
+        man.couple = woman.nom
+        man.dispo_jusqu_a = _partner_dispo(rng, woman.dispo_jusqu_a, dispo_weights)
+    
+    return participants
@@ -0,0 +1,162 @@
+"""
+Calculs en arrière-plan pour l'application Streamlit
+
+Le solve multi-passes tourne dans un thread gardé dans st.session_state:
+les reruns Streamlit (interaction avec un widget) ne l'interrompent plus,
+l'état est relu à chaque rerun et le bouton d'annulation arrête CP-SAT.
+"""
+from typing import List, Dict, Optional, Tuple
+import threading
+import time
+
+from src.models import Participant, Tournament, Solution, SolverConfig
+from src.multipass_solver import MultiPassSolver, MultiPassResult
+from src.variant_counter import solution_profile_key
+
+# Intervalle de rafraîchissement de l'application pendant un calcul
+SOLVE_JOB_POLL_SECONDS = 0.5
+
+# Nombre de variantes partielles affichées pendant le calcul
+SOLVE_JOB_PREVIEW = 5
+
+# Budget de latence de l'aperçu rapide (SolverConfig.latency_budget)
+QUICK_PREVIEW_SECONDS = 2.0
+
+
+class SolveJob:
+    """
+    Résolution multi-passes dans un thread, avec progression, résultats
+    partiels et annulation
+    
+    Utilisation:
+        job = SolveJob(config, participants, tournaments)
+        job.start()
+        ... à chaque rerun: job.running, job.progress, job.partial_solutions()
+        ... (config.latency_budget > 0: plannings provisoires en premier)
+        job.cancel()  # garde les solutions déjà trouvées
+        ... puis job.result (MultiPassResult) ou job.error
+    """
+    
+    def __init__(
+        self,
+        config: SolverConfig,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        previous_info: Optional[Dict] = None
+    ):
+        self.config = config
+        self.participants = participants
+        self.tournaments = tournaments
+        self.previous_info = previous_info
+        
+        self.multipass = MultiPassSolver(config)
+        self.result: Optional[MultiPassResult] = None
+        self.error: Optional[BaseException] = None
+        self.progress: Tuple[str, str] = ("build", "Construction du modèle...")
+        
+        # Mode anytime: plannings provisoires (solve_provisional)
+        self.provisional: List[Solution] = []
+        self.provisional_info: Dict = {}
+        
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._partial: Dict = {}
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = None
+        self._end_time = None
+    
+    def start(self):
+        """Lance le calcul (une seule fois)"""
+        if self._thread is not None:
+            return
+        self._start_time = time.time()
+        self._thread = threading.Thread(target=self._run, name='solve_job', daemon=True)
+        self._thread.start()
+    
+    def cancel(self):
+        """Arrête la recherche en cours; les solutions trouvées sont gardées"""
+        self.multipass.cancel(self._stop)
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._stop.is_set()
+    
+    @property
+    def elapsed(self) -> float:
+        if self._start_time is None:
+            return 0.0
+        return (self._end_time or time.time()) - self._start_time
+    
+    def partial_solutions(self) -> List[Solution]:
+        """
+        Solutions gardées jusqu'ici (meilleure variante par profil), par
+        qualité; à défaut les plannings provisoires du mode anytime
+        """
+        with self._lock:
+            solutions = list(self._partial.values())
+        if not solutions:
+            return list(self.provisional)
+        return sorted(solutions, key=lambda s: -s.get_quality_score())
+    
+    @property
+    def showing_provisional(self) -> bool:
+        """True si partial_solutions() renvoie les plannings provisoires"""
+        return bool(self.provisional) and not self._partial
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Attend la fin du calcul; True si terminé"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.running
+    
+    def _run(self):
+        try:
+            if self.config.latency_budget > 0:
+                self._on_progress("provisional", "Aperçu rapide...")
+                solutions, _, info = self.multipass.base_solver.solve_provisional(
+                    self.participants, self.tournaments, stop_event=self._stop
+                )
+                self.provisional_info = info
+                self.provisional = solutions
+                if self._stop.is_set():
+                    # Annulé pendant l'aperçu: les plannings provisoires sont le résultat
+                    self.result = MultiPassResult(
+                        solutions=list(solutions),
+                        pass_number=1,
+                        relaxed_participants=[],
+                        candidates_if_failed=[],
+                        status='cancelled',
+                        message=(
+                            f"⏹️ Calcul annulé pendant l'aperçu - "
+                            f"{len(solutions)} planning(s) provisoire(s) conservé(s)"
+                        ),
+                        solver_info=info
+                    )
+                    return
+            
+            self.result = self.multipass.solve_multipass(
+                self.participants,
+                self.tournaments,
+                progress_callback=self._on_progress,
+                previous_info=self.previous_info,
+                solution_listener=self._on_solution,
+                stop_event=self._stop
+            )
+        except Exception as error:  # affichée par l'application
+            self.error = error
+        finally:
+            self._end_time = time.time()
+    
+    def _on_progress(self, phase: str, message: str):
+        self.progress = (phase, message)
+    
+    def _on_solution(self, kind: str, solution: Solution) -> bool:
+        # 'profile': remplace la variante précédente du même profil
+        key = solution_profile_key(solution) if kind == 'profile' else len(self._partial)
+        with self._lock:
+            self._partial[key] = solution
+        return not self._stop.is_set()
@@ -0,0 +1,164 @@
+"""
+Oracle par force brute: profils exacts des petites instances
+
+Parcourt les 2^(P×T) affectations x[participant, tournoi] par blocs
+vectorisés (numpy) et vérifie les contraintes du modèle sans passer par
+OR-Tools ni par SolutionMatrix: le résultat ne partage aucun code avec ce
+qu'il vérifie (énumération PASS 2, incrémental, comptage des variantes).
+Réservé aux tests et benchmarks: au-delà de MAX_BRUTE_FORCE_CELLS cases
+libres, l'espace est trop grand.
+"""
+from typing import List, Dict, Optional
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.models import Participant, Tournament
+from src.constants import TEAM_SIZE
+from src.variant_counter import ProfileKey, profile_key
+
+# Cases libres au plus (2^24 ≈ 16 millions d'affectations)
+MAX_BRUTE_FORCE_CELLS = 24
+
+# Affectations vérifiées par bloc
+BRUTE_FORCE_CHUNK = 1 << 16
+
+NUM_DAYS = 9
+
+
+@dataclass
+class BruteForceResult:
+    """Profils exacts d'une instance"""
+    optimal_max_shortage: Optional[int]  # None si aucune affectation admissible
+    profile_counts: Dict[ProfileKey, int] = field(default_factory=dict)  # à l'optimum
+    num_feasible: int = 0  # affectations admissibles, toutes lésions max confondues
+    num_assignments: int = 0  # affectations parcourues (2^cases libres)
+    
+    @property
+    def profiles(self) -> set:
+        return set(self.profile_counts)
+    
+    @property
+    def num_variants(self) -> int:
+        """Variantes à la lésion max optimale (ce qu'énumère la PASS 2)"""
+        return sum(self.profile_counts.values())
+
+
+def brute_force_profiles(
+    participants: List[Participant],
+    tournaments: List[Tournament],
+    allow_incomplete: bool = False
+) -> BruteForceResult:
+    """
+    Énumère toutes les affectations et garde celles de lésion max minimale
+    
+    Les cases fixées à 0 par la disponibilité ou par un vœu nul (étapes ou
+    opens) ne sont pas parcourues: toute affectation qui y joue serait
+    rejetée. Les autres contraintes (vœux jamais dépassés, vœux stricts,
+    couples jamais le même jour, équipes complètes) sont vérifiées bloc
+    par bloc.
+    
+    Args:
+        participants: Liste des participants
+        tournaments: Liste des tournois actifs
+        allow_incomplete: Même sens que SolverConfig.allow_incomplete
+    
+    Returns:
+        BruteForceResult (profils à la lésion max optimale et leurs comptes)
+    
+    Raises:
+        ValueError: Plus de MAX_BRUTE_FORCE_CELLS cases libres
+    """
+    num_tournaments = len(tournaments)
+    order = {t.id: idx for idx, t in enumerate(tournaments)}
+    is_etape = np.array([t.is_etape for t in tournaments], dtype=bool)
+    
+    # Cases libres (participant, tournoi)
+    cells = []
+    for p_idx, participant in enumerate(participants):
+        last = order.get(participant.dispo_jusqu_a, num_tournaments - 1)
+        for t_idx, tournament in enumerate(tournaments[:last + 1]):
+            wished = participant.voeux_etape if tournament.is_etape else participant.voeux_open
+            if wished > 0:
+                cells.append((p_idx, t_idx))
+    if len(cells) > MAX_BRUTE_FORCE_CELLS:
+        raise ValueError(
+            f"{len(cells)} cases libres: force brute limitée à {MAX_BRUTE_FORCE_CELLS}"
+        )
+    
+    num_participants = len(participants)
+    
+    # Incidences case -> participant, (participant, jour), groupe d'équipes
+    plays_etape = np.zeros((len(cells), num_participants), dtype=int)
+    plays_open = np.zeros((len(cells), num_participants), dtype=int)
+    plays_day = np.zeros((len(cells), num_participants * NUM_DAYS), dtype=int)
+    for c, (p_idx, t_idx) in enumerate(cells):
+        (plays_etape if is_etape[t_idx] else plays_open)[c, p_idx] = 1
+        for day in tournaments[t_idx].days:
+            plays_day[c, p_idx * NUM_DAYS + day] = 1
+    
+    groups = {}
+    for c, (p_idx, t_idx) in enumerate(cells):
+        genre = participants[p_idx].genre if is_etape[t_idx] else 'All'
+        groups.setdefault((t_idx, genre), []).append(c)
+    plays_group = np.zeros((len(cells), len(groups)), dtype=int)
+    for g, members in enumerate(groups.values()):
+        plays_group[members, g] = 1
+    
+    wished_etapes = np.array([p.voeux_etape for p in participants])
+    wished_opens = np.array([p.voeux_open for p in participants])
+    wished_days = np.array([p.voeux_jours_total for p in participants])
+    strict = np.array([p.respect_voeux for p in participants], dtype=bool)
+    names = {p.nom: idx for idx, p in enumerate(participants)}
+    couples = [
+        (idx, names[p.couple]) for idx, p in enumerate(participants)
+        if p.couple in names and idx < names[p.couple]
+    ]
+    
+    best = None
+    counts: Counter = Counter()
+    num_feasible = 0
+    num_assignments = 1 << len(cells)
+    shifts = np.arange(len(cells), dtype=np.int64)
+    
+    for start in range(0, num_assignments, BRUTE_FORCE_CHUNK):
+        codes = np.arange(start, min(start + BRUTE_FORCE_CHUNK, num_assignments), dtype=np.int64)
+        x = ((codes[:, None] >> shifts) & 1).astype(int)
+        
+        etapes = x @ plays_etape
+        opens = x @ plays_open
+        ok = (etapes <= wished_etapes).all(axis=1) & (opens <= wished_opens).all(axis=1)
+        ok &= ~(strict & ((etapes != wished_etapes) | (opens != wished_opens))).any(axis=1)
+        
+        days = (x @ plays_day).reshape(len(x), num_participants, NUM_DAYS) > 0
+        for a, b in couples:
+            ok &= ~(days[:, a] & days[:, b]).any(axis=1)
+        
+        if not allow_incomplete:
+            ok &= ((x @ plays_group) % TEAM_SIZE == 0).all(axis=1)
+        
+        if not ok.any():
+            continue
+        shortages = np.maximum(0, wished_days - days[ok].sum(axis=2))
+        num_feasible += len(shortages)
+        
+        max_shortage = shortages.max(axis=1) if num_participants else np.zeros(len(shortages), dtype=int)
+        chunk_best = int(max_shortage.min())
+        if best is not None and chunk_best > best:
+            continue
+        if best is None or chunk_best < best:
+            best = chunk_best
+            counts = Counter()
+        
+        rows, row_counts = np.unique(shortages[max_shortage == best], axis=0, return_counts=True)
+        for row, count in zip(rows, row_counts):
+            key = profile_key({p.nom: int(shortage) for p, shortage in zip(participants, row)})
+            counts[key] += int(count)
+    
+    return BruteForceResult(
+        optimal_max_shortage=best,
+        profile_counts=dict(counts),
+        num_feasible=num_feasible,
+        num_assignments=num_assignments
+    )
@@ -13,6 +13,57 @@ MAX_SOLUTIONS_TO_DISPLAY = 10
 # Timeout du solver (en secondes)
 SOLVER_TIMEOUT = 120.0
 
+# Stratégies de recherche PASS 1 (ordre de branchement sur les variables x)
+SEARCH_STRATEGIES = {
+    'default': "Ordre libre du solver",
+    'couples_strict_first': "Couples et vœux stricts d'abord",
+    'largest_wishes_first': "Plus gros vœux d'abord",
+    'etapes_first': "Étapes avant opens",
+    'portfolio': "Portfolio (couples/stricts d'abord + stratégies du solver)",
+}
+
+# Profils de paramètres CP-SAT des résolutions d'optimisation (config.solver_profile)
+# max_workers: plafond, le nombre de workers suit os.cpu_count()
+# Comparer avec: python -m benchmarks.bench_solver_profiles
+SOLVER_PROFILES = {
+    'default': {
+        'description': "Historique (8 workers, sans LP, probing 2)",
+        'max_workers': 8,
+        'linearization_level': 0,
+        'cp_model_probing_level': 2,
+        'optimize_with_core': True,
+    },
+    'fast_interactive': {
+        'description': "Réponse rapide (presolve léger)",
+        'max_workers': 8,
+        'linearization_level': 0,
+        'cp_model_probing_level': 0,
+        'optimize_with_core': True,
+    },
+    'exhaustive': {
+        'description': "Preuve d'optimalité (tous les cœurs, LP)",
+        'max_workers': 16,
+        'linearization_level': 1,
+        'cp_model_probing_level': 2,
+        'optimize_with_core': True,
+    },
+    'large_roster': {
+        'description': "Grands groupes (tous les cœurs, presolve léger)",
+        'max_workers': 16,
+        'linearization_level': 0,
+        'cp_model_probing_level': 0,
+        'optimize_with_core': True,
+    },
+}
+
+# Critères du front de Pareto (tous minimisés, ordre = priorité)
+PARETO_CRITERIA = {
+    'max_shortage': "Lésion max (j)",
+    'total_shortage': "Total lésé (j)",
+    'fatigue': "Fatigue",
+    'incomplete': "Équipes incomplètes",
+}
+
 # Poids pour la fonction objectif multi-critères
 WEIGHT_RESPECT_WISHES = 1000  # Priorité maximale : respecter les vœux
 WEIGHT_AVOID_FATIGUE = 500    # Priorité haute : éviter >3j consécutifs
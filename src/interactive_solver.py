@@ -0,0 +1,183 @@
+"""
+Solver interactif: re-résolutions rapides après une édition (vœux stricts, forçages)
+"""
+from typing import List, Dict, Tuple, Optional
+from dataclasses import replace
+import time
+
+from ortools.sat.python import cp_model
+
+from src.models import Participant, Tournament, Solution, SolverConfig
+from src.solver import TournamentSolver
+
+
+class InteractiveSolver:
+    """
+    Modèle PASS 1 compilé une fois, piloté par des hypothèses (assumptions)
+    
+    Le modèle est construit avec les vœux NON stricts (sur-ensemble), puis
+    porte des littéraux activables sans reconstruction:
+    - strict_{nom}: étapes et opens joués == vœux (Respect_Voeux)
+    - pin_{nom}_{tournoi}: le participant joue ce tournoi
+    - ban_{nom}_{tournoi}: le participant ne joue pas ce tournoi
+    
+    Une édition ne change que la liste d'hypothèses; la solution précédente
+    sert de hint. Si l'édition rend le problème impossible, les hypothèses
+    responsables sont renvoyées (noyau d'infaisabilité). Un changement de
+    poids ne remplace que l'objectif (set_weights).
+    """
+    
+    def __init__(
+        self,
+        config: SolverConfig,
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ):
+        self.config = config
+        self.base_solver = TournamentSolver(config)
+        self.participants = participants
+        self.tournaments = tournaments
+        
+        # État éditable: vœux stricts et forçages {(nom, tournoi): joue}
+        self.strict = {p.nom: p.respect_voeux for p in participants}
+        self.pins: Dict[Tuple[str, str], bool] = {}
+        
+        relaxed = [replace(p, respect_voeux=False) for p in participants]
+        self.model, self.x, self.auxiliary_vars = self.base_solver._build_model(
+            relaxed, tournaments
+        )
+        self._relaxed = relaxed
+        self._add_assumption_literals()
+        self._last_assignment: Optional[Tuple[int, ...]] = None
+    
+    def _add_assumption_literals(self):
+        """Crée les littéraux d'hypothèse (vœux stricts, forçages, interdictions)"""
+        self.strict_literals = {}
+        self.pin_literals = {}
+        self.ban_literals = {}
+        
+        for participant in self.participants:
+            etapes_played = sum(
+                self.x[(participant.nom, t.id)] for t in self.tournaments if t.is_etape
+            )
+            opens_played = sum(
+                self.x[(participant.nom, t.id)] for t in self.tournaments if t.is_open
+            )
+            strict = self.model.NewBoolVar(f"strict_{participant.nom}")
+            self.model.Add(etapes_played == participant.voeux_etape).OnlyEnforceIf(strict)
+            self.model.Add(opens_played == participant.voeux_open).OnlyEnforceIf(strict)
+            self.strict_literals[participant.nom] = strict
+            
+            for tournament in self.tournaments:
+                key = (participant.nom, tournament.id)
+                pin = self.model.NewBoolVar(f"pin_{participant.nom}_{tournament.id}")
+                ban = self.model.NewBoolVar(f"ban_{participant.nom}_{tournament.id}")
+                self.model.AddImplication(pin, self.x[key])
+                self.model.AddImplication(ban, self.x[key].Not())
+                self.pin_literals[key] = pin
+                self.ban_literals[key] = ban
+    
+    def set_strict(self, name: str, strict: bool):
+        """Active/désactive le respect strict des vœux d'un participant"""
+        if name not in self.strict:
+            raise ValueError(f"Participant inconnu: {name}")
+        self.strict[name] = strict
+    
+    def pin(self, name: str, tournament_id: str, plays: bool = True):
+        """Force (plays=True) ou interdit (plays=False) un tournoi à un participant"""
+        if (name, tournament_id) not in self.x:
+            raise ValueError(f"Participant ou tournoi inconnu: {name}, {tournament_id}")
+        self.pins[(name, tournament_id)] = plays
+    
+    def unpin(self, name: str, tournament_id: str):
+        """Retire le forçage ou l'interdiction d'un tournoi"""
+        self.pins.pop((name, tournament_id), None)
+    
+    def set_weights(self, **weights: int):
+        """
+        Change les poids de l'objectif (weight_wishes, weight_fatigue,
+        weight_incomplete) sans reconstruire le modèle: nouveau Minimize sur
+        les mêmes variables, la solution précédente reste le hint.
+        """
+        unknown = set(weights) - {'weight_wishes', 'weight_fatigue', 'weight_incomplete'}
+        if unknown:
+            raise ValueError(f"Poids inconnu(s): {', '.join(sorted(unknown))}")
+        self.config = replace(self.config, **weights)
+        self.base_solver = TournamentSolver(self.config)
+        objective = self.base_solver._objective_expression(
+            self._relaxed,
+            self.auxiliary_vars["wish_deviations"],
+            self.auxiliary_vars["fatigue_penalties"],
+            self.auxiliary_vars["incomplete_penalties"],
+            self.auxiliary_vars
+        )
+        self.model.Minimize(objective)
+    
+    def _assumptions(self) -> List[Tuple[cp_model.IntVar, str]]:
+        """Hypothèses actives: (littéral, libellé lisible)"""
+        assumptions = [
+            (self.strict_literals[name], f"Vœux stricts de {name}")
+            for name, strict in self.strict.items() if strict
+        ]
+        for (name, tournament_id), plays in self.pins.items():
+            if plays:
+                literal = self.pin_literals[(name, tournament_id)]
+                assumptions.append((literal, f"{name} joue {tournament_id}"))
+            else:
+                literal = self.ban_literals[(name, tournament_id)]
+                assumptions.append((literal, f"{name} ne joue pas {tournament_id}"))
+        return assumptions
+    
+    def solve(self, time_limit: float = 10.0) -> Tuple[Optional[Solution], str, Dict]:
+        """
+        Re-résout avec les hypothèses courantes (sans reconstruire le modèle)
+        
+        Args:
+            time_limit: Temps max de résolution (secondes)
+        
+        Returns:
+            Tuple (solution optimale ou None, status, info)
+            info['conflicts']: libellés des hypothèses incompatibles si INFEASIBLE
+        """
+        start_time = time.time()
+        assumptions = self._assumptions()
+        
+        self.model.ClearAssumptions()
+        self.model.AddAssumptions([literal for literal, _ in assumptions])
+        self.model.ClearHints()
+        if self._last_assignment is not None:
+            for var, value in zip(self.x.values(), self._last_assignment):
+                self.model.AddHint(var, value)
+        
+        solver = self.base_solver._create_pass1_solver(time_limit)
+        status = solver.Solve(self.model)
+        status_name = solver.StatusName(status)
+        
+        info = {
+            'status': status_name,
+            'elapsed_time': time.time() - start_time,
+            'num_assumptions': len(assumptions),
+            'conflicts': []
+        }
+        
+        if status == cp_model.INFEASIBLE:
+            labels = {literal.Index(): label for literal, label in assumptions}
+            info['conflicts'] = [
+                labels[index]
+                for index in solver.SufficientAssumptionsForInfeasibility()
+                if index in labels
+            ]
+            return None, status_name, info
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return None, status_name, info
+        
+        self._last_assignment = tuple(solver.Value(var) for var in self.x.values())
+        info['objective'] = int(solver.ObjectiveValue())
+        info['max_shortage'] = int(solver.Value(self.auxiliary_vars["max_shortage"]))
+        
+        # La solution porte les vœux stricts courants (stats et affichage)
+        participants = [replace(p, respect_voeux=self.strict[p.nom]) for p in self.participants]
+        solution = self.base_solver._solution_from_assignment(
+            self._last_assignment, self.x, participants, self.tournaments
+        )
+        return solution, status_name, info
@@ -271,6 +271,69 @@ class SolverConfig:
     timeout_seconds: float = 120.0
     search_mode: str = 'unique_profiles'  # 'unique_profiles' ou 'all'
     min_quality_score: int = 0  # Score minimum pour filtrer les profils
+    # Compiler min_quality_score en contrainte du modèle PASS 2
+    # (les profils sous le seuil ne sont jamais générés)
+    score_filter_in_solver: bool = False
+    
+    # Encodage de la fatigue dans le modèle OR-Tools:
+    # - 'window': 1 booléen par fenêtre de 4 jours joués (historique)
+    # - 'run_length': série consécutive max exacte par participant
+    fatigue_encoding: str = 'window'
+    
+    # Formulation du modèle OR-Tools:
+    # - 'x_vars': contraintes sur x[participant, tournoi] + variables intermédiaires
+    # - 'schedule_table': 1 programme admissible précalculé par participant
+    formulation: str = 'x_vars'
+    
+    # Stratégie de branchement PASS 1 (voir constants.SEARCH_STRATEGIES)
+    # Défaut choisi par benchmarks/bench_search_strategy.py (temps cumulé
+    # jusqu'à l'optimum prouvé sur le corpus): portfolio 2.2s, défaut
+    # historique ('default') 18.1s, dont 'double' 1.3s contre 8.8s
+    search_strategy: str = 'portfolio'
+    
+    # Ordre d'énumération PASS 2:
+    # - 'arbitrary': ordre de SearchForAllSolutions (historique)
+    # - 'quality': meilleurs scores qualité d'abord (bandes de pénalité)
+    # - 'diverse': max_solutions variantes deux à deux les plus éloignées
+    #   (distance de Hamming sur les x), une petite résolution par variante
+    enumeration_order: str = 'arbitrary'
+    
+    # Bande d'énumération PASS 2 autour de l'optimum PASS 1:
+    # - 'max_shortage': même lésion max, tout le reste libre (historique)
+    # - 'objective': objectif pondéré à band_epsilon près de l'optimum
+    # - 'total_shortage': total jours lésés à band_total_shortage jours près
+    enumeration_band: str = 'max_shortage'
+    band_epsilon: int = 1000  # Unités de l'objectif (1000 = 1 jour lésé)
+    band_total_shortage: int = 1  # Jours
+    
+    # Comptes exacts de variantes par profil trouvé (info['variant_counts'])
+    count_variants: bool = False
+    
+    # Garder les x de toutes les solutions PASS 2 rencontrées
+    # (info['enumeration'], point de départ de solve_incremental)
+    keep_enumeration: bool = False
+    
+    # Mode anytime: budget de latence (s) des plannings provisoires montrés
+    # avant la fin du calcul complet (solve_provisional), 0 = désactivé
+    latency_budget: float = 0.0
+    
+    # Reproductibilité: graine CP-SAT (None = graine par défaut du solver) et
+    # mode déterministe (un seul worker, limites aussi en temps déterministe,
+    # ordre des solutions stable): mêmes entrées -> mêmes sorties
+    random_seed: Optional[int] = None
+    deterministic: bool = False
+    
+    # Profil de paramètres CP-SAT (voir SOLVER_PROFILES)
+    solver_profile: str = 'default'
+    
+    # Trace Chrome (chrome://tracing, Perfetto) des spans du calcul
+    # (info['timings']) écrite dans ce fichier; None = pas de fichier
+    timing_trace_path: Optional[str] = None
+    
+    # Profileur par échantillonnage (src/profiler.py): piles repliées par
+    # phase écrites dans ce dossier, un fichier par calcul; None = variable
+    # d'environnement ESTIVALES_PROFILE_DIR, sinon pas de profilage
+    profile_dir: Optional[str] = None
     
     # Poids pour l'objectif multi-critères
     weight_wishes: int = 1000
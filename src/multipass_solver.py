@@ -1,12 +1,14 @@
 """
 Solver multi-passes avec assistant de résolution de conflits
 """
-from typing import List, Dict, Tuple, Optional, Set
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Set, Callable
+from dataclasses import dataclass, field
 import copy
+import threading
 
 from src.models import Participant, Tournament, Solution, SolverConfig
 from src.solver import TournamentSolver, analyze_solutions
+from src.time_budget import TimeBudget
 
 
 @dataclass
@@ -28,8 +30,9 @@ class MultiPassResult:
     pass_number: int  # 1=strict, 2=relaxed, 3=forced_relaxation
     relaxed_participants: List[str]
     candidates_if_failed: List[RelaxationCandidate]
-    status: str  # 'success', 'need_user_choice', 'impossible'
+    status: str  # 'success', 'need_user_choice', 'impossible', 'cancelled'
     message: str
+    solver_info: Dict = field(default_factory=dict)  # info du solve PASS 1 (bande, statut...)
 
 
 class MultiPassSolver:
@@ -45,12 +48,49 @@ class MultiPassSolver:
     def __init__(self, config: SolverConfig):
         self.config = config
         self.base_solver = TournamentSolver(config)
+        # Solver en cours (solve strict ou sonde de relaxation), pour cancel()
+        self._active_solver = self.base_solver
+    
+    def cancel(self, stop_event: threading.Event):
+        """Annule un solve_multipass(stop_event=...) en cours, quelle que soit la passe"""
+        self._active_solver.stop(stop_event)
+    
+    def _solve(
+        self,
+        solver: TournamentSolver,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        stop_event: Optional[threading.Event] = None,
+        budget: Optional[TimeBudget] = None
+    ) -> Tuple[List[Solution], str, Dict]:
+        """Solve d'une sonde ou d'une relaxation, annulable par cancel()"""
+        self._active_solver = solver
+        try:
+            return solver.solve(participants, tournaments, stop_event=stop_event, budget=budget)
+        finally:
+            self._active_solver = self.base_solver
+    
+    def _cancelled_result(self, solutions: List[Solution], pass_number: int, info: Dict) -> MultiPassResult:
+        """Résultat d'un calcul annulé: les solutions déjà trouvées sont gardées"""
+        return MultiPassResult(
+            solutions=solutions,
+            pass_number=pass_number,
+            relaxed_participants=[],
+            candidates_if_failed=[],
+            status='cancelled',
+            message=f"⏹️ Calcul annulé - {len(solutions)} solution(s) déjà trouvée(s) conservée(s)",
+            solver_info=info
+        )
     
     def solve_multipass(
         self,
         participants: List[Participant],
         tournaments: List[Tournament],
-        progress_callback=None
+        progress_callback=None,
+        previous_info: Optional[Dict] = None,
+        solution_listener: Optional[Callable[[str, Solution], bool]] = None,
+        stop_event: Optional[threading.Event] = None,
+        budget: Optional[TimeBudget] = None
     ) -> MultiPassResult:
         """
         Résout en plusieurs passes
@@ -59,20 +99,86 @@ class MultiPassSolver:
             participants: Liste des participants
             tournaments: Liste des tournois
             progress_callback: Callback pour la progression
+            previous_info: Info d'une résolution précédente (keep_enumeration)
+                pour re-résoudre incrémentalement après une édition du roster
+            solution_listener: Notifié des solutions du solve strict au fil de
+                l'énumération (voir TournamentSolver.solve)
+            stop_event: Annulation (voir cancel()): résultat 'cancelled' avec
+                les solutions déjà trouvées
+            budget: Échéance globale, timeout_seconds par défaut: partagée par
+                le solve strict, les sondes et les relaxations
             
         Returns:
-            MultiPassResult avec solutions ou candidats à relaxer
+            MultiPassResult avec solutions ou candidats à relaxer;
+            solver_info['timings'] liste les spans de tout le calcul
         """
+        # Un calcul autonome (sans budget reçu) écrit sa trace Chrome et son profil
+        write_trace = budget is None
+        budget = budget or self.base_solver.new_budget()
+        
+        with budget.timer.span('multipass', 'multipass'):
+            result = self._solve_passes(
+                participants, tournaments, progress_callback, previous_info,
+                solution_listener, stop_event, budget
+            )
         
+        result.solver_info['timings'] = budget.timer.spans
+        result.solver_info['timing_summary'] = budget.timer.summary()
+        if write_trace:
+            budget.timer.write_chrome_trace(self.config.timing_trace_path)
+            profile_path = budget.timer.write_profile('multipass')
+            if profile_path:
+                result.solver_info['profile_path'] = profile_path
+        return result
+    
+    def _solve_passes(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        progress_callback,
+        previous_info: Optional[Dict],
+        solution_listener: Optional[Callable[[str, Solution], bool]],
+        stop_event: Optional[threading.Event],
+        budget: TimeBudget
+    ) -> MultiPassResult:
+        """Passes de solve_multipass (strict, sondes, relaxations automatiques)"""
         # === PASS 1: Essayer strict ===
         if progress_callback:
             progress_callback("pass1", "Recherche solutions parfaites...")
         
-        solutions, status, info = self.base_solver.solve(
-            participants,
-            tournaments,
-            progress_callback=None  # Pas de callback interne pour l'instant
-        )
+        if previous_info and previous_info.get('enumeration') is not None:
+            solutions, status, info = self.base_solver.solve_incremental(
+                participants,
+                tournaments,
+                previous_info,
+                budget=budget
+            )
+        else:
+            solutions, status, info = self.base_solver.solve(
+                participants,
+                tournaments,
+                progress_callback=None,  # Pas de callback interne pour l'instant
+                solution_listener=solution_listener,
+                stop_event=stop_event,
+                budget=budget
+            )
+        
+        if stop_event is not None and stop_event.is_set():
+            return self._cancelled_result(solutions, 1, info)
+        
+        if info.get('score_threshold_infeasible'):
+            # Le seuil de score compilé dans le solver exclut tout l'espace:
+            # relaxer des vœux ne ferait que baisser les scores
+            return MultiPassResult(
+                solutions=[],
+                pass_number=1,
+                relaxed_participants=[],
+                candidates_if_failed=[],
+                status='partial_success',
+                message=f"⚠️ Aucune solution n'atteint le score minimum "
+                        f"{self.config.min_quality_score}/100 - baissez le seuil",
+                solver_info=info
+            )
         
         if solutions and len(solutions) > 0:
             # Vérifier combien sont parfaites
@@ -85,7 +191,8 @@ class MultiPassSolver:
                     relaxed_participants=[],
                     candidates_if_failed=[],
                     status='success',
-                    message=f"✅ {len(perfect)} solution(s) parfaite(s) trouvée(s) (tous les vœux respectés)"
+                    message=f"✅ {len(perfect)} solution(s) parfaite(s) trouvée(s) (tous les vœux respectés)",
+                    solver_info=info
                 )
         
         # === PASS 2: Identifier les candidats à léser ===
@@ -94,9 +201,14 @@ class MultiPassSolver:
         
         candidates = self._identify_relaxation_candidates(
             participants,
-            tournaments
+            tournaments,
+            stop_event,
+            budget
         )
         
+        if stop_event is not None and stop_event.is_set():
+            return self._cancelled_result(solutions, 2, info)
+        
         if not candidates:
             return MultiPassResult(
                 solutions=solutions if solutions else [],
@@ -105,7 +217,8 @@ class MultiPassSolver:
                 candidates_if_failed=[],
                 status='impossible' if not solutions else 'partial_success',
                 message="❌ Impossible de trouver une solution même en relaxant les contraintes" if not solutions 
-                        else f"⚠️ {len(solutions)} solutions trouvées mais avec des vœux non respectés"
+                        else f"⚠️ {len(solutions)} solutions trouvées mais avec des vœux non respectés",
+                solver_info=info
             )
         
         # === PASS 3: Tester automatiquement les candidats ===
@@ -122,7 +235,9 @@ class MultiPassSolver:
                 participants,
                 tournaments,
                 [candidate],  # Passer le RelaxationCandidate complet
-                progress_callback
+                progress_callback,
+                stop_event,
+                budget
             )
             
             if result.solutions:
@@ -131,6 +246,11 @@ class MultiPassSolver:
                 # Ne pas tester tous si on a déjà assez de solutions
                 if len(all_solutions) >= self.config.max_solutions:
                     break
+            
+            if stop_event is not None and stop_event.is_set():
+                return self._cancelled_result(all_solutions or solutions, 3, info)
+            if budget.expired:
+                break
         
         if all_solutions:
             # Dédupliquer les solutions (au cas où)
@@ -159,7 +279,8 @@ class MultiPassSolver:
             relaxed_participants=[],
             candidates_if_failed=candidates,
             status='need_user_choice',
-            message=f"💡 Aucune solution automatique - {len(candidates)} participant(s) peuvent être lésés manuellement"
+            message=f"💡 Aucune solution automatique - {len(candidates)} participant(s) peuvent être lésés manuellement",
+            solver_info=info
         )
     
     def solve_with_relaxation(
@@ -167,7 +288,9 @@ class MultiPassSolver:
         participants: List[Participant],
         tournaments: List[Tournament],
         relax_candidates: List,  # List[RelaxationCandidate] ou List[str] pour rétrocompat
-        progress_callback=None
+        progress_callback=None,
+        stop_event: Optional[threading.Event] = None,
+        budget: Optional[TimeBudget] = None
     ) -> MultiPassResult:
         """
         Résout en relaxant les contraintes des participants sélectionnés
@@ -180,6 +303,8 @@ class MultiPassSolver:
             tournaments: Liste des tournois
             relax_candidates: Liste de RelaxationCandidate OU noms (str) pour compatibilité
             progress_callback: Callback pour progression
+            stop_event: Annulation (voir cancel())
+            budget: Échéance partagée (timeout_seconds par défaut)
             
         Returns:
             MultiPassResult avec solutions
@@ -223,11 +348,19 @@ class MultiPassSolver:
             modified_participants.append(p_copy)
         
         # Résoudre avec relaxation
-        solutions, status, info = self.base_solver.solve(
-            modified_participants,
-            tournaments,
-            progress_callback=None
-        )
+        # Le score des vœux modifiés n'est pas celui des vœux originaux:
+        # pas de seuil de score dans le solver ici (filtrage après recalcul)
+        relax_config = copy.copy(self.config)
+        relax_config.score_filter_in_solver = False
+        budget = budget or self.base_solver.new_budget()
+        with budget.timer.span('relaxation', 'multipass', relaxed=relax_names):
+            solutions, status, info = self._solve(
+                TournamentSolver(relax_config),
+                modified_participants,
+                tournaments,
+                stop_event,
+                budget
+            )
         
         # RECALCULER TOUTES les stats avec les participants ORIGINAUX
         if solutions:
@@ -281,7 +414,9 @@ class MultiPassSolver:
     def _identify_relaxation_candidates(
         self,
         participants: List[Participant],
-        tournaments: List[Tournament]
+        tournaments: List[Tournament],
+        stop_event: Optional[threading.Event] = None,
+        budget: Optional[TimeBudget] = None
     ) -> List[RelaxationCandidate]:
         """
         Identifie les participants qu'on peut léser pour débloquer
@@ -305,8 +440,19 @@ class MultiPassSolver:
             if not p.respect_voeux and (p.voeux_etape > 0 or p.voeux_open > 0)
         ]
         
+        # Sondes restantes (une par option): chacune a sa part de l'échéance
+        budget = budget or self.base_solver.new_budget()
+        probes_left = sum(
+            (c.voeux_open > 0) + (c.voeux_etape > 0) for c in candidates_to_test
+        )
+        
         # Pour chaque candidat, tester les DEUX possibilités
         for candidate in candidates_to_test:
+            if stop_event is not None and stop_event.is_set():
+                break
+            if budget.expired:
+                break
+            
             # Option 1: Réduire 1 OPEN (si possible) - IMPACT: 1 jour
             if candidate.voeux_open > 0:
                 modified_participants = []
@@ -317,12 +463,18 @@ class MultiPassSolver:
                     modified_participants.append(p_copy)
                 
                 # Tester rapidement
+                probe_budget = budget.child(budget.probe(probes_left))
+                probes_left -= 1
                 test_config = copy.copy(self.config)
                 test_config.max_solutions = 1
-                test_config.timeout_seconds = 5.0
+                test_config.timeout_seconds = probe_budget.remaining()
+                test_config.score_filter_in_solver = False  # Test de faisabilité seulement
                 
                 test_solver = TournamentSolver(test_config)
-                solutions, status, info = test_solver.solve(modified_participants, tournaments)
+                with budget.timer.span('probe', 'multipass', participant=candidate.nom, option='open'):
+                    solutions, status, info = self._solve(
+                        test_solver, modified_participants, tournaments, stop_event, probe_budget
+                    )
                 
                 if solutions and len(solutions) > 0:
                     candidates.append(RelaxationCandidate(
@@ -345,12 +497,18 @@ class MultiPassSolver:
                     modified_participants.append(p_copy)
                 
                 # Tester rapidement
+                probe_budget = budget.child(budget.probe(probes_left))
+                probes_left -= 1
                 test_config = copy.copy(self.config)
                 test_config.max_solutions = 1
-                test_config.timeout_seconds = 5.0
+                test_config.timeout_seconds = probe_budget.remaining()
+                test_config.score_filter_in_solver = False  # Test de faisabilité seulement
                 
                 test_solver = TournamentSolver(test_config)
-                solutions, status, info = test_solver.solve(modified_participants, tournaments)
+                with budget.timer.span('probe', 'multipass', participant=candidate.nom, option='etape'):
+                    solutions, status, info = self._solve(
+                        test_solver, modified_participants, tournaments, stop_event, probe_budget
+                    )
                 
                 if solutions and len(solutions) > 0:
                     candidates.append(RelaxationCandidate(
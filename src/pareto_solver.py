@@ -0,0 +1,198 @@
+"""
+Solver Pareto: front non dominé des critères de planification
+"""
+from typing import List, Dict, Tuple
+from dataclasses import dataclass
+import time
+
+from ortools.sat.python import cp_model
+
+from src.models import Participant, Tournament, Solution, SolverConfig
+from src.solver import TournamentSolver
+from src.constants import PARETO_CRITERIA
+
+
+@dataclass
+class ParetoPoint:
+    """Point du front de Pareto (tous les critères sont minimisés)"""
+    max_shortage: int
+    total_shortage: int
+    fatigue: int
+    incomplete: int
+    solution: Solution
+    
+    @property
+    def criteria(self) -> Tuple[int, ...]:
+        """Valeurs des critères dans l'ordre de PARETO_CRITERIA"""
+        return tuple(getattr(self, name) for name in PARETO_CRITERIA)
+    
+    def dominates(self, other: 'ParetoPoint') -> bool:
+        """True si ce point est au moins aussi bon partout et meilleur quelque part"""
+        return all(a <= b for a, b in zip(self.criteria, other.criteria)) and \
+            self.criteria != other.criteria
+    
+    def to_dict(self) -> dict:
+        """Ligne d'affichage (libellés de PARETO_CRITERIA + score qualité)"""
+        row = {label: getattr(self, name) for name, label in PARETO_CRITERIA.items()}
+        row['Score'] = self.solution.get_quality_score()
+        return row
+
+
+class ParetoSolver:
+    """
+    Calcule le front de Pareto sur (max_shortage, total_shortage, fatigue, incomplete)
+    
+    Balayage par contraintes de non-dominance (ε-contraintes):
+    1. Résoudre le modèle PASS 1 avec une scalarisation lexicographique EXACTE
+       (poids dérivés des bornes des critères, pas de facteurs magiques)
+    2. Le point trouvé est Pareto-optimal: l'ajouter au front
+    3. Interdire la zone qu'il domine: pour chaque point f du front,
+       au moins un critère strictement meilleur que f (disjonction)
+    4. Recommencer avec la solution précédente en hint, jusqu'à INFEASIBLE
+    
+    Chaque résolution produit un nouveau point: |front| + 1 appels au solver,
+    contre des milliers de variantes pondérées énumérées en PASS 2.
+    """
+    
+    def __init__(self, config: SolverConfig):
+        self.config = config
+        self.base_solver = TournamentSolver(config)
+    
+    def solve_front(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        progress_callback=None
+    ) -> Tuple[List[ParetoPoint], str, Dict]:
+        """
+        Calcule le front de Pareto (au plus config.max_solutions points)
+        
+        Args:
+            participants: Liste des participants
+            tournaments: Liste des tournois actifs
+            progress_callback: Fonction appelée à chaque point (current, total, time)
+        
+        Returns:
+            Tuple (points triés lexicographiquement, status, info)
+            status = 'OPTIMAL' si le front est complet
+        """
+        start_time = time.time()
+        deadline = start_time + self.config.timeout_seconds
+        
+        model, x, auxiliary_vars = self.base_solver._build_model(participants, tournaments)
+        criteria_terms = self._criteria_terms(auxiliary_vars)
+        criteria = [sum(terms) for terms in criteria_terms]
+        model.Minimize(self._lexicographic_objective(model, criteria_terms))
+        
+        points = []
+        num_solves = 0
+        complete = False
+        proven = True  # Tous les points prouvés optimaux (donc Pareto-optimaux)
+        
+        while not self.config.max_solutions or len(points) < self.config.max_solutions:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            
+            solver = self.base_solver._create_pass1_solver(remaining)
+            status = solver.Solve(model)
+            num_solves += 1
+            
+            if status == cp_model.INFEASIBLE:
+                complete = True
+                break
+            if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                break
+            proven = proven and status == cp_model.OPTIMAL
+            
+            values = [int(solver.Value(expr)) for expr in criteria]
+            points.append(ParetoPoint(
+                *values,
+                solution=self._extract_solution(solver, x, participants, tournaments)
+            ))
+            
+            if progress_callback:
+                progress_callback(len(points), self.config.max_solutions, time.time() - start_time)
+            
+            # Non-dominance: au moins un critère strictement meilleur que ce point
+            improvements = []
+            for name, expr, value in zip(PARETO_CRITERIA, criteria, values):
+                better = model.NewBoolVar(f"pareto_{len(points)}_{name}")
+                model.Add(expr <= value - 1).OnlyEnforceIf(better)
+                improvements.append(better)
+            model.AddBoolOr(improvements)
+            
+            # Démarrage à chaud: la solution précédente guide la suivante
+            model.ClearHints()
+            for var in x.values():
+                model.AddHint(var, solver.Value(var))
+        
+        if not proven:
+            # Un point non prouvé optimal peut être dominé par un point suivant
+            points = [p for p in points if not any(q.dominates(p) for q in points)]
+        points.sort(key=lambda p: p.criteria)
+        
+        info = {
+            'status': 'OPTIMAL' if complete and proven else 'FEASIBLE' if points else 'UNKNOWN',
+            'num_points': len(points),
+            'num_solves': num_solves,
+            'front_complete': complete and proven,
+            'elapsed_time': time.time() - start_time
+        }
+        return points, info['status'], info
+    
+    def _criteria_terms(self, auxiliary_vars: Dict) -> List[List[cp_model.IntVar]]:
+        """Variables sommées par critère (ordre de PARETO_CRITERIA), modèle PASS 1"""
+        return [
+            [auxiliary_vars["max_shortage"]],
+            list(auxiliary_vars["wish_deviations"]),
+            list(auxiliary_vars["fatigue_penalties"]),
+            list(auxiliary_vars["incomplete_penalties"]),
+        ]
+    
+    def _lexicographic_objective(
+        self,
+        model: cp_model.CpModel,
+        criteria_terms: List[List[cp_model.IntVar]]
+    ):
+        """
+        Somme pondérée équivalente à l'ordre lexicographique des critères.
+        
+        Le poids d'un critère dépasse la valeur max de tous les critères
+        suivants réunis: un point de moins sur un critère prioritaire
+        l'emporte toujours.
+        """
+        variables = model.Proto().variables
+        objective = 0
+        weight = 1
+        for terms in reversed(criteria_terms):
+            objective += weight * sum(terms)
+            upper_bound = sum(max(variables[var.Index()].domain) for var in terms)
+            weight *= upper_bound + 1
+        return objective
+    
+    def _extract_solution(
+        self,
+        solver: cp_model.CpSolver,
+        x: Dict,
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ) -> Solution:
+        """Construit la Solution correspondant aux valeurs de x"""
+        assignments = {}
+        for tournament in tournaments:
+            assignments[tournament.id] = {'M': [], 'F': [], 'All': []}
+            for participant in participants:
+                if solver.Value(x[(participant.nom, tournament.id)]):
+                    if tournament.is_etape:
+                        assignments[tournament.id][participant.genre].append(participant.nom)
+                    else:  # open
+                        assignments[tournament.id]['All'].append(participant.nom)
+        
+        solution = Solution(
+            assignments=assignments,
+            participants=participants,
+            tournaments=tournaments
+        )
+        solution.calculate_stats()
+        return solution
@@ -0,0 +1,164 @@
+"""
+Profileur par échantillonnage, opt-in, découpé par phase
+
+Activé par SolverConfig.profile_dir ou la variable d'environnement
+ESTIVALES_PROFILE_DIR: les spans du PhaseTimer (construction, passes,
+collecteur, sondes) deviennent des phases, et les piles Python des threads
+dans une phase sont échantillonnées toutes les PROFILE_INTERVAL secondes.
+Chaque calcul écrit un fichier de piles repliées (format "collapsed" de
+flamegraph.pl, importable dans speedscope) dont les racines sont les phases:
+
+    multipass;probe;pass1;solve (solver.py:433);Solve (cp_model.py:2017) 12
+"""
+from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+import os
+import sys
+import threading
+import time
+import uuid
+
+# Variable d'environnement qui active le profileur (dossier des fichiers)
+PROFILE_ENV = "ESTIVALES_PROFILE_DIR"
+
+# Intervalle d'échantillonnage des piles (s)
+PROFILE_INTERVAL = 0.005
+
+# Cadres de la mécanique des phases, exclus de la base des piles
+INTERNAL_MODULES = ('contextlib', 'src.timing', __name__)
+
+
+def profile_directory(config=None) -> Optional[str]:
+    """Dossier des profils: config.profile_dir, sinon ESTIVALES_PROFILE_DIR (None = inactif)"""
+    directory = getattr(config, 'profile_dir', None)
+    return directory or os.environ.get(PROFILE_ENV) or None
+
+
+class SamplingProfiler:
+    """
+    Échantillonneur de piles par phase
+    
+    Utilisation:
+        profiler = SamplingProfiler(directory)
+        with profiler.phase('pass1'):
+            ...  # piles échantillonnées sous la racine 'pass1'
+        path = profiler.write('solve')
+    
+    Le thread d'échantillonnage démarre à l'entrée de la première phase et
+    s'arrête de lui-même quand plus aucun thread n'est dans une phase.
+    """
+    
+    def __init__(self, directory: str, interval: float = PROFILE_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        # thread -> (phases en cours, cadre de base des piles)
+        self._phases: Dict[int, Tuple[List[str], object]] = {}
+        self._samples: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+    
+    def push(self, name: str):
+        """Entre dans la phase name (thread courant)"""
+        thread = threading.get_ident()
+        with self._lock:
+            if thread in self._phases:
+                self._phases[thread][0].append(name)
+            else:
+                self._phases[thread] = ([name], self._caller_frame())
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample_loop, name='profiler', daemon=True
+                )
+                self._sampler.start()
+    
+    def pop(self):
+        """Sort de la phase en cours (thread courant)"""
+        thread = threading.get_ident()
+        with self._lock:
+            phases = self._phases.get(thread)
+            if phases is None:
+                return
+            phases[0].pop()
+            if not phases[0]:
+                del self._phases[thread]
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Phase du bloc with"""
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop()
+    
+    @property
+    def num_samples(self) -> int:
+        with self._lock:
+            return sum(self._samples.values())
+    
+    def collapsed(self) -> Dict[str, int]:
+        """Nombre d'échantillons par pile repliée (phases puis cadres, racine d'abord)"""
+        with self._lock:
+            return dict(self._samples)
+    
+    def stop(self):
+        """Sort de toutes les phases et attend la fin de l'échantillonnage"""
+        with self._lock:
+            self._phases.clear()
+            sampler = self._sampler
+        if sampler is not None and sampler is not threading.current_thread():
+            sampler.join()
+    
+    def write(self, run_name: str) -> str:
+        """
+        Arrête l'échantillonnage et écrit les piles repliées du calcul
+        
+        Returns:
+            Chemin du fichier écrit (un par calcul)
+        """
+        self.stop()
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{run_name}-{uuid.uuid4().hex[:6]}.collapsed"
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.collapsed().items()):
+                f.write(f"{stack} {count}\n")
+        return path
+    
+    @staticmethod
+    def _caller_frame():
+        """Premier cadre hors mécanique des phases (base des piles du thread)"""
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_globals.get('__name__') in INTERNAL_MODULES:
+            frame = frame.f_back
+        return frame
+    
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    
+    def _sample_loop(self):
+        while True:
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                if not self._phases:
+                    self._sampler = None
+                    return
+                for thread, (phases, base) in self._phases.items():
+                    stack = self._stack(frames.get(thread), base)
+                    if stack is None:
+                        continue
+                    key = ';'.join(phases + stack)
+                    self._samples[key] = self._samples.get(key, 0) + 1
+    
+    def _stack(self, frame, base) -> Optional[List[str]]:
+        """Cadres de base à frame (racine d'abord); None si base a quitté la pile"""
+        labels = []
+        while frame is not None:
+            labels.append(self._frame_label(frame))
+            if frame is base:
+                return labels[::-1]
+            frame = frame.f_back
+        return None if base is not None else labels[::-1]
@@ -0,0 +1,99 @@
+"""
+Programmes admissibles par participant (formulation 'schedule_table')
+"""
+from typing import List, FrozenSet
+from dataclasses import dataclass
+from itertools import combinations
+
+from src.models import Participant, Tournament
+from src.constants import MAX_CONSECUTIVE_DAYS
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Programme admissible d'un participant: sous-ensemble de tournois joués"""
+    tournament_ids: FrozenSet[str]
+    days_played: int
+    shortage: int
+    max_run: int
+    fatigue_windows: int  # Fenêtres de 4 jours joués (encodage 'window')
+    
+    @property
+    def fatigue_excess(self) -> int:
+        """Jours au-delà du seuil de fatigue (encodage 'run_length')"""
+        return max(0, self.max_run - (MAX_CONSECUTIVE_DAYS - 1))
+
+
+def enumerate_schedules(
+    participant: Participant,
+    tournaments: List[Tournament]
+) -> List[Schedule]:
+    """
+    Énumère les programmes admissibles d'un participant.
+    
+    Mêmes règles que le modèle x-vars du solver:
+    - Disponibilité: aucun tournoi après dispo_jusqu_a (si ce tournoi est actif)
+    - Vœux: jamais plus d'étapes/opens que souhaité, exactement si respect_voeux
+    
+    Les jours joués, le manque et la fatigue sont précalculés avec les
+    définitions du solver (_calculate_days_played, _calculate_wish_deviations,
+    _calculate_fatigue_penalties, _calculate_consecutive_runs).
+    
+    Returns:
+        Liste des programmes (au plus 2^len(tournaments))
+    """
+    tournament_order = {t.id: idx for idx, t in enumerate(tournaments)}
+    max_idx = tournament_order.get(participant.dispo_jusqu_a)
+    available = [
+        t for t in tournaments
+        if max_idx is None or tournament_order[t.id] <= max_idx
+    ]
+    
+    # Jours du calendrier couverts par au moins un tournoi actif
+    calendar_days = sorted({day for t in tournaments for day in t.days})
+    
+    schedules = []
+    for size in range(len(available) + 1):
+        for subset in combinations(available, size):
+            etapes = sum(1 for t in subset if t.is_etape)
+            opens = sum(1 for t in subset if t.is_open)
+            
+            if etapes > participant.voeux_etape or opens > participant.voeux_open:
+                continue
+            if participant.respect_voeux and (
+                etapes != participant.voeux_etape or opens != participant.voeux_open
+            ):
+                continue
+            
+            played = {day for t in subset for day in t.days}
+            schedules.append(Schedule(
+                tournament_ids=frozenset(t.id for t in subset),
+                days_played=len(played),
+                shortage=max(0, participant.voeux_jours_total - len(played)),
+                max_run=_max_run(played, calendar_days),
+                fatigue_windows=_fatigue_windows(played, calendar_days)
+            ))
+    
+    return schedules
+
+
+def _max_run(played: set, calendar_days: List[int]) -> int:
+    """Série max de jours consécutifs joués (coupée par les jours sans tournoi)"""
+    max_run = 0
+    run = 0
+    for day in range(9):
+        if day in played and day in calendar_days:
+            run += 1
+            max_run = max(max_run, run)
+        else:
+            run = 0
+    return max_run
+
+
+def _fatigue_windows(played: set, calendar_days: List[int]) -> int:
+    """Fenêtres de 4 jours de tournoi consécutifs (dans la liste des jours) toutes jouées"""
+    window = MAX_CONSECUTIVE_DAYS
+    return sum(
+        1 for start in range(len(calendar_days) - window + 1)
+        if all(day in played for day in calendar_days[start:start + window])
+    )
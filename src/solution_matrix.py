@@ -0,0 +1,293 @@
+"""
+Solutions en matrice numpy: vérifications de contraintes et critères vectorisés
+"""
+from typing import List, Sequence, Tuple, Optional, Dict
+from dataclasses import fields
+
+import numpy as np
+
+from src.models import Participant, Tournament, Solution, SolverConfig
+from src.constants import TEAM_SIZE, MAX_CONSECUTIVE_DAYS
+
+NUM_DAYS = 9
+
+# Poids de l'objectif: défauts lus dans SolverConfig (une seule source)
+OBJECTIVE_WEIGHTS = ('weight_wishes', 'weight_fatigue', 'weight_incomplete')
+DEFAULT_WEIGHTS = {f.name: f.default for f in fields(SolverConfig) if f.name in OBJECTIVE_WEIGHTS}
+
+
+class SolutionMatrix:
+    """
+    Ensemble de solutions: plays[s, p, t] = True si le participant p joue le tournoi t
+    
+    Même ordre que les x du solver (participants puis tournois): la ligne
+    aplatie plays[s].ravel() est le vecteur des x de la solution s. Toutes
+    les vérifications et tous les critères sont calculés pour toutes les
+    solutions à la fois, sans construire d'objet Solution.
+    """
+    
+    def __init__(
+        self,
+        plays: np.ndarray,
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ):
+        self.participants = participants
+        self.tournaments = tournaments
+        self.plays = np.asarray(plays, dtype=bool).reshape(
+            -1, len(participants), len(tournaments)
+        )
+        
+        # Jours couverts par chaque tournoi (T, 9)
+        self._tournament_days = np.zeros((len(tournaments), NUM_DAYS), dtype=bool)
+        for idx, tournament in enumerate(tournaments):
+            self._tournament_days[idx, list(tournament.days)] = True
+        self._is_etape = np.array([t.is_etape for t in tournaments], dtype=bool)
+    
+    @classmethod
+    def from_assignments(
+        cls,
+        assignments: Sequence[Sequence[int]],
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ) -> 'SolutionMatrix':
+        """Construit la matrice depuis des vecteurs de x (ordre des clés de x)"""
+        plays = np.array(assignments, dtype=bool)
+        if plays.size == 0:
+            plays = np.zeros((0, len(participants), len(tournaments)), dtype=bool)
+        return cls(plays, participants, tournaments)
+    
+    @classmethod
+    def from_solutions(
+        cls,
+        solutions: List[Solution],
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ) -> 'SolutionMatrix':
+        """Construit la matrice depuis des objets Solution"""
+        plays = np.zeros((len(solutions), len(participants), len(tournaments)), dtype=bool)
+        participant_index = {p.nom: idx for idx, p in enumerate(participants)}
+        tournament_index = {t.id: idx for idx, t in enumerate(tournaments)}
+        for s, solution in enumerate(solutions):
+            for tournament_id, teams in solution.assignments.items():
+                for players in teams.values():
+                    for nom in players:
+                        plays[s, participant_index[nom], tournament_index[tournament_id]] = True
+        return cls(plays, participants, tournaments)
+    
+    def __len__(self) -> int:
+        return self.plays.shape[0]
+    
+    def assignments(self) -> List[Tuple[int, ...]]:
+        """Vecteurs de x de chaque solution"""
+        return [tuple(int(v) for v in row) for row in self.plays.reshape(len(self), -1)]
+    
+    def subset(self, rows) -> 'SolutionMatrix':
+        """Sous-ensemble des solutions (masque booléen ou indices)"""
+        return SolutionMatrix(self.plays[rows], self.participants, self.tournaments)
+    
+    def concat(self, other: 'SolutionMatrix') -> 'SolutionMatrix':
+        """Solutions de self puis de other (mêmes participants et tournois)"""
+        return SolutionMatrix(
+            np.concatenate([self.plays, other.plays]), self.participants, self.tournaments
+        )
+    
+    def reindex(self, participants: List[Participant]) -> 'SolutionMatrix':
+        """
+        Même ensemble de solutions pour un nouveau roster (mêmes tournois)
+        
+        Les participants sont associés par nom; un nouveau participant ne
+        joue rien, un participant retiré disparaît.
+        """
+        previous_index = {p.nom: idx for idx, p in enumerate(self.participants)}
+        plays = np.zeros((len(self), len(participants), len(self.tournaments)), dtype=bool)
+        for idx, participant in enumerate(participants):
+            if participant.nom in previous_index:
+                plays[:, idx] = self.plays[:, previous_index[participant.nom]]
+        return SolutionMatrix(plays, participants, self.tournaments)
+    
+    # ==================== CRITÈRES PAR PARTICIPANT ====================
+    
+    def presence(self) -> np.ndarray:
+        """Jours joués (S, P, 9)"""
+        return np.einsum('spt,td->spd', self.plays, self._tournament_days) > 0
+    
+    def days_played(self) -> np.ndarray:
+        """Nombre de jours joués (S, P)"""
+        return self.presence().sum(axis=2)
+    
+    def etapes_played(self) -> np.ndarray:
+        """Nombre d'étapes jouées (S, P)"""
+        return self.plays[:, :, self._is_etape].sum(axis=2)
+    
+    def opens_played(self) -> np.ndarray:
+        """Nombre d'opens joués (S, P)"""
+        return self.plays[:, :, ~self._is_etape].sum(axis=2)
+    
+    def shortages(self) -> np.ndarray:
+        """Jours lésés par participant (S, P), comme shortage_{nom} du solver"""
+        wished = np.array([p.voeux_jours_total for p in self.participants])
+        return np.maximum(0, wished - self.days_played())
+    
+    def max_shortage(self) -> np.ndarray:
+        """Lésion max individuelle de chaque solution (S,)"""
+        shortages = self.shortages()
+        return shortages.max(axis=1) if shortages.shape[1] else np.zeros(len(self), dtype=int)
+    
+    def max_runs(self) -> np.ndarray:
+        """Série max de jours consécutifs joués (S, P), coupée par les jours sans tournoi"""
+        presence = self.presence() & self._tournament_days.any(axis=0)
+        run = np.zeros(presence.shape[:2], dtype=int)
+        best = np.zeros(presence.shape[:2], dtype=int)
+        for day in range(NUM_DAYS):
+            run = np.where(presence[:, :, day], run + 1, 0)
+            best = np.maximum(best, run)
+        return best
+    
+    def fatigue(self, encoding: str = 'window') -> np.ndarray:
+        """
+        Pénalité de fatigue totale de chaque solution (S,)
+        
+        Mêmes valeurs que les fatigue_penalties du modèle:
+        - 'window': fenêtres de 4 jours de tournoi consécutifs toutes jouées
+        - 'run_length': jours de la série max au-delà du seuil
+        """
+        if encoding == 'run_length':
+            excess = np.maximum(0, self.max_runs() - (MAX_CONSECUTIVE_DAYS - 1))
+            return excess.sum(axis=1)
+        
+        calendar_days = np.flatnonzero(self._tournament_days.any(axis=0))
+        presence = self.presence()[:, :, calendar_days]
+        windows = np.zeros(len(self), dtype=int)
+        for start in range(len(calendar_days) - MAX_CONSECUTIVE_DAYS + 1):
+            full = presence[:, :, start:start + MAX_CONSECUTIVE_DAYS].all(axis=2)
+            windows += full.sum(axis=1)
+        return windows
+    
+    def _group_sizes(self) -> np.ndarray:
+        """Joueurs par groupe d'équipes (S, groupes): (étape, genre) et opens"""
+        groups = []
+        genres = np.array([p.genre for p in self.participants])
+        for idx, tournament in enumerate(self.tournaments):
+            if tournament.is_etape:
+                for genre in ['M', 'F']:
+                    groups.append(self.plays[:, genres == genre, idx].sum(axis=1))
+            else:
+                groups.append(self.plays[:, :, idx].sum(axis=1))
+        return np.stack(groups, axis=1) if groups else np.zeros((len(self), 0), dtype=int)
+    
+    def incomplete_teams(self) -> np.ndarray:
+        """Groupes avec une équipe incomplète (S,)"""
+        sizes = self._group_sizes()
+        return ((sizes > 0) & (sizes % TEAM_SIZE != 0)).sum(axis=1)
+    
+    def objective(
+        self,
+        fatigue_encoding: str = 'window',
+        weights: Optional[Dict[str, int]] = None
+    ) -> np.ndarray:
+        """
+        Objectif de chaque solution (S,), même formule que
+        SolutionCollector._compute_objective_value (choix du meilleur par profil)
+        
+        C'est une approximation de l'objectif du modèle CP, pas une égalité:
+        le modèle pénalise le reste (joueurs modulo TEAM_SIZE) de chaque
+        groupe et départage par les manques pondérés (distribution); ici un
+        groupe incomplet compte 1 et le départage est le total des manques.
+        Les termes lésion max, manque total et fatigue sont ceux du modèle.
+        
+        weights: weight_wishes, weight_fatigue, weight_incomplete
+        (DEFAULT_WEIGHTS si None): changer de poids ne demande aucun solve
+        """
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        shortages = self.shortages()
+        total = shortages.sum(axis=1)
+        return (
+            self.max_shortage() * 100000
+            + total * weights['weight_wishes']
+            + self.fatigue(fatigue_encoding) * weights['weight_fatigue']
+            + self.incomplete_teams() * weights['weight_incomplete']
+            + total
+        )
+    
+    # ==================== CONTRAINTES ====================
+    
+    def feasible(self, allow_incomplete: bool = False) -> np.ndarray:
+        """
+        Solutions qui respectent les contraintes du modèle (S,)
+        
+        Disponibilité, vœux (jamais dépassés, stricts), couples (jamais le
+        même jour) et équipes complètes (si allow_incomplete est False).
+        """
+        tournament_order = {t.id: idx for idx, t in enumerate(self.tournaments)}
+        available = np.ones((len(self.participants), len(self.tournaments)), dtype=bool)
+        for idx, participant in enumerate(self.participants):
+            max_idx = tournament_order.get(participant.dispo_jusqu_a)
+            if max_idx is not None:
+                available[idx, max_idx + 1:] = False
+        ok = ~(self.plays & ~available).any(axis=(1, 2))
+        
+        etapes = self.etapes_played()
+        opens = self.opens_played()
+        wished_etapes = np.array([p.voeux_etape for p in self.participants])
+        wished_opens = np.array([p.voeux_open for p in self.participants])
+        strict = np.array([p.respect_voeux for p in self.participants], dtype=bool)
+        ok &= (etapes <= wished_etapes).all(axis=1) & (opens <= wished_opens).all(axis=1)
+        ok &= ~(strict & ((etapes != wished_etapes) | (opens != wished_opens))).any(axis=1)
+        
+        presence = self.presence()
+        participant_index = {p.nom: idx for idx, p in enumerate(self.participants)}
+        for idx, participant in enumerate(self.participants):
+            partner = participant_index.get(participant.couple)
+            if partner is not None and idx < partner:
+                ok &= ~(presence[:, idx] & presence[:, partner]).any(axis=1)
+        
+        if not allow_incomplete:
+            ok &= (self._group_sizes() % TEAM_SIZE == 0).all(axis=1)
+        return ok
+    
+    # ==================== EXPORT ====================
+    
+    def profile_groups(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Regroupe les solutions par profil de lésés (vecteur des jours lésés)
+        
+        Returns:
+            Tuple (profils uniques (K, P), index du profil de chaque solution (S,))
+        """
+        profiles, inverse = np.unique(self.shortages(), axis=0, return_inverse=True)
+        return profiles, inverse.reshape(-1)
+    
+    def best_per_profile(
+        self,
+        fatigue_encoding: str = 'window',
+        weights: Optional[Dict[str, int]] = None
+    ) -> np.ndarray:
+        """Indice de la solution de plus petit objectif de chaque profil"""
+        if not len(self):
+            return np.zeros(0, dtype=int)
+        _, inverse = self.profile_groups()
+        order = np.lexsort((self.objective(fatigue_encoding, weights), inverse))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = inverse[order][1:] != inverse[order][:-1]
+        return order[first]
+    
+    def to_solutions(self, rows: Optional[Sequence[int]] = None) -> List[Solution]:
+        """Construit les objets Solution (stats calculées) des solutions demandées"""
+        rows = range(len(self)) if rows is None else rows
+        solutions = []
+        for s in rows:
+            assignments = {t.id: {'M': [], 'F': [], 'All': []} for t in self.tournaments}
+            for p_idx, t_idx in zip(*np.nonzero(self.plays[s])):
+                participant = self.participants[p_idx]
+                tournament = self.tournaments[t_idx]
+                group = participant.genre if tournament.is_etape else 'All'
+                assignments[tournament.id][group].append(participant.nom)
+            solution = Solution(
+                assignments=assignments,
+                participants=self.participants,
+                tournaments=self.tournaments
+            )
+            solution.calculate_stats()
+            solutions.append(solution)
+        return solutions
@@ -1,12 +1,74 @@
 """
 Solver OR-Tools pour l'optimisation des plannings
 """
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable, Iterator, Any
 from ortools.sat.python import cp_model
+from itertools import product
+from dataclasses import dataclass, field, replace
+import math
+import os
+import queue
+import random
+import threading
 import time
 
+import numpy as np
+
 from src.models import Participant, Tournament, Solution, SolverConfig
-from src.constants import TEAM_SIZE, MAX_CONSECUTIVE_DAYS
+from src.constants import (
+    TEAM_SIZE, MAX_CONSECUTIVE_DAYS, SEARCH_STRATEGIES, MAX_SOLUTIONS_TO_DISPLAY,
+    SOLVER_PROFILES
+)
+from src.schedules import enumerate_schedules
+from src.variant_counter import count_variants, solution_profile_key, profile_key
+from src.solution_matrix import SolutionMatrix, DEFAULT_WEIGHTS
+from src.time_budget import TimeBudget, PhaseHistory, relative_gap
+from src.timing import PhaseTimer
+from src.profiler import SamplingProfiler, profile_directory
+from src.telemetry import ConvergenceTelemetry
+
+# Échantillonnage de variantes: taille visée des cellules XOR et densité des XOR
+SAMPLE_CELL_SIZE = 8
+SAMPLE_XOR_DENSITY = 0.3
+# Cellules tirées sans nouvelle variante avant d'abandonner (cellules vides)
+SAMPLE_MAX_MISSES = 20
+
+# Variantes diverses: temps max d'une résolution max-min (la distance optimale
+# est atteinte vite, la preuve d'optimalité est longue)
+DIVERSE_STEP_TIME = 1.0
+
+# solve_iter: événements en attente max avant de bloquer le solver (backpressure)
+SOLVE_ITER_QUEUE_SIZE = 64
+
+# Mode déterministe sans random_seed: graine fixe
+DETERMINISTIC_SEED = 0
+
+
+def assignment_key(solution: Solution) -> Tuple:
+    """Clé canonique d'un planning: participants triés de chaque tournoi"""
+    return tuple(
+        (tid, tuple(sorted(name for group in teams.values() for name in group)))
+        for tid, teams in sorted(solution.assignments.items())
+    )
+
+
+@dataclass
+class SolveEvent:
+    """
+    Événement de solve_iter
+    
+    - 'solution': nouvelle solution gardée (mode 'all')
+    - 'profile': meilleure variante (nouvelle ou améliorée) d'un profil
+      (mode 'unique_profiles'): remplace la précédente de même profil
+    - 'done': fin du solve, résultats complets comme solve()
+    """
+    kind: str
+    elapsed: float
+    solution: Optional[Solution] = None
+    profile: Optional[Tuple] = None
+    solutions: List[Solution] = field(default_factory=list)
+    status: Optional[str] = None
+    info: Dict[str, Any] = field(default_factory=dict)
 
 
 class SolutionCollector(cp_model.CpSolverSolutionCallback):
@@ -25,7 +87,14 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
         limit: int,
         progress_callback=None,
         mode: str = 'unique_profiles',
-        min_quality_score: int = 0
+        min_quality_score: int = 0,
+        fatigue_vars: Optional[List] = None,
+        keep_assignments: bool = False,
+        objective_weights: Optional[Dict[str, int]] = None,
+        listener: Optional[Callable[[str, Solution], bool]] = None,
+        stable_order: bool = False,
+        timer: Optional[PhaseTimer] = None,
+        telemetry: Optional[ConvergenceTelemetry] = None
     ):
         super().__init__()
         self._variables = variables
@@ -33,15 +102,42 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
         self._participants = participants
         self._solution_limit = limit
         self._solutions = []
+        # Score qualité de chaque solution gardée, calculé dans le callback
+        # (donc dans la tranche PASS 2): le tri final ne le recalcule pas
+        self._quality_scores: Dict[int, float] = {}
         self._progress_callback = progress_callback
         self._start_time = time.time()
         self._mode = mode
         self._min_quality_score = min_quality_score
+        # Variables de fatigue du modèle: si fournies, la fatigue est LUE
+        # dans le modèle (exacte) au lieu d'être ré-estimée depuis les stats
+        self._fatigue_vars = fatigue_vars
+        # Poids de l'objectif (config.weight_*) pour choisir le meilleur par profil
+        self._weights = {**DEFAULT_WEIGHTS, **(objective_weights or {})}
         
         # Pour mode 'unique_profiles': tracker profils et leurs meilleures solutions
         self._profile_signatures = {}  # signature -> (solution, objective_value)
         self._solutions_count = 0  # Compte total de solutions rencontrées
         self._solutions_rejected_score = 0  # Compte solutions rejetées pour score
+        
+        # Vecteurs de x de TOUTES les solutions rencontrées (re-résolution
+        # incrémentale, voir TournamentSolver.solve_incremental)
+        self._keep_assignments = keep_assignments
+        self.assignments = []
+        
+        # Notifié à chaque solution gardée ('solution' ou 'profile');
+        # s'il renvoie False, l'énumération s'arrête (voir solve_iter)
+        self._listener = listener
+        self.stop_requested = False
+        
+        # Égalités de score départagées par le contenu (mode déterministe):
+        # l'ordre ne dépend plus de l'ordre de découverte
+        self._stable_order = stable_order
+        
+        # Temps cumulé des callbacks et des stats (spans collector.*)
+        self._timer = timer
+        # Profils et solutions au fil du temps (info['convergence'])
+        self._telemetry = telemetry
     
     def _compute_profile_signature(self, solution) -> str:
         """Calcule une signature unique pour identifier un profil de lésés
@@ -84,14 +180,18 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
             if solution.get_participant_stats(p.nom)['ecart'] < 0
         )
         
-        # Fatigue (calculée à partir de max_consecutive_days)
-        # Pénalité : si >3j consécutifs, (jours - 3) au carré
-        fatigue = 0
-        for p in self._participants:
-            stats = solution.get_participant_stats(p.nom)
-            max_cons = stats.get('max_consecutifs', 0)
-            if max_cons > 3:
-                fatigue += (max_cons - 3) ** 2
+        # Fatigue: valeur exacte du modèle si disponible (même encodage que
+        # l'objectif), sinon approximation depuis max_consecutive_days
+        if self._fatigue_vars is not None:
+            fatigue = sum(self.Value(v) for v in self._fatigue_vars)
+        else:
+            # Pénalité : si >3j consécutifs, (jours - 3) au carré
+            fatigue = 0
+            for p in self._participants:
+                stats = solution.get_participant_stats(p.nom)
+                max_cons = stats.get('max_consecutifs', 0)
+                if max_cons > 3:
+                    fatigue += (max_cons - 3) ** 2
         
         # Équipes incomplètes (approximation)
         incomplete = 0
@@ -116,22 +216,33 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
         
         # Calcul final (même pondération que dans _build_model)
         objective = (max_shortage * 100000 + 
-                    total_shortage * 1000 + 
-                    fatigue * 500 + 
-                    incomplete * 10 + 
+                    total_shortage * self._weights['weight_wishes'] + 
+                    fatigue * self._weights['weight_fatigue'] + 
+                    incomplete * self._weights['weight_incomplete'] + 
                     distribution * 1)
         
         return objective
     
     def on_solution_callback(self):
-        """Appelé à chaque solution trouvée"""
+        """Appelé à chaque solution trouvée (phase 'collector' du profileur)"""
+        if self._timer is None:
+            self._on_solution()
+            return
+        with self._timer.profiled('collector'):
+            self._on_solution()
+    
+    def _on_solution(self):
+        callback_start = time.perf_counter()
         self._solutions_count += 1
         
         # Vérifier la limite TOTALE de solutions rencontrées (pas juste gardées)
-        if self._solution_limit and self._solutions_count >= self._solution_limit:
+        if self.limit_reached:
             self.StopSearch()
             return
         
+        if self._keep_assignments:
+            self.assignments.append(tuple(self.Value(v) for v in self._variables.values()))
+        
         # Extraire la solution
         solution_data = {}
         
@@ -156,19 +267,27 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
         
         # Calculer les stats
         solution.calculate_stats()
+        if self._timer is not None:
+            self._timer.accumulate(
+                'collector.stats', 'pass2', time.perf_counter() - callback_start
+            )
         
         # NOTE IMPORTANTE: On ne filtre PAS par score qualité ici !
         # Le score qualité (0-100) est différent de l'objectif OR-Tools.
-        # Le filtrage par score se fait APRÈS dans app.py pour ne pas
-        # manquer des solutions que OR-Tools considère optimales.
         # Exemple: une solution avec score 70 peut avoir un max_shortage
         # plus élevé qu'une solution score 69, donc OR-Tools la rejette,
         # mais pour l'utilisateur elle est meilleure !
+        # Avec config.score_filter_in_solver, le seuil est compilé EXACTEMENT
+        # dans le modèle PASS 2 (max_shortage libéré, voir
+        # _build_model_for_enumeration). Sinon le filtrage se fait dans app.py.
         
         # Traitement selon le mode
+        kept = None
         if self._mode == 'all':
             # Mode classique: garder toutes les solutions
             self._solutions.append(solution)
+            self._quality_scores[id(solution)] = solution.get_quality_score()
+            kept = 'solution'
         
         elif self._mode == 'unique_profiles':
             # Mode profils uniques: ne garder que la meilleure de chaque profil
@@ -178,11 +297,19 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
             if signature not in self._profile_signatures:
                 # Nouveau profil découvert
                 self._profile_signatures[signature] = (solution, objective)
+                kept = 'profile'
             else:
                 # Profil déjà connu: garder le meilleur
                 prev_solution, prev_objective = self._profile_signatures[signature]
                 if objective < prev_objective:  # Meilleur score (minimisation)
                     self._profile_signatures[signature] = (solution, objective)
+                    del self._quality_scores[id(prev_solution)]
+                    kept = 'profile'
+            if kept:
+                self._quality_scores[id(solution)] = solution.get_quality_score()
+        
+        if kept and self._listener and self._listener(kept, solution) is False:
+            self.request_stop()
         
         # Notifier la progression
         if self._progress_callback:
@@ -197,6 +324,31 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
                 self._solution_limit if self._solution_limit else current,
                 elapsed
             )
+        
+        if self._telemetry is not None:
+            self._telemetry.on_pass2_solution(
+                time.time() - self._start_time, self.num_profiles, self._solutions_count
+            )
+        
+        if self._timer is not None:
+            self._timer.accumulate(
+                'collector.callback', 'pass2', time.perf_counter() - callback_start
+            )
+    
+    @property
+    def num_profiles(self) -> int:
+        """Profils distincts gardés (solutions gardées en mode 'all')"""
+        if self._mode == 'unique_profiles':
+            return len(self._profile_signatures)
+        return len(self._solutions)
+    
+    def close_telemetry(self, time_limit: float):
+        """Point final de la télémétrie PASS 2 (fin de l'énumération)"""
+        if self._telemetry is not None:
+            self._telemetry.finish_pass2(
+                time.time() - self._start_time, self.num_profiles,
+                self._solutions_count, time_limit
+            )
     
     def get_solutions(self) -> List[Solution]:
         """Retourne les solutions collectées, triées par score qualité"""
@@ -208,11 +360,36 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
             ]
             # Trier par SCORE QUALITÉ (meilleur d'abord)
             # Note: Le score est maintenant aligné sur l'objectif OR-Tools
-            profile_solutions.sort(key=lambda x: -x[1].get_quality_score())
+            if self._stable_order:
+                profile_solutions.sort(key=lambda x: (-self._quality_score(x[1]), x[2], x[0]))
+            else:
+                profile_solutions.sort(key=lambda x: -self._quality_score(x[1]))
             return [sol for _, sol, _ in profile_solutions]
         else:
             # Mode 'all': trier aussi par score qualité
-            return sorted(self._solutions, key=lambda s: -s.get_quality_score())
+            if self._stable_order:
+                return sorted(
+                    self._solutions,
+                    key=lambda s: (-self._quality_score(s), assignment_key(s))
+                )
+            return sorted(self._solutions, key=lambda s: -self._quality_score(s))
+    
+    def _quality_score(self, solution: Solution) -> float:
+        """Score qualité calculé dans le callback (recalculé à défaut)"""
+        score = self._quality_scores.get(id(solution))
+        return solution.get_quality_score() if score is None else score
+    
+    @property
+    def limit_reached(self) -> bool:
+        """True si la limite de solutions rencontrées est atteinte (ou arrêt demandé)"""
+        if self.stop_requested:
+            return True
+        return bool(self._solution_limit) and self._solutions_count >= self._solution_limit
+    
+    def request_stop(self):
+        """Arrête l'énumération en cours et les suivantes (bandes, variantes diverses)"""
+        self.stop_requested = True
+        self.StopSearch()
     
     def get_profile_count(self) -> int:
         """Retourne le nombre de profils uniques trouvés"""
@@ -221,17 +398,58 @@ class SolutionCollector(cp_model.CpSolverSolutionCallback):
         return len(self._solutions)
 
 
+class SolutionCounter(cp_model.CpSolverSolutionCallback):
+    """Compte les solutions sans les construire (dénombrement borné)"""
+    
+    def __init__(self, limit: int = 0):
+        super().__init__()
+        self._limit = limit
+        self.count = 0
+    
+    def on_solution_callback(self):
+        self.count += 1
+        if self._limit and self.count >= self._limit:
+            self.StopSearch()
+
+
+class _AssignmentCollector(cp_model.CpSolverSolutionCallback):
+    """Collecte les valeurs brutes des x (échantillonnage), avec limite"""
+    
+    def __init__(self, variables: List, limit: int = 0):
+        super().__init__()
+        self._variables = variables
+        self._limit = limit
+        self.assignments = []
+    
+    @property
+    def limit_reached(self) -> bool:
+        return bool(self._limit) and len(self.assignments) >= self._limit
+    
+    def on_solution_callback(self):
+        self.assignments.append(tuple(self.Value(v) for v in self._variables))
+        if self.limit_reached:
+            self.StopSearch()
+
+
 class TournamentSolver:
     """Solver principal pour l'optimisation des tournois"""
     
     def __init__(self, config: SolverConfig):
         self.config = config
+        # Solver PASS 1 et collecteur PASS 2 en cours (interruptibles par stop())
+        self._pass1_solver = None
+        self._collector = None
+        # Spans du calcul en cours (celui du budget pendant un solve)
+        self._timer = PhaseTimer()
     
     def solve(
         self,
         participants: List[Participant],
         tournaments: List[Tournament],
-        progress_callback=None
+        progress_callback=None,
+        solution_listener: Optional[Callable[[str, Solution], bool]] = None,
+        stop_event: Optional[threading.Event] = None,
+        budget: Optional[TimeBudget] = None
     ) -> Tuple[List[Solution], str, Dict]:
         """
         Résout le problème en 2 PASSES pour trouver TOUTES les solutions optimales.
@@ -243,11 +461,24 @@ class TournamentSolver:
             participants: Liste des participants
             tournaments: Liste des tournois actifs
             progress_callback: Fonction appelée pour la progression (current, total, time)
+            solution_listener: Appelé (kind, solution) à chaque solution gardée
+                en PASS 2; renvoyer False arrête l'énumération (voir solve_iter)
+            stop_event: Annulation via stop(): interrompt la passe en cours,
+                les solutions PASS 2 déjà trouvées sont renvoyées
+            budget: Échéance partagée (solve_multipass); par défaut
+                timeout_seconds, jamais dépassé par les passes
             
         Returns:
-            Tuple (solutions, status, info)
+            Tuple (solutions, status, info); info['timings'] liste les spans
+            des phases (voir src/timing.py)
         """
         start_time = time.time()
+        # Un calcul autonome (sans budget reçu) écrit sa trace Chrome et son profil
+        write_trace = budget is None
+        budget = budget or self.new_budget()
+        timer = self._timer = budget.timer
+        telemetry = ConvergenceTelemetry()
+        size = len(participants) * len(tournaments)
         
         # ================================================================
         # PASS 1: TROUVER LE SCORE OPTIMAL
@@ -255,28 +486,36 @@ class TournamentSolver:
         if progress_callback:
             progress_callback(0, 1, 0)
         
-        model_pass1, variables_pass1, auxiliary_vars_pass1 = self._build_model(
-            participants, tournaments
-        )
-        
-        solver_pass1 = cp_model.CpSolver()
-        solver_pass1.parameters.max_time_in_seconds = min(30.0, self.config.timeout_seconds / 3)
-        solver_pass1.parameters.log_search_progress = False
-        solver_pass1.parameters.num_search_workers = 8
-        
-        # Paramètres pour exploration plus large et meilleure optimisation
-        solver_pass1.parameters.linearization_level = 0
-        solver_pass1.parameters.cp_model_presolve = True
-        solver_pass1.parameters.cp_model_probing_level = 2
+        with timer.span('pass1.build', 'pass1'):
+            model_pass1, variables_pass1, auxiliary_vars_pass1 = self._build_model(
+                participants, tournaments
+            )
         
-        # Stratégies de recherche pour éviter les blocages locaux
-        solver_pass1.parameters.search_branching = cp_model.FIXED_SEARCH
-        solver_pass1.parameters.optimize_with_core = True  # Utilise le core pour l'optimisation
+        pass1_time_limit = budget.pass1(size)
+        solver_pass1 = self._create_pass1_solver(pass1_time_limit)
         
         # Pas de hints restrictifs - laisser le solver explorer librement
         # (on retire les hints qui forçaient 50% de non-participation)
         
-        status_pass1 = solver_pass1.Solve(model_pass1)
+        self._pass1_solver = solver_pass1
+        try:
+            if stop_event is None or not stop_event.is_set():
+                with timer.cp_solve(
+                    'pass1', 'pass1', solver_pass1, on_log=telemetry.on_pass1_log
+                ):
+                    status_pass1 = solver_pass1.Solve(model_pass1)
+                telemetry.finish_pass1(solver_pass1, pass1_time_limit)
+        finally:
+            self._pass1_solver = None
+        
+        if stop_event is not None and stop_event.is_set():
+            return self._with_timings(([], "CANCELLED", {
+                'status': "CANCELLED",
+                'num_solutions': 0,
+                'elapsed_time': time.time() - start_time,
+                'stopped': True,
+                'pass': 1
+            }), budget, write_trace)
         
         if status_pass1 not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             # Pas de solution trouvée
@@ -290,18 +529,24 @@ class TournamentSolver:
             elif status_pass1 == cp_model.MODEL_INVALID:
                 status_name = "MODEL_INVALID - Le modèle contient des erreurs"
             
-            return [], status_name, {
+            return self._with_timings(([], status_name, {
                 'status': status_name,
                 'num_solutions': 0,
                 'elapsed_time': elapsed,
                 'num_branches': solver_pass1.NumBranches(),
                 'wall_time': solver_pass1.WallTime(),
                 'num_conflicts': solver_pass1.NumConflicts(),
+                'convergence': telemetry.to_info(),
                 'pass': 1
-            }
+            }), budget, write_trace)
         
         # Récupérer le score optimal trouvé
         optimal_score = int(solver_pass1.ObjectiveValue())
+        budget.record_pass1(
+            size,
+            solver_pass1.WallTime(),
+            relative_gap(solver_pass1.ObjectiveValue(), solver_pass1.BestObjectiveBound())
+        )
         
         # EXTRAIRE la valeur optimale du CRITÈRE DOMINANT : lésion max individuelle
         # C'est le SEUL critère qu'on va contraindre en PASS 2
@@ -317,47 +562,940 @@ class TournamentSolver:
             progress_callback(1, 2, elapsed)
         
         # Reconstruire le modèle pour énumération avec SEULE contrainte : max_shortage
-        model_pass2, variables_pass2, auxiliary_vars_pass2 = self._build_model_for_enumeration(
-            participants, tournaments, optimal_max_shortage
-        )
+        with timer.span('pass2.build', 'pass2'):
+            model_pass2, variables_pass2, auxiliary_vars_pass2 = self._build_model_for_enumeration(
+                participants, tournaments, optimal_max_shortage
+            )
+        
+        # Bande d'énumération autour de l'optimum PASS 1 (config.enumeration_band)
+        # Le complément de la bande est gardé pour compter ce qu'elle exclut
+        excluded_model = None
+        band = self._enumeration_band(solver_pass1, auxiliary_vars_pass1, auxiliary_vars_pass2)
+        if band is not None:
+            band_expr, band_limit = band
+            excluded_model = model_pass2.Clone()
+            excluded_model.Add(band_expr > band_limit)
+            model_pass2.Add(band_expr <= band_limit)
         
         # Collecter les solutions selon le mode configuré
+        # (variantes diverses: toutes gardées, la diversité remplace la
+        # déduplication par profil et la limite est gérée par _enumerate_diverse)
+        diverse = self.config.enumeration_order == 'diverse'
         collector = SolutionCollector(
             variables_pass2,
             tournaments,
             participants,
-            self.config.max_solutions,
+            0 if diverse else self.config.max_solutions,
             progress_callback,
-            mode=self.config.search_mode,
-            min_quality_score=self.config.min_quality_score
+            mode='all' if diverse else self.config.search_mode,
+            min_quality_score=self.config.min_quality_score,
+            fatigue_vars=auxiliary_vars_pass2.get("fatigue_penalties"),
+            keep_assignments=self.config.keep_enumeration,
+            objective_weights=self._objective_weights(),
+            listener=solution_listener,
+            stable_order=self.config.deterministic,
+            timer=timer,
+            telemetry=telemetry
         )
         
-        solver_pass2 = cp_model.CpSolver()
-        remaining_time = self.config.timeout_seconds - (time.time() - start_time)
-        solver_pass2.parameters.max_time_in_seconds = max(10.0, remaining_time)
-        solver_pass2.parameters.log_search_progress = False
-        
-        # CLEF: Maintenant qu'on n'a PAS d'objectif à minimiser,
-        # on peut utiliser SearchForAllSolutions !
-        status_pass2 = solver_pass2.SearchForAllSolutions(model_pass2, collector)
+        reserve = budget.band_count_reserve() if excluded_model is not None else 0.0
+        self._collector = collector
+        try:
+            if stop_event is not None and stop_event.is_set():
+                collector.stop_requested = True
+            pass2_time_limit = budget.pass2(reserve)
+            with timer.span('pass2.enumeration', 'pass2'):
+                status_pass2, branches_pass2, wall_time_pass2 = self._enumerate_pass2(
+                    model_pass2, variables_pass2, auxiliary_vars_pass2, collector,
+                    pass2_time_limit
+                )
+            collector.close_telemetry(pass2_time_limit)
+        finally:
+            self._collector = None
         
+        # Solutions triées une seule fois (scores déjà calculés par le collecteur)
+        with timer.span('collector.sort', 'stats'):
+            solutions = collector.get_solutions()
         elapsed_time = time.time() - start_time
         
         # Préparer les infos
         info = {
-            'status': solver_pass2.StatusName(status_pass2),
-            'num_solutions': len(collector.get_solutions()),
+            'status': status_pass2,
+            'num_solutions': len(solutions),
+            'elapsed_time': elapsed_time,
+            'num_branches': solver_pass1.NumBranches() + branches_pass2,
+            'wall_time': solver_pass1.WallTime() + wall_time_pass2,
+            'pass1_wall_time': solver_pass1.WallTime(),
+            'pass2_wall_time': wall_time_pass2,
+            'optimal_score': optimal_score,
+            'convergence': telemetry.to_info(),
+            'pass': 2
+        }
+        
+        if self.config.keep_enumeration:
+            info['enumeration'] = SolutionMatrix.from_assignments(
+                collector.assignments, participants, tournaments
+            )
+            info['enumeration_complete'] = (
+                status_pass2 == "OPTIMAL" and not collector.limit_reached
+            )
+            info['optimal_max_shortage'] = optimal_max_shortage
+            info['enumeration_allow_incomplete'] = self.config.allow_incomplete
+        
+        if diverse:
+            # Plus petite distance de Hamming entre deux variantes gardées
+            info['min_pairwise_distance'] = min_pairwise_distance(solutions)
+        
+        if self.config.count_variants and not collector.stop_requested:
+            # Comptes exacts par profil (programmation dynamique, sans Solution)
+            profiles = {solution_profile_key(s) for s in solutions}
+            with timer.span('count_variants', 'stats'):
+                info['variant_counts'] = count_variants(
+                    participants, tournaments, self.config.allow_incomplete, profiles
+                )
+            info['variant_counts_unfiltered'] = self._variant_counts_unfiltered()
+        
+        if excluded_model is not None and not collector.stop_requested:
+            # Dénombrement borné: le complément peut être énorme (c'est le but de la bande)
+            with timer.span('band_count', 'pass2'):
+                excluded, exact = self._count_solutions(excluded_model, budget.band_count())
+            info['band_excluded'] = excluded
+            info['band_excluded_exact'] = exact
+        
+        if self._score_threshold_active():
+            # Aucune solution n'atteint le score minimum (espace vide prouvé)
+            info['score_threshold_infeasible'] = (
+                not solutions and status_pass2 in ("OPTIMAL", "INFEASIBLE")
+            )
+        
+        if progress_callback:
+            progress_callback(len(solutions), len(solutions), elapsed_time)
+        
+        if collector.stop_requested:
+            info['stopped'] = True
+        info['time_allocation'] = list(budget.allocations)
+        
+        return self._with_timings((solutions, status_pass2, info), budget, write_trace)
+    
+    def _with_timings(
+        self,
+        result: Tuple[List[Solution], str, Dict],
+        budget: TimeBudget,
+        write_trace: bool
+    ) -> Tuple[List[Solution], str, Dict]:
+        """
+        Ajoute les spans du budget à l'info (timings, timing_summary) et
+        écrit la trace Chrome (config.timing_trace_path) et le profil
+        (info['profile_path'], voir src/profiler.py) si write_trace
+        """
+        solutions, status, info = result
+        info['timings'] = budget.timer.spans
+        info['timing_summary'] = budget.timer.summary()
+        if write_trace:
+            budget.timer.write_chrome_trace(self.config.timing_trace_path)
+            profile_path = budget.timer.write_profile('solve')
+            if profile_path:
+                info['profile_path'] = profile_path
+        return solutions, status, info
+    
+    def solve_iter(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        max_pending: int = SOLVE_ITER_QUEUE_SIZE,
+        stop_event: Optional[threading.Event] = None
+    ) -> Iterator[SolveEvent]:
+        """
+        Version streaming de solve(): produit les solutions gardées au fil de
+        l'énumération PASS 2, puis un événement 'done' avec le résultat complet.
+        
+        Le solve tourne dans un thread; une file bornée (max_pending) le relie
+        au consommateur: si celui-ci ne suit pas, le callback CP-SAT attend
+        (backpressure). Fermer le générateur (break, close()) ou positionner
+        stop_event arrête la recherche.
+        
+        Yields:
+            SolveEvent ('solution' / 'profile' puis 'done')
+        """
+        start_time = time.time()
+        events = queue.Queue(maxsize=max(1, max_pending))
+        stop = stop_event or threading.Event()
+        failure = []
+        
+        def put(event) -> bool:
+            # Attente par tranches: un consommateur parti ne bloque pas le solver
+            while not stop.is_set():
+                try:
+                    events.put(event, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def listener(kind: str, solution: Solution) -> bool:
+            return put(SolveEvent(
+                kind=kind,
+                elapsed=time.time() - start_time,
+                solution=solution,
+                profile=solution_profile_key(solution)
+            ))
+        
+        def run():
+            try:
+                solutions, status, info = self.solve(
+                    participants, tournaments,
+                    solution_listener=listener, stop_event=stop
+                )
+            except Exception as error:  # relancée côté consommateur
+                failure.append(error)
+                put(None)
+                return
+            put(SolveEvent(
+                kind='done',
+                elapsed=time.time() - start_time,
+                solutions=solutions,
+                status=status,
+                info=info
+            ))
+        
+        worker = threading.Thread(target=run, name='solve_iter', daemon=True)
+        worker.start()
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=0.1)
+                except queue.Empty:
+                    if stop.is_set() or not worker.is_alive() and events.empty():
+                        break
+                    continue
+                if event is None:
+                    raise failure[0]
+                yield event
+                if event.kind == 'done':
+                    break
+        finally:
+            self.stop(stop)
+            worker.join()
+    
+    def stop(self, stop_event: threading.Event):
+        """Annule un solve(stop_event=...) en cours, en PASS 1 comme en PASS 2"""
+        stop_event.set()
+        solver_pass1 = self._pass1_solver
+        if solver_pass1 is not None:
+            solver_pass1.StopSearch()
+        collector = self._collector
+        if collector is not None:
+            collector.request_stop()
+    
+    def solve_provisional(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        time_limit: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> Tuple[List[Solution], str, Dict]:
+        """
+        Mode anytime: meilleurs plannings trouvés dans un budget de latence
+        (config.latency_budget par défaut), à afficher en attendant solve().
+        
+        Les incumbents successifs de la PASS 1 sont renvoyés, le meilleur
+        d'abord. Si les vœux stricts rendent le modèle infaisable, le reste
+        du budget sert à une estimation relaxée (vœux stricts assouplis).
+        Annulable comme solve() (stop_event, stop()): les incumbents déjà
+        trouvés sont renvoyés.
+        
+        Returns:
+            Tuple (solutions, status, info)
+            info['provisional']: False seulement si l'optimum strict est prouvé
+            info['relaxed']: True si les vœux stricts ont été assouplis
+        """
+        start_time = time.time()
+        budget = self.config.latency_budget if time_limit is None else time_limit
+        
+        status, incumbents, info = self._provisional_pass1(
+            participants, tournaments, budget, stop_event
+        )
+        relaxed = False
+        remaining = budget - (time.time() - start_time)
+        if status == "INFEASIBLE" and remaining > 0 and any(p.respect_voeux for p in participants):
+            relaxed_participants = [replace(p, respect_voeux=False) for p in participants]
+            status, incumbents, info = self._provisional_pass1(
+                relaxed_participants, tournaments, remaining, stop_event
+            )
+            relaxed = True
+        
+        # Meilleur d'abord, plafonné à max_solutions (stats du roster saisi)
+        x = info.pop('x')
+        if self.config.max_solutions:
+            incumbents = incumbents[-self.config.max_solutions:]
+        solutions = [
+            self._solution_from_assignment(assignment, x, participants, tournaments)
+            for assignment in reversed(incumbents)
+        ]
+        
+        info.update({
+            'provisional': relaxed or status != "OPTIMAL",
+            'relaxed': relaxed,
+            'elapsed_time': time.time() - start_time
+        })
+        return solutions, status, info
+    
+    def _provisional_pass1(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        time_limit: float,
+        stop_event: Optional[threading.Event] = None
+    ) -> Tuple[str, List[Tuple[int, ...]], Dict]:
+        """PASS 1 bornée en temps; garde chaque incumbent (objectif décroissant)"""
+        model, x, auxiliary_vars = self._build_model(participants, tournaments)
+        solver = self._create_pass1_solver(max(0.01, time_limit))
+        incumbents = _AssignmentCollector(list(x.values()))
+        
+        # Enregistré comme la PASS 1 de solve(): stop() l'interrompt
+        self._pass1_solver = solver
+        try:
+            if stop_event is not None and stop_event.is_set():
+                status = "CANCELLED"
+            else:
+                status = solver.StatusName(solver.Solve(model, incumbents))
+        finally:
+            self._pass1_solver = None
+        
+        info = {'status': status, 'x': x}
+        if incumbents.assignments:
+            info['objective'] = int(solver.ObjectiveValue())
+            info['best_bound'] = int(solver.BestObjectiveBound())
+        return status, incumbents.assignments, info
+    
+    def rerank(
+        self,
+        solutions: List[Solution],
+        previous_info: Optional[Dict] = None
+    ) -> Tuple[List[Solution], Dict]:
+        """
+        Reclasse des solutions déjà collectées selon les poids de la config
+        (weight_wishes, weight_fatigue, weight_incomplete), sans aucun solve.
+        
+        Les poids ne changent pas l'espace PASS 2 (même lésion max): seuls le
+        classement et, en mode unique_profiles, la meilleure variante de
+        chaque profil changent. Si previous_info porte l'énumération
+        (keep_enumeration), la meilleure variante de chaque profil est
+        re-choisie parmi toutes les variantes rencontrées; sinon les
+        solutions données sont seulement reclassées.
+        
+        Returns:
+            Tuple (solutions par objectif croissant, info)
+            info['objectives']: objectif de chaque solution renvoyée
+        """
+        start_time = time.time()
+        weights = self._objective_weights()
+        enumeration = previous_info.get('enumeration') if previous_info else None
+        
+        if enumeration is not None and len(enumeration):
+            if self.config.search_mode == 'unique_profiles':
+                rows = enumeration.best_per_profile(self.config.fatigue_encoding, weights)
+            else:
+                rows = np.arange(len(enumeration))
+            candidates = enumeration.subset(rows)
+            solutions = candidates.to_solutions()
+        elif solutions:
+            candidates = SolutionMatrix.from_solutions(
+                solutions, solutions[0].participants, solutions[0].tournaments
+            )
+        else:
+            return [], {'objectives': [], 'elapsed_time': 0.0, 'mode': 'rerank'}
+        
+        objectives = candidates.objective(self.config.fatigue_encoding, weights)
+        order = np.argsort(objectives, kind='stable')
+        info = {
+            'objectives': [int(objectives[idx]) for idx in order],
+            'reselected': enumeration is not None,
+            'elapsed_time': time.time() - start_time,
+            'mode': 'rerank'
+        }
+        return [solutions[idx] for idx in order], info
+    
+    def solve_incremental(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        previous_info: Dict,
+        progress_callback=None,
+        budget: Optional[TimeBudget] = None
+    ) -> Tuple[List[Solution], str, Dict]:
+        """
+        Re-résout après une édition du roster en réutilisant le calcul précédent.
+        
+        previous_info est l'info d'un solve() avec keep_enumeration (ou d'un
+        solve_incremental précédent):
+        1. Les solutions déjà énumérées sont revérifiées sur le nouveau roster
+           en bloc (SolutionMatrix): on garde celles encore admissibles
+        2. PASS 1 avec la meilleure solution gardée en hint
+        3. PASS 2 n'énumère que le DELTA: les solutions qui n'étaient pas
+           dans l'espace précédent (programme d'un participant modifié
+           inadmissible avant, ou lésion max inférieure avant)
+        4. Résultats = gardées + delta, choisis comme le collecteur
+           (meilleure variante par profil ou toutes) et reconstruits en Solution
+        
+        Résultat exact si l'énumération précédente était complète; sinon
+        gardées + delta (partiel, comme l'énumération tronquée d'origine).
+        Repli sur solve() si l'édition change la structure du problème
+        (participants ajoutés/retirés, genre, couple, tournois, lésion max
+        optimale) ou si le mode d'énumération n'est pas incrémental.
+        
+        Returns:
+            Tuple (solutions, status, info) comme solve(); info['incremental']
+            indique si le chemin incrémental a été pris
+        """
+        start_time = time.time()
+        write_trace = budget is None
+        budget = budget or self.new_budget()
+        timer = self._timer = budget.timer
+        
+        reason = self._incremental_blocker(participants, tournaments, previous_info)
+        if reason is not None:
+            return self._with_timings(self._solve_from_scratch(
+                participants, tournaments, progress_callback, reason, budget
+            ), budget, write_trace)
+        
+        previous = previous_info['enumeration']
+        kept = previous.reindex(participants)
+        kept = kept.subset(kept.feasible(self.config.allow_incomplete))
+        
+        # PASS 1: optimum du nouveau roster, meilleure solution gardée en hint
+        with timer.span('pass1.build', 'pass1'):
+            model_pass1, variables_pass1, auxiliary_vars_pass1 = self._build_model(
+                participants, tournaments
+            )
+        if len(kept):
+            best = int(kept.objective(
+                self.config.fatigue_encoding, self._objective_weights()
+            ).argmin())
+            for var, value in zip(variables_pass1.values(), kept.assignments()[best]):
+                model_pass1.AddHint(var, value)
+        solver_pass1 = self._create_pass1_solver(
+            budget.pass1(len(participants) * len(tournaments))
+        )
+        with timer.cp_solve('pass1', 'pass1', solver_pass1):
+            status_pass1 = solver_pass1.Solve(model_pass1)
+        if status_pass1 not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return self._with_timings(self._solve_from_scratch(
+                participants, tournaments, progress_callback, "PASS 1 sans solution", budget
+            ), budget, write_trace)
+        optimal_score = int(solver_pass1.ObjectiveValue())
+        optimal_max_shortage = int(solver_pass1.Value(auxiliary_vars_pass1["max_shortage"]))
+        if optimal_max_shortage != previous_info['optimal_max_shortage']:
+            return self._with_timings(self._solve_from_scratch(
+                participants, tournaments, progress_callback, "lésion max optimale modifiée",
+                budget
+            ), budget, write_trace)
+        
+        kept = kept.subset(kept.max_shortage() == optimal_max_shortage)
+        
+        # PASS 2: uniquement les solutions hors de l'espace précédent
+        previous_by_name = {p.nom: p for p in previous.participants}
+        changed = [p for p in participants if p != previous_by_name[p.nom]]
+        with timer.span('pass2.build', 'pass2'):
+            model_pass2, variables_pass2, auxiliary_vars_pass2 = self._build_model_for_enumeration(
+                participants, tournaments, optimal_max_shortage
+            )
+        self._exclude_previous_space(
+            model_pass2, variables_pass2, auxiliary_vars_pass2,
+            [previous_by_name[p.nom] for p in changed],
+            [p for p in participants if p not in changed],
+            tournaments, optimal_max_shortage
+        )
+        
+        delta_limit = 0
+        if self.config.max_solutions:
+            delta_limit = max(1, self.config.max_solutions - len(kept))
+        collector = _AssignmentCollector(list(variables_pass2.values()), delta_limit)
+        solver_pass2 = self._new_cp_solver(budget.pass2())
+        with timer.cp_solve('pass2', 'pass2', solver_pass2):
+            status_pass2 = solver_pass2.SearchForAllSolutions(model_pass2, collector)
+        
+        delta = SolutionMatrix.from_assignments(collector.assignments, participants, tournaments)
+        enumeration = kept.concat(delta)
+        complete = (
+            previous_info.get('enumeration_complete', False)
+            and status_pass2 in (cp_model.OPTIMAL, cp_model.INFEASIBLE)
+            and not collector.limit_reached
+        )
+        
+        # Même sélection que SolutionCollector, puis tri par score qualité
+        if self.config.search_mode == 'unique_profiles':
+            rows = enumeration.best_per_profile(
+                self.config.fatigue_encoding, self._objective_weights()
+            )
+        else:
+            rows = range(len(enumeration))
+        with timer.span('collector.stats', 'stats'):
+            solutions = sorted(
+                enumeration.to_solutions(rows), key=lambda s: -s.get_quality_score()
+            )
+        if self.config.max_solutions:
+            solutions = solutions[:self.config.max_solutions]
+        
+        if complete:
+            status = "OPTIMAL"
+        else:
+            status = "FEASIBLE" if solutions else "UNKNOWN"
+        
+        elapsed_time = time.time() - start_time
+        info = {
+            'status': status,
+            'num_solutions': len(solutions),
             'elapsed_time': elapsed_time,
             'num_branches': solver_pass1.NumBranches() + solver_pass2.NumBranches(),
             'wall_time': solver_pass1.WallTime() + solver_pass2.WallTime(),
             'optimal_score': optimal_score,
-            'pass': 2
+            'pass': 2,
+            'incremental': True,
+            'kept': len(kept),
+            'delta': len(delta),
+            'enumeration': enumeration,
+            'enumeration_complete': complete,
+            'optimal_max_shortage': optimal_max_shortage,
+            'enumeration_allow_incomplete': self.config.allow_incomplete
         }
         
+        if self.config.count_variants:
+            profiles = {solution_profile_key(s) for s in solutions}
+            with timer.span('count_variants', 'stats'):
+                info['variant_counts'] = count_variants(
+                    participants, tournaments, self.config.allow_incomplete, profiles
+                )
+            info['variant_counts_unfiltered'] = self._variant_counts_unfiltered()
+        
         if progress_callback:
-            progress_callback(len(collector.get_solutions()), len(collector.get_solutions()), elapsed_time)
+            progress_callback(len(solutions), len(solutions), elapsed_time)
+        
+        return self._with_timings((solutions, status, info), budget, write_trace)
+    
+    def _incremental_blocker(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        previous_info: Dict
+    ) -> Optional[str]:
+        """Raison pour laquelle le chemin incrémental est impossible (None sinon)"""
+        previous = previous_info.get('enumeration') if previous_info else None
+        if previous is None:
+            return "pas d'énumération précédente (keep_enumeration)"
+        if [t.id for t in tournaments] != [t.id for t in previous.tournaments]:
+            return "tournois modifiés"
+        if {p.nom for p in participants} != {p.nom for p in previous.participants}:
+            return "participants ajoutés ou retirés"
+        previous_by_name = {p.nom: p for p in previous.participants}
+        if any(
+            (p.genre, p.couple) != (previous_by_name[p.nom].genre, previous_by_name[p.nom].couple)
+            for p in participants
+        ):
+            return "genre ou couple modifié"
+        if previous_info.get('enumeration_allow_incomplete') != self.config.allow_incomplete:
+            return "équipes incomplètes autorisées modifié"
+        if (
+            self.config.enumeration_band != 'max_shortage'
+            or self.config.enumeration_order == 'diverse'
+            or self._score_threshold_active()
+        ):
+            return "mode d'énumération non incrémental"
+        return None
+    
+    def _solve_from_scratch(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        progress_callback,
+        reason: str,
+        budget: Optional[TimeBudget] = None
+    ) -> Tuple[List[Solution], str, Dict]:
+        """Repli de solve_incremental: solve() complet, raison dans l'info"""
+        config = replace(self.config, keep_enumeration=True)
+        solutions, status, info = TournamentSolver(config).solve(
+            participants, tournaments, progress_callback, budget=budget
+        )
+        info['incremental'] = False
+        info['incremental_reason'] = reason
+        return solutions, status, info
+    
+    def _exclude_previous_space(
+        self,
+        model: cp_model.CpModel,
+        x: Dict,
+        auxiliary_vars: Dict,
+        changed_before: List[Participant],
+        unchanged: List[Participant],
+        tournaments: List[Tournament],
+        target_max_shortage: int
+    ):
+        """
+        Interdit les solutions qui étaient déjà dans l'espace PASS 2 précédent.
+        
+        Une solution du nouvel espace était dans l'ancien ssi:
+        - le programme de chaque participant modifié était admissible avec ses
+          anciennes données, avec un manque <= lésion max (table par participant)
+        - la lésion max valait déjà target: un participant non modifié ou un
+          ancien manque de participant modifié atteint target
         
-        return collector.get_solutions(), solver_pass2.StatusName(status_pass2), info
+        Args:
+            changed_before: Participants modifiés, avec leurs ANCIENNES données
+            unchanged: Participants non modifiés
+        """
+        in_previous = []
+        at_target = []
+        for participant in changed_before:
+            admissible = {
+                s.tournament_ids: s.shortage
+                for s in enumerate_schedules(participant, tournaments)
+                if s.shortage <= target_max_shortage
+            }
+            # Table complète des 2^T programmes: (x..., admissible avant, manque == target)
+            table = []
+            for bits in product([0, 1], repeat=len(tournaments)):
+                ids = frozenset(t.id for t, bit in zip(tournaments, bits) if bit)
+                shortage = admissible.get(ids)
+                table.append(bits + (int(shortage is not None), int(shortage == target_max_shortage)))
+            
+            was_admissible = model.NewBoolVar(f"previous_{participant.nom}")
+            was_at_target = model.NewBoolVar(f"previous_at_target_{participant.nom}")
+            model.AddAllowedAssignments(
+                [x[(participant.nom, t.id)] for t in tournaments] + [was_admissible, was_at_target],
+                table
+            )
+            in_previous.append(was_admissible)
+            at_target.append(was_at_target)
+        
+        # Manque == target des participants non modifiés, réifié dans les deux
+        # sens: un littéral libre ferait énumérer deux fois la même solution
+        for participant in unchanged:
+            shortage = auxiliary_vars[f"shortage_{participant.nom}"]
+            is_at_target = model.NewBoolVar(f"at_target_{participant.nom}")
+            model.Add(shortage == target_max_shortage).OnlyEnforceIf(is_at_target)
+            model.Add(shortage != target_max_shortage).OnlyEnforceIf(is_at_target.Not())
+            at_target.append(is_at_target)
+        
+        # Dans l'ancien espace = tous admissibles avant ET quelqu'un atteint target:
+        # interdit pour chaque littéral qui atteint target (aucune variable auxiliaire)
+        not_previous = [literal.Not() for literal in in_previous]
+        for literal in at_target:
+            model.AddBoolOr(not_previous + [literal.Not()])
+    
+    def _enumerate_pass2(
+        self,
+        model: cp_model.CpModel,
+        variables: Dict,
+        auxiliary_vars: Dict,
+        collector: 'SolutionCollector',
+        time_limit: float
+    ) -> Tuple[str, int, float]:
+        """
+        Énumère les solutions du modèle de PASS 2 dans le collecteur.
+        
+        - enumeration_order='arbitrary': un seul SearchForAllSolutions (ordre du solver)
+        - enumeration_order='quality': bandes de qualité croissantes (voir
+          _enumerate_by_quality_bands), les meilleures variantes sont vues d'abord
+        - enumeration_order='diverse': variantes les plus éloignées deux à deux
+          (voir _enumerate_diverse), sans énumération exhaustive
+        
+        Returns:
+            Tuple (status, num_branches, wall_time)
+        """
+        if self.config.enumeration_order == 'quality':
+            return self._enumerate_by_quality_bands(
+                model, auxiliary_vars, collector, time_limit
+            )
+        if self.config.enumeration_order == 'diverse':
+            return self._enumerate_diverse(
+                model, variables, auxiliary_vars, collector, time_limit
+            )
+        
+        solver_pass2 = self._new_cp_solver(time_limit)
+        
+        # CLEF: Maintenant qu'on n'a PAS d'objectif à minimiser,
+        # on peut utiliser SearchForAllSolutions !
+        with self._timer.cp_solve('pass2', 'pass2', solver_pass2):
+            status_pass2 = solver_pass2.SearchForAllSolutions(model, collector)
+        
+        return solver_pass2.StatusName(status_pass2), solver_pass2.NumBranches(), solver_pass2.WallTime()
+    
+    def _enumerate_by_quality_bands(
+        self,
+        model: cp_model.CpModel,
+        auxiliary_vars: Dict,
+        collector: 'SolutionCollector',
+        time_limit: float
+    ) -> Tuple[str, int, float]:
+        """
+        Énumère par bandes de pénalité qualité croissante.
+        
+        score_penalty = 200 - 2*score (voir _add_quality_penalty), donc les
+        bandes croissantes de score_penalty sont des scores décroissants. On alterne:
+        1. Optimisation: plus petite bande v >= bande précédente + 1
+        2. Énumération: toutes les solutions avec score_penalty == v
+        
+        Si la limite de solutions ou le temps est atteint, les solutions
+        gardées sont donc les MEILLEURES de l'espace, pas un préfixe arbitraire.
+        """
+        score_penalty = auxiliary_vars["score_penalty"]
+        deadline = time.time() + time_limit
+        lower_bound = 0
+        num_branches = 0
+        wall_time = 0.0
+        exhausted = False
+        
+        while not collector.limit_reached:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            
+            # 1. Trouver la prochaine bande non vide
+            band_search = model.Clone()
+            band_search.Add(score_penalty >= lower_bound)
+            band_search.Minimize(score_penalty)
+            
+            solver = self._new_cp_solver(remaining, self._search_workers())
+            with self._timer.cp_solve('pass2.band', 'pass2', solver):
+                status = solver.Solve(band_search)
+            num_branches += solver.NumBranches()
+            wall_time += solver.WallTime()
+            
+            if status == cp_model.INFEASIBLE:
+                exhausted = True
+                break
+            if status != cp_model.OPTIMAL:
+                break
+            band = int(solver.Value(score_penalty))
+            
+            # 2. Énumérer toute la bande
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            band_model = model.Clone()
+            band_model.Add(score_penalty == band)
+            
+            solver = self._new_cp_solver(remaining)
+            with self._timer.cp_solve('pass2', 'pass2', solver):
+                status = solver.SearchForAllSolutions(band_model, collector)
+            num_branches += solver.NumBranches()
+            wall_time += solver.WallTime()
+            
+            if status != cp_model.OPTIMAL:
+                # Bande tronquée (limite ou temps): on s'arrête là
+                break
+            lower_bound = band + 1
+        
+        if exhausted:
+            status_name = "OPTIMAL"
+        elif collector.get_profile_count() > 0:
+            status_name = "FEASIBLE"
+        else:
+            status_name = "UNKNOWN"
+        
+        return status_name, num_branches, wall_time
+    
+    def _enumerate_diverse(
+        self,
+        model: cp_model.CpModel,
+        variables: Dict,
+        auxiliary_vars: Dict,
+        collector: 'SolutionCollector',
+        time_limit: float
+    ) -> Tuple[str, int, float]:
+        """
+        Cherche k variantes deux à deux aussi différentes que possible.
+        
+        k = max_solutions (MAX_SOLUTIONS_TO_DISPLAY si illimité), au plus
+        DIVERSE_STEP_TIME secondes par variante. Glouton max-min:
+        1. Première variante: meilleur score qualité (score_penalty minimal)
+        2. Variante suivante: maximise la distance de Hamming (sur les x) à la
+           plus proche des variantes déjà trouvées (au moins 1: variante
+           nouvelle), puis le score qualité à distance égale
+        
+        Chaque variante trouvée est rejouée (x fixés) dans le collecteur pour
+        construire la Solution comme en énumération classique.
+        
+        Returns:
+            Tuple (status, num_branches, wall_time): OPTIMAL si l'espace
+            contient moins de k variantes (toutes trouvées)
+        """
+        num_diverse = self.config.max_solutions or MAX_SOLUTIONS_TO_DISPLAY
+        score_penalty = auxiliary_vars["score_penalty"]
+        penalty_weight = max(model.Proto().variables[score_penalty.Index()].domain) + 1
+        x_vars = list(variables.values())
+        deadline = time.time() + time_limit
+        found = []
+        num_branches = 0
+        wall_time = 0.0
+        exhausted = False
+        
+        while len(found) < num_diverse and not collector.stop_requested:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            
+            step = model.Clone()
+            if found:
+                min_distance = step.NewIntVar(1, len(x_vars), "min_distance")
+                for assignment in found:
+                    step.Add(min_distance <= sum(
+                        1 - var if value else var
+                        for var, value in zip(x_vars, assignment)
+                    ))
+                step.Maximize(penalty_weight * min_distance - score_penalty)
+                for var, value in zip(x_vars, found[-1]):
+                    step.AddHint(var, value)
+            else:
+                step.Minimize(score_penalty)
+            
+            # Temps restant partagé entre les variantes restantes
+            solver = self._new_cp_solver(
+                min(DIVERSE_STEP_TIME, remaining / (num_diverse - len(found))),
+                self._search_workers()
+            )
+            with self._timer.cp_solve('pass2.diverse', 'pass2', solver):
+                status = solver.Solve(step)
+            num_branches += solver.NumBranches()
+            wall_time += solver.WallTime()
+            
+            if status == cp_model.INFEASIBLE:
+                exhausted = True
+                break
+            if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                break
+            
+            assignment = tuple(solver.Value(var) for var in x_vars)
+            found.append(assignment)
+            
+            replay = model.Clone()
+            for var, value in zip(x_vars, assignment):
+                replay.Add(var == value)
+            replay_solver = self._new_cp_solver(
+                min(DIVERSE_STEP_TIME, max(0.0, deadline - time.time()))
+            )
+            replay_solver.SearchForAllSolutions(replay, collector)
+        
+        if exhausted:
+            status_name = "OPTIMAL"
+        elif found:
+            status_name = "FEASIBLE"
+        else:
+            status_name = "UNKNOWN"
+        
+        return status_name, num_branches, wall_time
+    
+    def _enumeration_band(
+        self,
+        solver_pass1: cp_model.CpSolver,
+        auxiliary_vars_pass1: Dict,
+        auxiliary_vars_pass2: Dict
+    ) -> Optional[Tuple]:
+        """
+        Bande d'énumération PASS 2 (en plus de max_shortage == optimum).
+        
+        - 'max_shortage': pas de bande (historique, tout le reste est libre)
+        - 'objective': objectif pondéré <= optimum PASS 1 + band_epsilon
+        - 'total_shortage': total jours lésés <= total PASS 1 + band_total_shortage
+        
+        Returns:
+            (expression du modèle PASS 2, borne supérieure) ou None
+        """
+        band = self.config.enumeration_band
+        if band == 'max_shortage':
+            return None
+        if band == 'objective':
+            limit = int(solver_pass1.ObjectiveValue()) + self.config.band_epsilon
+            return auxiliary_vars_pass2["objective"], limit
+        if band == 'total_shortage':
+            optimal_total = sum(
+                solver_pass1.Value(v) for v in auxiliary_vars_pass1["wish_deviations"]
+            )
+            limit = optimal_total + self.config.band_total_shortage
+            return auxiliary_vars_pass2["total_shortage"], limit
+        raise ValueError(f"Bande d'énumération inconnue: {band}")
+    
+    def _count_solutions(
+        self,
+        model: cp_model.CpModel,
+        time_limit: float,
+        limit: int = 100000
+    ) -> Tuple[int, bool]:
+        """
+        Compte les solutions d'un modèle de satisfaction.
+        
+        Returns:
+            Tuple (nombre compté, True si le compte est exact)
+        """
+        counter = SolutionCounter(limit)
+        solver = self._new_cp_solver(time_limit)
+        status = solver.SearchForAllSolutions(model, counter)
+        exact = status in (cp_model.OPTIMAL, cp_model.INFEASIBLE) and counter.count < limit
+        return counter.count, exact
+    
+    def new_budget(self) -> TimeBudget:
+        """Échéance timeout_seconds (sans historique en mode déterministe)"""
+        history = PhaseHistory() if self.config.deterministic else None
+        directory = profile_directory(self.config)
+        profiler = SamplingProfiler(directory) if directory else None
+        return TimeBudget(self.config.timeout_seconds, history, timer=PhaseTimer(profiler))
+    
+    def _solver_profile(self) -> Dict:
+        """Paramètres CP-SAT du profil config.solver_profile"""
+        profile = SOLVER_PROFILES.get(self.config.solver_profile)
+        if profile is None:
+            raise ValueError(f"Profil de solver inconnu: {self.config.solver_profile}")
+        return profile
+    
+    def _search_workers(self) -> int:
+        """Workers des résolutions d'optimisation: cœurs de la machine, plafonnés par le profil"""
+        return max(1, min(self._solver_profile()['max_workers'], os.cpu_count() or 1))
+    
+    def _new_cp_solver(self, time_limit: float, num_workers: int = 1) -> cp_model.CpSolver:
+        """
+        CpSolver avec limite de temps, workers et graine de la config
+        
+        Mode déterministe: un seul worker (recherche séquentielle, ordre
+        reproductible) et limite aussi posée en temps déterministe. Les
+        sorties sont identiques tant qu'aucune limite en temps réel
+        (échéance globale) ne coupe la recherche.
+        """
+        seed = self.config.random_seed
+        if self.config.deterministic:
+            # Plus rapide ici que les workers entrelacés (interleave_search)
+            num_workers = 1
+            seed = DETERMINISTIC_SEED if seed is None else seed
+        
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = time_limit
+        solver.parameters.log_search_progress = False
+        solver.parameters.num_search_workers = num_workers
+        if self.config.deterministic:
+            solver.parameters.max_deterministic_time = time_limit
+        if seed is not None:
+            solver.parameters.random_seed = seed
+        
+        return solver
+    
+    def _create_pass1_solver(self, time_limit: float) -> cp_model.CpSolver:
+        """Crée le CpSolver de la PASS 1 (optimisation) avec ses paramètres"""
+        profile = self._solver_profile()
+        solver = self._new_cp_solver(time_limit, self._search_workers())
+        
+        # Paramètres du profil (config.solver_profile)
+        solver.parameters.linearization_level = profile['linearization_level']
+        solver.parameters.cp_model_presolve = True
+        solver.parameters.cp_model_probing_level = profile['cp_model_probing_level']
+        
+        # Stratégies de recherche pour éviter les blocages locaux
+        # FIXED_SEARCH suit la stratégie déclarée par _add_search_strategy
+        if self.config.search_strategy == 'portfolio':
+            solver.parameters.search_branching = cp_model.PORTFOLIO_SEARCH
+        else:
+            solver.parameters.search_branching = cp_model.FIXED_SEARCH
+        solver.parameters.optimize_with_core = profile['optimize_with_core']
+        
+        return solver
     
     def _build_model(
         self,
@@ -386,35 +1524,172 @@ class TournamentSolver:
         # === CONTRAINTES ===
         
         # 1. Contrainte de couples (un seul du couple par jour)
-        self._add_couple_constraints(model, x, participants, tournaments)
+        with self._timer.span('build.couples', 'build'):
+            self._add_couple_constraints(model, x, participants, tournaments)
         
         # 2. Contrainte d'équipes (multiples de 3 ou incomplets autorisés)
-        incomplete_penalties = self._add_team_constraints(
+        with self._timer.span('build.teams', 'build'):
+            incomplete_penalties = self._add_team_constraints(
+                model, x, participants, tournaments, auxiliary_vars
+            )
+        
+        # 3-4. Disponibilité, vœux et critères par participant
+        #      (jours joués, écarts aux vœux, fatigue >3 jours consécutifs)
+        wish_deviations, fatigue_penalties = self._add_participant_model(
             model, x, participants, tournaments, auxiliary_vars
         )
         
-        # 3. Contrainte de disponibilité
-        self._add_availability_constraints(model, x, participants, tournaments)
+        # === OBJECTIF ===
         
-        # 4. Contrainte de vœux
-        self._add_wish_constraints(model, x, participants, tournaments)
+        with self._timer.span('build.objective', 'build'):
+            objective = self._objective_expression(
+                participants, wish_deviations, fatigue_penalties,
+                incomplete_penalties, auxiliary_vars
+            )
+            model.Minimize(objective)
         
-        # === OBJECTIF ===
+        # Stratégie de branchement pour la PASS 1
+        self._add_search_strategy(model, x, participants, tournaments)
         
-        # Calculer les variables pour l'objectif
-        days_played = self._calculate_days_played(
-            model, x, participants, tournaments, auxiliary_vars
-        )
-        # Calculer les écarts aux vœux (shortage brut pour critère principal)
-        wish_deviations = self._calculate_wish_deviations(
-            model, days_played, participants, auxiliary_vars
-        )
+        return model, x, auxiliary_vars
+    
+    def _add_participant_model(
+        self,
+        model: cp_model.CpModel,
+        x: Dict,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        auxiliary_vars: Dict
+    ) -> Tuple[List, List]:
+        """
+        Contraintes et critères propres à chaque participant.
+        
+        Selon config.formulation:
+        - 'x_vars': contraintes de disponibilité/vœux sur x, puis jours joués,
+          écarts et fatigue calculés par des variables intermédiaires
+        - 'schedule_table': 1 programme admissible par participant
+          (voir _add_schedule_tables)
+        
+        Returns:
+            Tuple (wish_deviations, fatigue_penalties)
+        """
+        if self.config.formulation == 'schedule_table':
+            with self._timer.span('build.schedule_table', 'build'):
+                return self._add_schedule_tables(
+                    model, x, participants, tournaments, auxiliary_vars
+                )
+        if self.config.formulation != 'x_vars':
+            raise ValueError(f"Formulation inconnue: {self.config.formulation}")
+        
+        # Contrainte de disponibilité
+        with self._timer.span('build.availability', 'build'):
+            self._add_availability_constraints(model, x, participants, tournaments)
+        
+        # Contrainte de vœux (ne jamais dépasser + strict si demandé)
+        with self._timer.span('build.wishes', 'build'):
+            self._add_wish_constraints(model, x, participants, tournaments)
+        
+        # Jours joués
+        with self._timer.span('build.days', 'build'):
+            days_played = self._calculate_days_played(
+                model, x, participants, tournaments, auxiliary_vars
+            )
+        
+        # Écarts aux vœux (shortage brut pour critère principal)
+        with self._timer.span('build.deviations', 'build'):
+            wish_deviations = self._calculate_wish_deviations(
+                model, days_played, participants, auxiliary_vars
+            )
+        
+        # Pénalités de fatigue (>3 jours consécutifs)
+        with self._timer.span('build.fatigue', 'build'):
+            fatigue_penalties = self._calculate_fatigue_penalties(
+                model, x, participants, tournaments, auxiliary_vars
+            )
+        
+        return wish_deviations, fatigue_penalties
+    
+    def _add_schedule_tables(
+        self,
+        model: cp_model.CpModel,
+        x: Dict,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        auxiliary_vars: Dict
+    ) -> Tuple[List, List]:
+        """
+        Formulation 'schedule_table': un programme admissible par participant.
+        
+        Les programmes (voir schedules.enumerate_schedules) intègrent déjà
+        disponibilité, vœux, jours joués, manque et série max. Une contrainte
+        AddAllowedAssignments lie (x_p,t..., jours, manque, fatigue, série max)
+        à une ligne de la table: ces valeurs sont propagées, pas cherchées.
+        
+        Remplit les mêmes auxiliary_vars que la formulation 'x_vars'
+        (shortage_<nom>, max_shortage, fatigue_penalties, max_run_<nom>...).
+        """
+        run_length = self.config.fatigue_encoding == 'run_length'
+        max_shortage = model.NewIntVar(0, 9, "max_shortage")
+        deviations = []
+        fatigue_penalties = []
+        
+        for participant in participants:
+            schedules = enumerate_schedules(participant, tournaments)
+            
+            days = model.NewIntVar(0, 9, f"{participant.nom}_total_days")
+            shortage = model.NewIntVar(0, 9, f"shortage_{participant.nom}")
+            fatigue = model.NewIntVar(0, 9, f"fatigue_{participant.nom}")
+            max_run = model.NewIntVar(0, 9, f"max_run_{participant.nom}")
+            
+            row_vars = [x[(participant.nom, t.id)] for t in tournaments]
+            rows = [
+                [int(t.id in schedule.tournament_ids) for t in tournaments] + [
+                    schedule.days_played,
+                    schedule.shortage,
+                    schedule.fatigue_excess if run_length else schedule.fatigue_windows,
+                    schedule.max_run
+                ]
+                for schedule in schedules
+            ]
+            model.AddAllowedAssignments(row_vars + [days, shortage, fatigue, max_run], rows)
+            
+            deviation = model.NewIntVar(-9, 9, f"deviation_{participant.nom}")
+            model.Add(deviation == days - participant.voeux_jours_total)
+            model.Add(max_shortage >= shortage)
+            
+            # Même départage que _calculate_wish_deviations
+            weight = max(1, 6 - participant.voeux_jours_total)
+            distribution_penalty = model.NewIntVar(0, 9 * weight, f"distrib_{participant.nom}")
+            model.Add(distribution_penalty == weight * shortage)
+            
+            deviations.append(shortage)
+            fatigue_penalties.append(fatigue)
+            auxiliary_vars[f"deviation_{participant.nom}"] = deviation
+            auxiliary_vars[f"shortage_{participant.nom}"] = shortage
+            auxiliary_vars[f"weight_{participant.nom}"] = weight
+            auxiliary_vars[f"distribution_penalty_{participant.nom}"] = distribution_penalty
+            auxiliary_vars[f"max_run_{participant.nom}"] = max_run
+            auxiliary_vars[f"schedules_{participant.nom}"] = schedules
         
-        # Calculer les pénalités de fatigue (>3 jours consécutifs)
-        fatigue_penalties = self._calculate_fatigue_penalties(
-            model, x, participants, tournaments, auxiliary_vars
-        )
+        auxiliary_vars["max_shortage"] = max_shortage
+        auxiliary_vars["fatigue_penalties"] = fatigue_penalties
+        return deviations, fatigue_penalties
+    
+    def _objective_expression(
+        self,
+        participants: List[Participant],
+        wish_deviations: List,
+        fatigue_penalties: List,
+        incomplete_penalties: List,
+        auxiliary_vars: Dict
+    ):
+        """
+        Fonction objectif multi-critères de la PASS 1.
         
+        Partagée avec le modèle d'énumération pour que la bande
+        enumeration_band='objective' compare EXACTEMENT la même valeur.
+        Stockée dans auxiliary_vars["objective"].
+        """
         # CRITÈRE SECONDAIRE : Distribution (qui est lésé)
         # Récupérer les pénalités de distribution calculées
         distribution_penalties = [
@@ -436,9 +1711,71 @@ class TournamentSolver:
             sum(distribution_penalties) * 1                              # 1 - départage à égalité
         )
         
-        model.Minimize(objective)
+        auxiliary_vars["objective"] = objective
+        auxiliary_vars["wish_deviations"] = wish_deviations
+        auxiliary_vars["incomplete_penalties"] = incomplete_penalties
+        return objective
+    
+    def _add_search_strategy(
+        self,
+        model: cp_model.CpModel,
+        x: Dict,
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ):
+        """
+        Déclare l'ordre de branchement sur les variables x (PASS 1).
+        
+        Stratégies (config.search_strategy):
+        - 'default': aucune stratégie déclarée (ordre libre du solver)
+        - 'couples_strict_first': couples et vœux stricts d'abord (les plus contraints)
+        - 'largest_wishes_first': participants avec le plus de jours souhaités d'abord
+        - 'etapes_first': toutes les étapes, puis les opens
+        - 'portfolio': ordre 'couples_strict_first' + PORTFOLIO_SEARCH
         
-        return model, x, auxiliary_vars
+        Valeur essayée en premier: 1 (jouer), car l'objectif pénalise les lésions.
+        """
+        strategy = self.config.search_strategy
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"Stratégie de recherche inconnue: {strategy}")
+        
+        if strategy == 'default':
+            return
+        
+        if strategy == 'etapes_first':
+            ordered_tournaments = (
+                [t for t in tournaments if t.is_etape] +
+                [t for t in tournaments if t.is_open]
+            )
+            ordered_vars = [
+                x[(p.nom, t.id)]
+                for t in ordered_tournaments
+                for p in participants
+                if (p.nom, t.id) in x
+            ]
+        else:
+            if strategy == 'largest_wishes_first':
+                ordered_participants = sorted(
+                    participants,
+                    key=lambda p: -p.voeux_jours_total
+                )
+            else:  # 'couples_strict_first' et 'portfolio'
+                ordered_participants = sorted(
+                    participants,
+                    key=lambda p: (not p.couple, not p.respect_voeux, -p.voeux_jours_total)
+                )
+            ordered_vars = [
+                x[(p.nom, t.id)]
+                for p in ordered_participants
+                for t in tournaments
+                if (p.nom, t.id) in x
+            ]
+        
+        model.AddDecisionStrategy(
+            ordered_vars,
+            cp_model.CHOOSE_FIRST,
+            cp_model.SELECT_MAX_VALUE
+        )
     
     def _build_model_for_enumeration(
         self,
@@ -482,30 +1819,18 @@ class TournamentSolver:
         # === CONTRAINTES (MÊMES QUE PASS 1) ===
         
         # 1. Contrainte de couples
-        self._add_couple_constraints(model, x, participants, tournaments)
+        with self._timer.span('build.couples', 'build'):
+            self._add_couple_constraints(model, x, participants, tournaments)
         
         # 2. Contrainte d'équipes
-        incomplete_penalties = self._add_team_constraints(
-            model, x, participants, tournaments, auxiliary_vars
-        )
-        
-        # 3. Contrainte de disponibilité
-        self._add_availability_constraints(model, x, participants, tournaments)
-        
-        # 4. Contrainte de vœux (ne jamais dépasser + strict si demandé)
-        self._add_wish_constraints(model, x, participants, tournaments)
-        # 5. Calculer les jours joués
-        days_played = self._calculate_days_played(
-            model, x, participants, tournaments, auxiliary_vars
-        )
-        
-        # 6. Calculer les écarts aux vœux (pour contrainte de score)
-        wish_deviations = self._calculate_wish_deviations(
-            model, days_played, participants, auxiliary_vars
-        )
+        with self._timer.span('build.teams', 'build'):
+            incomplete_penalties = self._add_team_constraints(
+                model, x, participants, tournaments, auxiliary_vars
+            )
         
-        # 7. Calculer les pénalités de fatigue
-        fatigue_penalties = self._calculate_fatigue_penalties(
+        # 3-7. Disponibilité, vœux (ne jamais dépasser + strict si demandé),
+        #      jours joués, écarts aux vœux et pénalités de fatigue
+        wish_deviations, fatigue_penalties = self._add_participant_model(
             model, x, participants, tournaments, auxiliary_vars
         )
         
@@ -520,8 +1845,35 @@ class TournamentSolver:
         # CORRECTION v2.2.4 : On contraint SEULEMENT le critère dominant (max_shortage)
         # pour trouver TOUS les profils de lésés possibles
         
-        # CONTRAINTE #1 : Lésion maximale individuelle (SEULE contrainte !)
-        model.Add(max_shortage == target_max_shortage)
+        auxiliary_vars["total_shortage"] = total_shortage
+        
+        # Objectif PASS 1 (non minimisé): sert aux bandes d'énumération
+        self._objective_expression(
+            participants, wish_deviations, fatigue_penalties,
+            incomplete_penalties, auxiliary_vars
+        )
+        
+        if self._score_threshold_active():
+            # Score minimum compilé dans le modèle: l'espace énuméré est
+            # EXACTEMENT {score >= min_quality_score}. Une solution de meilleur
+            # score peut avoir un max_shortage plus élevé que l'optimum PASS 1:
+            # on ne fige donc pas max_shortage (il est borné par le score).
+            # max_shortage n'a que des bornes inférieures: l'égalité au max des
+            # shortages évite d'énumérer un même planning pour chaque valeur libre
+            if wish_deviations:
+                model.AddMaxEquality(max_shortage, wish_deviations)
+            model.Add(max_shortage >= target_max_shortage)
+            self._add_quality_penalty(model, participants, auxiliary_vars)
+            model.Add(
+                auxiliary_vars["score_penalty"] <= 200 - 2 * self.config.min_quality_score
+            )
+        else:
+            # CONTRAINTE #1 : Lésion maximale individuelle (SEULE contrainte !)
+            model.Add(max_shortage == target_max_shortage)
+            
+            # Pénalité qualité (meilleures variantes d'abord / à distance égale)
+            if self.config.enumeration_order in ('quality', 'diverse'):
+                self._add_quality_penalty(model, participants, auxiliary_vars)
         
         # CONTRAINTE #2 RETIRÉE : Total de jours lésés
         # ANCIEN: model.Add(total_shortage == target_total_shortage)
@@ -538,6 +1890,90 @@ class TournamentSolver:
         
         return model, x, auxiliary_vars
     
+    def _add_quality_penalty(
+        self,
+        model: cp_model.CpModel,
+        participants: List[Participant],
+        auxiliary_vars: Dict
+    ) -> cp_model.IntVar:
+        """
+        Encode dans le modèle le score qualité de Solution.get_quality_score().
+        
+        Hors bonus parfait et bornage 0-100:
+            score = 100 - 10*max_shortage - quality_penalty / 2
+        avec quality_penalty = 5*total_shortage + 4*nb_fatigues
+                               + 2*max(0, max_consecutifs_global - 3)
+        (pondérations ×2 pour rester en entiers).
+        score_penalty = 200 - 2*score intègre aussi le bonus parfait.
+        
+        Nécessite auxiliary_vars["total_shortage"], auxiliary_vars["max_shortage"]
+        et les jours par participant.
+        """
+        if any(f"max_run_{p.nom}" not in auxiliary_vars for p in participants):
+            self._calculate_consecutive_runs(model, participants, auxiliary_vars)
+        
+        fatigue_threshold = MAX_CONSECUTIVE_DAYS - 1
+        fatigued = []
+        max_runs = []
+        for participant in participants:
+            max_run = auxiliary_vars[f"max_run_{participant.nom}"]
+            is_fatigued = model.NewBoolVar(f"fatigued_{participant.nom}")
+            model.Add(max_run > fatigue_threshold).OnlyEnforceIf(is_fatigued)
+            model.Add(max_run <= fatigue_threshold).OnlyEnforceIf(is_fatigued.Not())
+            fatigued.append(is_fatigued)
+            max_runs.append(max_run)
+        
+        global_max_run = model.NewIntVar(0, 9, "global_max_run")
+        if max_runs:
+            model.AddMaxEquality(global_max_run, max_runs)
+        else:
+            model.Add(global_max_run == 0)
+        
+        excess = model.NewIntVar(0, 9, "global_run_excess")
+        model.AddMaxEquality(excess, [0, global_max_run - fatigue_threshold])
+        
+        total_shortage = auxiliary_vars["total_shortage"]
+        upper = 5 * 9 * len(participants) + 4 * len(participants) + 2 * 9
+        quality_penalty = model.NewIntVar(0, upper, "quality_penalty")
+        model.Add(quality_penalty == 5 * total_shortage + 4 * sum(fatigued) + 2 * excess)
+        
+        # score_penalty = 200 - 2*score (exact, bonus parfait inclus):
+        # 0 si aucun jour lésé, sinon 20*max_shortage + quality_penalty
+        is_perfect = model.NewBoolVar("is_perfect")
+        model.Add(total_shortage == 0).OnlyEnforceIf(is_perfect)
+        model.Add(total_shortage >= 1).OnlyEnforceIf(is_perfect.Not())
+        score_penalty = model.NewIntVar(0, 20 * 9 + upper, "score_penalty")
+        model.Add(score_penalty == 0).OnlyEnforceIf(is_perfect)
+        model.Add(
+            score_penalty == 20 * auxiliary_vars["max_shortage"] + quality_penalty
+        ).OnlyEnforceIf(is_perfect.Not())
+        
+        auxiliary_vars["fatigued"] = fatigued
+        auxiliary_vars["global_max_run"] = global_max_run
+        auxiliary_vars["quality_penalty"] = quality_penalty
+        auxiliary_vars["is_perfect"] = is_perfect
+        auxiliary_vars["score_penalty"] = score_penalty
+        return quality_penalty
+    
+    def _objective_weights(self) -> Dict[str, int]:
+        """Poids de l'objectif de la config (voir SolutionMatrix.objective)"""
+        return {
+            'weight_wishes': self.config.weight_wishes,
+            'weight_fatigue': self.config.weight_fatigue,
+            'weight_incomplete': self.config.weight_incomplete
+        }
+    
+    def _variant_counts_unfiltered(self) -> bool:
+        """
+        True si count_variants compte plus que l'espace PASS 2: le DP compte
+        toutes les variantes d'un profil, sans bande ni score minimum
+        """
+        return self.config.enumeration_band != 'max_shortage' or self.config.min_quality_score > 0
+    
+    def _score_threshold_active(self) -> bool:
+        """True si le score minimum doit être compilé dans le modèle PASS 2"""
+        return self.config.score_filter_in_solver and self.config.min_quality_score > 0
+    
     def _add_couple_constraints(
         self,
         model: cp_model.CpModel,
@@ -715,12 +2151,19 @@ class TournamentSolver:
         tournaments: List[Tournament],
         auxiliary_vars: Dict
     ) -> Dict[str, cp_model.IntVar]:
-        """Calcule le nombre de jours joués par participant"""
+        """Calcule le nombre de jours joués par participant
+        
+        En encodage 'run_length', les jours sont encodés de façon compacte:
+        un jour avec un seul tournoi réutilise directement la variable x
+        (aucun booléen ni contrainte réifiée), sinon day = OR des tournois.
+        """
         days_played = {}
+        compact = self.config.fatigue_encoding == 'run_length'
         
         for participant in participants:
             # Pour chaque jour, vérifier si le participant joue
             day_vars = []
+            day_map = {}  # jour du calendrier -> variable du jour
             
             for day in range(9):
                 # Tournois qui se jouent ce jour
@@ -730,8 +2173,6 @@ class TournamentSolver:
                 ]
                 
                 if tournaments_this_day:
-                    day_var = model.NewBoolVar(f"{participant.nom}_day_{day}")
-                    
                     # day_var = 1 si au moins un tournoi ce jour
                     participations_this_day = [
                         x[(participant.nom, tid)]
@@ -739,10 +2180,21 @@ class TournamentSolver:
                         if (participant.nom, tid) in x
                     ]
                     
-                    if participations_this_day:
+                    if not participations_this_day:
+                        continue
+                    
+                    if compact and len(participations_this_day) == 1:
+                        day_var = participations_this_day[0]
+                    elif compact:
+                        day_var = model.NewBoolVar(f"{participant.nom}_day_{day}")
+                        model.AddMaxEquality(day_var, participations_this_day)
+                    else:
+                        day_var = model.NewBoolVar(f"{participant.nom}_day_{day}")
                         model.Add(sum(participations_this_day) >= 1).OnlyEnforceIf(day_var)
                         model.Add(sum(participations_this_day) == 0).OnlyEnforceIf(day_var.Not())
-                        day_vars.append(day_var)
+                    
+                    day_vars.append(day_var)
+                    day_map[day] = day_var
             
             # Total de jours joués
             total_days = model.NewIntVar(0, 9, f"{participant.nom}_total_days")
@@ -750,6 +2202,7 @@ class TournamentSolver:
             
             days_played[participant.nom] = total_days
             auxiliary_vars[f"days_{participant.nom}"] = day_vars
+            auxiliary_vars[f"day_map_{participant.nom}"] = day_map
         
         return days_played
     
@@ -827,7 +2280,26 @@ class TournamentSolver:
         tournaments: List[Tournament],
         auxiliary_vars: Dict
     ) -> List[cp_model.IntVar]:
-        """Calcule les pénalités pour fatigue (>3 jours consécutifs)"""
+        """Calcule les pénalités pour fatigue (>3 jours consécutifs)
+        
+        Selon config.fatigue_encoding:
+        - 'window': 1 pénalité par fenêtre de 4 jours consécutifs joués
+        - 'run_length': max(0, série max - 3) par participant (exact)
+        
+        Les pénalités sont aussi stockées dans auxiliary_vars["fatigue_penalties"]
+        pour que le collecteur lise la MÊME valeur que l'objectif.
+        """
+        if self.config.fatigue_encoding == 'run_length':
+            self._calculate_consecutive_runs(model, participants, auxiliary_vars)
+            penalties = []
+            for participant in participants:
+                max_run = auxiliary_vars[f"max_run_{participant.nom}"]
+                excess = model.NewIntVar(0, 9, f"fatigue_{participant.nom}")
+                model.AddMaxEquality(excess, [0, max_run - (MAX_CONSECUTIVE_DAYS - 1)])
+                penalties.append(excess)
+            auxiliary_vars["fatigue_penalties"] = penalties
+            return penalties
+        
         penalties = []
         
         for participant in participants:
@@ -852,43 +2324,58 @@ class TournamentSolver:
                 
                 penalties.append(penalty)
         
+        auxiliary_vars["fatigue_penalties"] = penalties
         return penalties
-
-
-def analyze_solutions(solutions: List[Solution]) -> Dict:
-    """
-    Analyse un ensemble de solutions.
     
-    Args:
-        solutions: Liste de solutions
+    def _calculate_consecutive_runs(
+        self,
+        model: cp_model.CpModel,
+        participants: List[Participant],
+        auxiliary_vars: Dict
+    ) -> Dict[str, cp_model.IntVar]:
+        """
+        Calcule la série de jours consécutifs max par participant.
         
-    Returns:
-        Statistiques agrégées
-    """
-    if not solutions:
-        return {
-            'total': 0,
-            'perfect': 0,
-            'one_violated': 0,
-            'two_violated': 0,
-            'three_plus_violated': 0,
-            'avg_quality': 0.0
-        }
-    
-    stats = {
-        'total': len(solutions),
-        'perfect': sum(1 for s in solutions if len(s.violated_wishes) == 0),
-        'one_violated': sum(1 for s in solutions if len(s.violated_wishes) == 1),
-        'two_violated': sum(1 for s in solutions if len(s.violated_wishes) == 2),
-        'three_plus_violated': sum(1 for s in solutions if len(s.violated_wishes) >= 3),
-        'avg_quality': sum(s.get_quality_score() for s in solutions) / len(solutions),
-        'best_solution': max(solutions, key=lambda s: s.get_quality_score()),
-        'max_consecutive_days': max(s.max_consecutive_days for s in solutions)
-    }
-    
-    return stats
-
+        Contraintes de préfixe sur le calendrier (9 jours):
+        - run[d] = run[d-1] + 1 si le participant joue le jour d
+        - run[d] = 0 sinon (jour de repos ou jour sans tournoi)
+        - max_run = max(run[d])
+        
+        Même définition que Solution.get_participant_stats()['max_consecutifs'].
+        Nécessite _calculate_days_played (auxiliary_vars["day_map_<nom>"]).
+        """
+        max_runs = {}
+        
+        for participant in participants:
+            day_map = auxiliary_vars.get(f"day_map_{participant.nom}", {})
+            runs = []
+            previous_run = 0
+            
+            for day in range(9):
+                day_var = day_map.get(day)
+                if day_var is None:
+                    # Pas de tournoi ce jour: la série est coupée
+                    previous_run = 0
+                    continue
+                
+                run = model.NewIntVar(0, day + 1, f"run_{participant.nom}_{day}")
+                model.Add(run == previous_run + 1).OnlyEnforceIf(day_var)
+                model.Add(run == 0).OnlyEnforceIf(day_var.Not())
+                runs.append(run)
+                previous_run = run
+            
+            max_run = model.NewIntVar(0, 9, f"max_run_{participant.nom}")
+            if runs:
+                model.AddMaxEquality(max_run, runs)
+            else:
+                model.Add(max_run == 0)
+            
+            auxiliary_vars[f"max_run_{participant.nom}"] = max_run
+            max_runs[participant.nom] = max_run
+        
+        return max_runs
 
+    
     def explore_profile_in_depth(
         self,
         participants: List[Participant],
@@ -929,10 +2416,9 @@ def analyze_solutions(solutions: List[Solution]) -> Dict:
             mode='all'  # Mode exhaustif: toutes les variantes
         )
         
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = self.config.timeout_seconds
-        solver.parameters.log_search_progress = False
-        solver.parameters.num_search_workers = 8
+        # Énumération exacte: un seul worker (en parallèle, des variantes sont
+        # manquées ou rapportées plusieurs fois)
+        solver = self._new_cp_solver(self.config.timeout_seconds)
         
         # Énumérer TOUTES les solutions
         status = solver.SearchForAllSolutions(model, collector)
@@ -966,7 +2452,8 @@ def analyze_solutions(solutions: List[Solution]) -> Dict:
         """
         Construit un modèle OR-Tools avec contraintes DURES pour un profil spécifique.
         
-        Le profil fixe exactement combien de jours chaque participant doit jouer.
+        Le profil fixe exactement combien de jours chaque participant doit jouer
+        (jours souhaités = 2 par étape + 1 par open, voir voeux_jours_total).
         
         Args:
             participants: Liste des participants
@@ -991,24 +2478,323 @@ def analyze_solutions(solutions: List[Solution]) -> Dict:
         # === CONTRAINTES NORMALES ===
         self._add_couple_constraints(model, x, participants, tournaments)
         self._add_team_constraints(model, x, participants, tournaments, auxiliary_vars)
-        self._add_availability_constraints(model, x, participants, tournaments)
+        
+        # Disponibilité, vœux (jamais dépassés, stricts) et jours lésés
+        self._add_participant_model(model, x, participants, tournaments, auxiliary_vars)
         
         # === CONTRAINTES DURES POUR LE PROFIL ===
-        days_played = self._calculate_days_played(
-            model, x, participants, tournaments, auxiliary_vars
+        for participant in participants:
+            # Écart voulu (négatif) si le participant fait partie du profil,
+            # sinon il doit jouer exactement ses vœux
+            ecart = target_profile.get(participant.nom, 0)
+            model.Add(auxiliary_vars[f"shortage_{participant.nom}"] == -ecart)
+        
+        # max_shortage n'est que borné par les manques: le fixer pour que
+        # chaque variante ne soit énumérée qu'une fois
+        model.Add(
+            auxiliary_vars["max_shortage"] == max([0] + [-e for e in target_profile.values()])
         )
         
-        for participant in participants:
-            total_voeux = participant.voeux_etape + participant.voeux_open
+        return model, x, auxiliary_vars
+    
+    def sample_profile_variants(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        target_profile: Dict[str, int],
+        num_samples: int = 50,
+        seed: Optional[int] = None
+    ) -> Tuple[List[Solution], str, Dict]:
+        """
+        Tire des variantes quasi uniformes d'un profil, sans tout énumérer.
+        
+        Partitionnement par hachage XOR:
+        1. N = nombre exact de variantes du profil (variant_counter)
+        2. k contraintes XOR aléatoires sur les x libres du profil découpent
+           l'espace en 2^k cellules d'environ N / 2^k variantes
+           (SAMPLE_CELL_SIZE visé, XOR creux de densité SAMPLE_XOR_DENSITY)
+        3. Une cellule tirée au hasard est énumérée entièrement (elle est
+           petite) et une de ses variantes est choisie uniformément
+        4. Dédoublonnage par hash d'affectation, jusqu'à num_samples variantes
+        
+        Si N <= num_samples, toutes les variantes sont renvoyées. Après
+        SAMPLE_MAX_MISSES cellules d'affilée sans nouvelle variante (cellules
+        vides ou doublons), le tirage s'arrête avec les variantes obtenues.
+        
+        Args:
+            participants: Liste des participants
+            tournaments: Liste des tournois actifs
+            target_profile: Dict {nom: écart_voulu} (comme explore_profile_in_depth)
+            num_samples: Nombre de variantes distinctes voulues
+            seed: Graine aléatoire (hachage et solver) pour reproduire un tirage
+        
+        Returns:
+            Tuple (solutions, status, info)
+        """
+        start_time = time.time()
+        deadline = start_time + self.config.timeout_seconds
+        rng = random.Random(seed)
+        
+        model, x, _ = self._build_model_for_profile(participants, tournaments, target_profile)
+        x_vars = list(x.values())
+        hash_vars = self._profile_support(participants, tournaments, target_profile, x)
+        
+        variant_count = count_variants(
+            participants, tournaments, self.config.allow_incomplete,
+            profiles=[profile_key({nom: -ecart for nom, ecart in target_profile.items()})]
+        ).popitem()[1]
+        
+        # Cellules de ~SAMPLE_CELL_SIZE variantes (0 XOR = tout énumérer)
+        target = min(num_samples, variant_count)
+        num_xors = 0
+        if variant_count > num_samples:
+            num_xors = max(0, round(math.log2(variant_count / SAMPLE_CELL_SIZE)))
+        
+        samples = {}  # hash d'affectation -> valeurs de x
+        attempts = 0
+        misses = 0  # Tirages consécutifs sans nouvelle variante
+        while len(samples) < target and time.time() < deadline:
+            if misses >= SAMPLE_MAX_MISSES:
+                break
+            attempts += 1
+            misses += 1
+            cell = model.Clone()
+            for _ in range(num_xors):
+                subset = [
+                    v for v in hash_vars if rng.random() < SAMPLE_XOR_DENSITY
+                ] or [rng.choice(hash_vars)]
+                if rng.random() < 0.5:
+                    subset[0] = subset[0].Not()  # Parité paire
+                cell.AddBoolXOr(subset)
             
-            if participant.nom in target_profile:
-                # Ce participant fait partie du profil: contrainte DURE
-                ecart = target_profile[participant.nom]
-                jours_cibles = total_voeux + ecart  # Ex: 6 + (-1) = 5
-                model.Add(days_played[participant.nom] == jours_cibles)
-            else:
-                # Participant pas dans le profil: doit respecter exactement ses vœux
-                model.Add(days_played[participant.nom] == total_voeux)
+            collector = _AssignmentCollector(x_vars, 0 if num_xors == 0 else 4 * SAMPLE_CELL_SIZE)
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = max(0.1, deadline - time.time())
+            solver.parameters.random_seed = rng.randrange(2 ** 31)
+            solver.parameters.log_search_progress = False
+            status = solver.SearchForAllSolutions(cell, collector)
+            
+            if num_xors == 0:
+                # Espace complet énuméré: toutes les variantes
+                for assignment in collector.assignments:
+                    samples[assignment] = assignment
+                break
+            
+            if collector.limit_reached and status != cp_model.OPTIMAL:
+                # Cellule trop grosse (compte sous-estimé): découper plus fin
+                num_xors += 1
+                continue
+            if collector.assignments:
+                assignment = rng.choice(collector.assignments)
+                if assignment not in samples:
+                    samples[assignment] = assignment
+                    misses = 0
+        
+        solutions = [
+            self._solution_from_assignment(assignment, x, participants, tournaments)
+            for assignment in samples.values()
+        ]
+        if variant_count == 0:
+            status_name = "INFEASIBLE"
+        elif len(samples) >= target:
+            status_name = "OPTIMAL" if target == variant_count else "FEASIBLE"
+        else:
+            status_name = "FEASIBLE" if samples else "UNKNOWN"
         
-        return model, x, auxiliary_vars
+        info = {
+            'status': status_name,
+            'num_solutions': len(solutions),
+            'variant_count': variant_count,
+            'xor_constraints': num_xors,
+            'attempts': attempts,
+            'gave_up': misses >= SAMPLE_MAX_MISSES,
+            'elapsed_time': time.time() - start_time,
+            'mode': 'profile_sampling'
+        }
+        return solutions, status_name, info
+    
+    def explore_neighborhood(
+        self,
+        solution: Solution,
+        radius: int = 4,
+        same_profile: bool = False
+    ) -> Tuple[List[Solution], str, Dict]:
+        """
+        Énumère les variantes proches d'une solution choisie.
+        
+        Proche = distance de Hamming <= radius sur les x (échanger deux joueurs
+        d'une équipe = distance 2). La solution elle-même est exclue et sert
+        de hint au solver.
+        
+        - same_profile=False: variantes avec la même lésion max (espace PASS 2)
+        - same_profile=True: variantes du même profil de lésés
+        
+        Args:
+            solution: Solution de référence (ses participants et tournois)
+            radius: Distance de Hamming maximale
+            same_profile: Garder exactement le profil de lésés de la solution
+        
+        Returns:
+            Tuple (solutions triées par distance puis score, status, info)
+        """
+        start_time = time.time()
+        participants = solution.participants
+        tournaments = solution.tournaments
+        ecarts = {
+            p.nom: solution.get_participant_stats(p.nom)['ecart'] for p in participants
+        }
+        
+        if same_profile:
+            model, x, _ = self._build_model_for_profile(
+                participants, tournaments,
+                {nom: ecart for nom, ecart in ecarts.items() if ecart < 0}
+            )
+        else:
+            max_shortage = max([0] + [-ecart for ecart in ecarts.values()])
+            model, x, _ = self._build_model_for_enumeration(
+                participants, tournaments, max_shortage
+            )
+        
+        # Boule de Hamming autour de la solution (sans la solution)
+        played = {
+            (nom, tournament_id)
+            for tournament_id, teams in solution.assignments.items()
+            for players in teams.values()
+            for nom in players
+        }
+        distance = sum(1 - var if key in played else var for key, var in x.items())
+        model.Add(distance >= 1)
+        model.Add(distance <= radius)
+        for key, var in x.items():
+            model.AddHint(var, key in played)
+        
+        collector = SolutionCollector(
+            x, tournaments, participants, self.config.max_solutions, mode='all'
+        )
+        solver = self._new_cp_solver(self.config.timeout_seconds)
+        status = solver.SearchForAllSolutions(model, collector)
+        
+        solutions = sorted(
+            collector.get_solutions(),
+            key=lambda s: (hamming_distance(solution, s), -s.get_quality_score())
+        )
+        info = {
+            'status': solver.StatusName(status),
+            'num_solutions': len(solutions),
+            'elapsed_time': time.time() - start_time,
+            'radius': radius,
+            'distances': [hamming_distance(solution, s) for s in solutions],
+            'mode': 'neighborhood'
+        }
+        return solutions, solver.StatusName(status), info
+    
+    def _profile_support(
+        self,
+        participants: List[Participant],
+        tournaments: List[Tournament],
+        target_profile: Dict[str, int],
+        x: Dict
+    ) -> List[cp_model.IntVar]:
+        """
+        Variables x non fixées par le profil (support du hachage XOR).
+        
+        x[p, t] est libre si t fait partie d'au moins un programme admissible
+        de p avec le manque voulu, mais pas de tous. Une XOR sur des variables
+        fixées ne découpe rien.
+        """
+        support = []
+        for participant in participants:
+            shortage = -target_profile.get(participant.nom, 0)
+            schedules = [
+                s for s in enumerate_schedules(participant, tournaments)
+                if s.shortage == shortage
+            ]
+            for tournament in tournaments:
+                played = {tournament.id in s.tournament_ids for s in schedules}
+                if len(played) == 2:
+                    support.append(x[(participant.nom, tournament.id)])
+        return support or list(x.values())
+    
+    def _solution_from_assignment(
+        self,
+        assignment: Tuple[int, ...],
+        x: Dict,
+        participants: List[Participant],
+        tournaments: List[Tournament]
+    ) -> Solution:
+        """Construit la Solution d'un vecteur de valeurs (ordre de x.keys())"""
+        participants_by_name = {p.nom: p for p in participants}
+        tournaments_by_id = {t.id: t for t in tournaments}
+        solution_data = {t.id: {'M': [], 'F': [], 'All': []} for t in tournaments}
+        
+        for (nom, tid), value in zip(x.keys(), assignment):
+            if value:
+                tournament = tournaments_by_id[tid]
+                group = participants_by_name[nom].genre if tournament.is_etape else 'All'
+                solution_data[tid][group].append(nom)
+        
+        solution = Solution(
+            assignments=solution_data,
+            participants=participants,
+            tournaments=tournaments
+        )
+        solution.calculate_stats()
+        return solution
+
+
+def analyze_solutions(solutions: List[Solution]) -> Dict:
+    """
+    Analyse un ensemble de solutions.
+    
+    Args:
+        solutions: Liste de solutions
+    
+    Returns:
+        Statistiques agrégées
+    """
+    if not solutions:
+        return {
+            'total': 0,
+            'perfect': 0,
+            'one_violated': 0,
+            'two_violated': 0,
+            'three_plus_violated': 0,
+            'avg_quality': 0.0
+        }
+    
+    stats = {
+        'total': len(solutions),
+        'perfect': sum(1 for s in solutions if len(s.violated_wishes) == 0),
+        'one_violated': sum(1 for s in solutions if len(s.violated_wishes) == 1),
+        'two_violated': sum(1 for s in solutions if len(s.violated_wishes) == 2),
+        'three_plus_violated': sum(1 for s in solutions if len(s.violated_wishes) >= 3),
+        'avg_quality': sum(s.get_quality_score() for s in solutions) / len(solutions),
+        'best_solution': max(solutions, key=lambda s: s.get_quality_score()),
+        'max_consecutive_days': max(s.max_consecutive_days for s in solutions)
+    }
+    
+    return stats
+
+
+def hamming_distance(solution_a: Solution, solution_b: Solution) -> int:
+    """Nombre de (participant, tournoi) joués dans une seule des deux solutions"""
+    def played(solution):
+        return {
+            (nom, tournament_id)
+            for tournament_id, teams in solution.assignments.items()
+            for players in teams.values()
+            for nom in players
+        }
+    return len(played(solution_a) ^ played(solution_b))
+
 
+def min_pairwise_distance(solutions: List[Solution]) -> int:
+    """Plus petite distance de Hamming entre deux solutions (0 si moins de 2)"""
+    return min(
+        (
+            hamming_distance(a, b)
+            for idx, a in enumerate(solutions)
+            for b in solutions[idx + 1:]
+        ),
+        default=0
+    )
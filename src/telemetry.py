@@ -0,0 +1,110 @@
+"""
+Télémétrie de convergence du solver
+
+PASS 1: incumbent, borne et écart au fil du temps, lus dans le journal
+CP-SAT (lignes de solution #1, #2... et d'amélioration de borne #Bound).
+PASS 2: profils et solutions rencontrés au fil de l'énumération
+(collecteur). Le résultat est dans info['convergence']: une dernière
+amélioration très tôt devant la tranche allouée veut dire qu'un timeout
+plus court aurait donné le même résultat.
+"""
+from typing import Dict, List, Optional
+import re
+
+from src.time_budget import relative_gap
+
+# Ligne de progression CP-SAT: "#3       0.02s best:212016 next:[200000,212015] main"
+PROGRESS_LOG = re.compile(r'^#(\d+|Bound)\s+([\d.]+)s\s+best:(\S+)\s+next:\[([^,\]]*)')
+
+# Intervalle minimal entre deux points PASS 2 (sinon un point par solution)
+PASS2_SAMPLE_SECONDS = 0.1
+
+
+class ConvergenceTelemetry:
+    """
+    Séries temporelles de convergence d'un solve
+    
+    Utilisation:
+        telemetry = ConvergenceTelemetry()
+        with timer.cp_solve('pass1', 'pass1', cp_solver, on_log=telemetry.on_pass1_log):
+            cp_solver.Solve(model)
+        telemetry.finish_pass1(cp_solver, time_limit)
+        ... collecteur: telemetry.on_pass2_solution(elapsed, profils, solutions)
+        info['convergence'] = telemetry.to_info()
+    """
+    
+    def __init__(self):
+        # PASS 1: {time, objective, bound, gap}, temps du solver (s)
+        self.pass1: List[Dict] = []
+        # PASS 2: {time, profiles, solutions} cumulés, temps du collecteur (s)
+        self.pass2: List[Dict] = []
+        self.pass1_time_limit: Optional[float] = None
+        self.pass2_time_limit: Optional[float] = None
+        self._pass1_last_improvement: Optional[float] = None
+        self._pass2_last_new_profile: Optional[float] = None
+        self._last_profiles = 0
+    
+    def on_pass1_log(self, line: str):
+        """Ligne du journal CP-SAT de la PASS 1 (autres lignes ignorées)"""
+        match = PROGRESS_LOG.match(line)
+        if match is None:
+            return
+        kind, seconds, best, low = match.groups()
+        # Le "best" des lignes #Bound peut être en retard sur les lignes de
+        # solution (sous-solvers): l'incumbent ne vient que des lignes #N
+        objective = self._last_pass1('objective')
+        if kind != 'Bound' and best != 'inf':
+            objective = float(best)
+            self._pass1_last_improvement = float(seconds)
+        bound = float(low) if low else self._last_pass1('bound')
+        self._add_pass1(float(seconds), objective, bound)
+    
+    def finish_pass1(self, cp_solver, time_limit: float):
+        """Point final de la PASS 1 (incumbent et borne du solver)"""
+        self.pass1_time_limit = time_limit
+        objective = self._last_pass1('objective')
+        if objective is not None:
+            objective = cp_solver.ObjectiveValue()
+        self._add_pass1(cp_solver.WallTime(), objective, cp_solver.BestObjectiveBound())
+    
+    def on_pass2_solution(self, elapsed: float, profiles: int, solutions: int):
+        """Solution rencontrée en PASS 2 (un point par PASS2_SAMPLE_SECONDS au plus)"""
+        if profiles > self._last_profiles:
+            self._last_profiles = profiles
+            self._pass2_last_new_profile = elapsed
+        if self.pass2 and elapsed - self.pass2[-1]['time'] < PASS2_SAMPLE_SECONDS:
+            return
+        self.pass2.append({'time': elapsed, 'profiles': profiles, 'solutions': solutions})
+    
+    def finish_pass2(self, elapsed: float, profiles: int, solutions: int, time_limit: float):
+        """Point final de la PASS 2 (fin de l'énumération)"""
+        self.pass2_time_limit = time_limit
+        self.on_pass2_solution(elapsed, profiles, solutions)
+        if self.pass2[-1]['time'] != elapsed:
+            self.pass2.append({'time': elapsed, 'profiles': profiles, 'solutions': solutions})
+    
+    def to_info(self) -> Dict:
+        """Séries et indicateurs résumés pour info['convergence']"""
+        info = {
+            'pass1': list(self.pass1),
+            'pass2': list(self.pass2),
+            'pass1_time_limit': self.pass1_time_limit,
+            'pass2_time_limit': self.pass2_time_limit,
+            'pass1_last_improvement': self._pass1_last_improvement,
+            'pass1_final_gap': self._last_pass1('gap'),
+            'pass2_last_new_profile': self._pass2_last_new_profile,
+        }
+        if self.pass2 and self.pass2[-1]['time'] > 0:
+            last = self.pass2[-1]
+            info['pass2_solutions_per_second'] = last['solutions'] / last['time']
+            info['pass2_profiles_per_second'] = last['profiles'] / last['time']
+        return info
+    
+    def _last_pass1(self, key: str):
+        return self.pass1[-1][key] if self.pass1 else None
+    
+    def _add_pass1(self, seconds: float, objective: Optional[float], bound: Optional[float]):
+        gap = None
+        if objective is not None and bound is not None:
+            gap = relative_gap(objective, bound)
+        self.pass1.append({'time': seconds, 'objective': objective, 'bound': bound, 'gap': gap})
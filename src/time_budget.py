@@ -0,0 +1,176 @@
+"""
+Répartition du temps de calcul entre les passes (PASS 1, PASS 2, sondes)
+
+Une seule échéance (timeout_seconds) est partagée par toutes les phases
+d'un solve, et de solve_multipass: chaque phase reçoit une tranche du temps
+restant, jamais plus. La tranche PASS 1 s'allonge quand les durées
+observées sur des instances de même taille (PhaseHistory) dépassent le
+min(30, timeout/3) historique.
+
+Le budget porte aussi le PhaseTimer du calcul (spans des phases, voir
+src/timing.py), partagé de la même façon par les sous-budgets.
+"""
+from typing import Dict, List, Optional, Tuple
+import time
+
+from src.timing import PhaseTimer
+
+# PASS 1 sans historique: tranche historique min(30, restant / 3)
+PASS1_DEFAULT_SHARE = 1 / 3
+PASS1_DEFAULT_MAX = 30.0
+
+# PASS 1 ne prend jamais plus de la moitié du restant (la PASS 2 en a besoin)
+PASS1_MAX_SHARE = 0.5
+
+# Marge sur une durée observée; une PASS 1 coupée avant preuve compte double
+HISTORY_MARGIN = 2.0
+
+# Poids d'une nouvelle mesure dans la moyenne mobile de l'historique
+HISTORY_ALPHA = 0.5
+
+# Sondes de relaxation: plafond par sonde (historique) et part du restant
+PROBE_MAX_SECONDS = 5.0
+PROBE_SHARE = 0.5
+
+# Dénombrement du complément de la bande PASS 2: plafond (historique) et part
+BAND_COUNT_MAX_SECONDS = 10.0
+BAND_COUNT_SHARE = 0.1
+
+# Matérialisation après la PASS 2 (tri des solutions, info): part du restant, plafond
+MATERIALIZE_MAX_SECONDS = 1.0
+MATERIALIZE_SHARE = 0.02
+
+# Plus petite tranche donnée à une phase (CP-SAT rend alors son incumbent),
+# si l'échéance le permet: aucune tranche ne la dépasse
+MIN_PHASE_SECONDS = 0.05
+
+
+def relative_gap(objective: float, bound: float) -> float:
+    """Écart relatif entre incumbent et borne (0 = optimum prouvé)"""
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
+class PhaseHistory:
+    """Durées observées par phase et taille d'instance (moyenne mobile)"""
+    
+    def __init__(self):
+        self._durations: Dict[Tuple[str, int], float] = {}
+    
+    @staticmethod
+    def size_bucket(size: int) -> int:
+        """Tailles regroupées par puissance de 2 (nombre de variables x)"""
+        return int(size).bit_length()
+    
+    def expected(self, phase: str, size: int) -> Optional[float]:
+        """Durée attendue de la phase, None si jamais observée à cette taille"""
+        return self._durations.get((phase, self.size_bucket(size)))
+    
+    def record(self, phase: str, size: int, seconds: float):
+        key = (phase, self.size_bucket(size))
+        previous = self._durations.get(key)
+        if previous is None:
+            self._durations[key] = seconds
+        else:
+            self._durations[key] = HISTORY_ALPHA * seconds + (1 - HISTORY_ALPHA) * previous
+    
+    def clear(self):
+        self._durations.clear()
+
+
+# Historique partagé par les solves du processus (reruns Streamlit compris)
+PHASE_HISTORY = PhaseHistory()
+
+
+class TimeBudget:
+    """
+    Échéance globale d'un calcul, découpée en tranches par phase
+    
+    Utilisation:
+        budget = TimeBudget(config.timeout_seconds)
+        solver.parameters.max_time_in_seconds = budget.pass1(size)
+        budget.record_pass1(size, solver.WallTime(), gap)
+        ... budget.pass2(), budget.child(budget.probe(n)) pour une sonde
+        ... with budget.timer.span('probe', 'multipass'): mesure d'une phase
+    """
+    
+    def __init__(
+        self,
+        total_seconds: float,
+        history: Optional[PhaseHistory] = None,
+        deadline: Optional[float] = None,
+        timer: Optional[PhaseTimer] = None
+    ):
+        self.deadline = time.time() + total_seconds if deadline is None else deadline
+        self.history = PHASE_HISTORY if history is None else history
+        self.timer = PhaseTimer() if timer is None else timer
+        self.allocations: List[Tuple[str, float]] = []
+    
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.time())
+    
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+    
+    def child(self, seconds: float) -> 'TimeBudget':
+        """Sous-budget (sonde, relaxation) qui ne dépasse pas l'échéance globale"""
+        return TimeBudget(
+            0.0,
+            history=self.history,
+            deadline=min(self.deadline, time.time() + seconds),
+            timer=self.timer
+        )
+    
+    def allot(self, phase: str, seconds: float) -> float:
+        """Tranche de la phase, bornée par le temps restant (échéance stricte)"""
+        seconds = min(max(MIN_PHASE_SECONDS, seconds), self.remaining())
+        self.allocations.append((phase, seconds))
+        return seconds
+    
+    def pass1(self, size: int) -> float:
+        """
+        Tranche PASS 1 pour une instance de size variables x: min(30, restant / 3),
+        allongée jusqu'à la durée observée à cette taille (avec marge)
+        
+        Jamais raccourcie: une PASS 1 coupée avant la preuve fixerait une
+        lésion max sous-optimale pour toute la PASS 2.
+        """
+        remaining = self.remaining()
+        seconds = min(PASS1_DEFAULT_MAX, remaining * PASS1_DEFAULT_SHARE)
+        expected = self.history.expected('pass1', size)
+        if expected is not None:
+            seconds = max(seconds, expected * HISTORY_MARGIN)
+        return self.allot('pass1', min(seconds, remaining * PASS1_MAX_SHARE))
+    
+    def record_pass1(self, size: int, seconds: float, gap: float):
+        """
+        Enregistre une PASS 1; gap > 0 (optimum non prouvé, tranche trop
+        courte) compte double pour que la prochaine tranche soit plus longue
+        """
+        if gap > 0:
+            seconds *= HISTORY_MARGIN
+        self.history.record('pass1', size, seconds)
+    
+    def pass2(self, reserve: float = 0.0) -> float:
+        """
+        Tranche PASS 2: le temps restant, moins reserve (phase suivante) et
+        la matérialisation des solutions
+        """
+        return self.allot('pass2', self.remaining() - reserve - self.materialize_reserve())
+    
+    def materialize_reserve(self) -> float:
+        """Temps gardé avant l'échéance pour matérialiser les solutions (tri, info)"""
+        return min(MATERIALIZE_MAX_SECONDS, self.remaining() * MATERIALIZE_SHARE)
+    
+    def band_count_reserve(self) -> float:
+        """Temps gardé après la PASS 2 pour dénombrer le complément de la bande"""
+        return min(BAND_COUNT_MAX_SECONDS, self.remaining() * BAND_COUNT_SHARE)
+    
+    def band_count(self) -> float:
+        """Tranche du dénombrement de la bande: le restant, moins la matérialisation"""
+        return self.allot('band_count', self.remaining() - self.materialize_reserve())
+    
+    def probe(self, probes_left: int) -> float:
+        """Tranche d'une sonde: part égale de PROBE_SHARE du restant, plafonnée"""
+        share = self.remaining() * PROBE_SHARE / max(1, probes_left)
+        return self.allot('probe', min(PROBE_MAX_SECONDS, share))
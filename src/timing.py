@@ -0,0 +1,164 @@
+"""
+Spans de temps des phases d'un calcul (construction, passes, collecteur, sondes)
+
+Un PhaseTimer est porté par le TimeBudget du calcul: solve, sondes et
+relaxations de solve_multipass écrivent dans la même chronologie. Les spans
+sont renvoyés dans info['timings'] (et cumulés par nom dans
+info['timing_summary']); SolverConfig.timing_trace_path les écrit au format
+Chrome trace (chrome://tracing, Perfetto). Avec un SamplingProfiler
+(src/profiler.py), chaque span est aussi une phase du profil.
+"""
+from typing import Dict, List, Optional
+from contextlib import contextmanager, nullcontext
+import json
+import threading
+import time
+
+from src.profiler import SamplingProfiler
+
+# Ligne du journal CP-SAT qui marque la fin du presolve
+SEARCH_START_LOG = "Starting search at"
+
+
+class PhaseTimer:
+    """
+    Chronologie des phases d'un calcul
+    
+    Utilisation:
+        timer = PhaseTimer()
+        with timer.span('build.couples', 'pass1'):
+            ...
+        with timer.cp_solve('pass1', 'pass1', cp_solver):
+            cp_solver.Solve(model)  # spans pass1.presolve et pass1.search
+        timer.accumulate('collector.callback', 'pass2', seconds)  # appels répétés
+    """
+    
+    def __init__(self, profiler: Optional[SamplingProfiler] = None):
+        self.origin = time.perf_counter()
+        # Profileur opt-in (config.profile_dir): une phase par span
+        self.profiler = profiler
+        self._spans: List[Dict] = []
+        # Phases très répétées (callbacks): un seul span cumulé par nom
+        self._aggregates: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, name: str, category: str, start: float, duration: float, **args):
+        """Span mesuré par l'appelant (start: time.perf_counter())"""
+        with self._lock:
+            self._spans.append({
+                'name': name,
+                'category': category,
+                'start': start - self.origin,
+                'duration': duration,
+                'thread': threading.get_ident(),
+                'args': args
+            })
+    
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        """Span du bloc with"""
+        start = time.perf_counter()
+        try:
+            with self.profiled(name):
+                yield
+        finally:
+            self.add(name, category, start, time.perf_counter() - start, **args)
+    
+    def profiled(self, name: str):
+        """Phase name du profileur (sans mesure de span); sans effet sans profileur"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+    
+    def accumulate(self, name: str, category: str, seconds: float):
+        """Ajoute seconds au span cumulé name (un appel de plus)"""
+        with self._lock:
+            aggregate = self._aggregates.get(name)
+            if aggregate is None:
+                self._aggregates[name] = {
+                    'name': name,
+                    'category': category,
+                    'start': time.perf_counter() - seconds - self.origin,
+                    'duration': seconds,
+                    'thread': threading.get_ident(),
+                    'args': {'calls': 1, 'aggregated': True}
+                }
+            else:
+                aggregate['duration'] += seconds
+                aggregate['args']['calls'] += 1
+    
+    @contextmanager
+    def cp_solve(self, name: str, category: str, cp_solver, on_log=None, **args):
+        """
+        Solve CP-SAT du bloc with, découpé en spans name.presolve et
+        name.search: la fin du presolve est l'instant où le journal CP-SAT
+        annonce le début de la recherche (journal capturé, pas affiché).
+        on_log reçoit aussi chaque ligne (télémétrie de convergence).
+        """
+        search_start = []
+        
+        def log_line(line: str):
+            if not search_start and line.startswith(SEARCH_START_LOG):
+                search_start.append(time.perf_counter())
+            if on_log is not None:
+                on_log(line)
+        
+        cp_solver.parameters.log_search_progress = True
+        cp_solver.parameters.log_to_stdout = False
+        cp_solver.log_callback = log_line
+        start = time.perf_counter()
+        try:
+            with self.profiled(name):
+                yield
+        finally:
+            end = time.perf_counter()
+            # Pas de ligne (arrêt pendant le presolve): tout compte en presolve
+            split = search_start[0] if search_start else end
+            self.add(f"{name}.presolve", category, start, split - start, **args)
+            self.add(f"{name}.search", category, split, end - split, **args)
+    
+    @property
+    def spans(self) -> List[Dict]:
+        """Spans par ordre de début (cumulés compris)"""
+        with self._lock:
+            spans = self._spans + [dict(a, args=dict(a['args'])) for a in self._aggregates.values()]
+        return sorted(spans, key=lambda s: s['start'])
+    
+    def summary(self) -> Dict[str, float]:
+        """Durée totale par nom de span"""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span['name']] = totals.get(span['name'], 0.0) + span['duration']
+        return totals
+    
+    def to_chrome_trace(self) -> Dict:
+        """Événements 'complets' (ph X) du format Chrome trace, en microsecondes"""
+        return {
+            'traceEvents': [
+                {
+                    'name': span['name'],
+                    'cat': span['category'],
+                    'ph': 'X',
+                    'ts': span['start'] * 1e6,
+                    'dur': span['duration'] * 1e6,
+                    'pid': 1,
+                    'tid': span['thread'],
+                    'args': span['args']
+                }
+                for span in self.spans
+            ],
+            'displayTimeUnit': 'ms'
+        }
+    
+    def write_chrome_trace(self, path: Optional[str]):
+        """Écrit la chronologie au format Chrome trace (rien si path est vide)"""
+        if not path:
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+    
+    def write_profile(self, run_name: str) -> Optional[str]:
+        """Écrit les piles du profileur (chemin du fichier, None sans profileur)"""
+        if self.profiler is None:
+            return None
+        return self.profiler.write(run_name)
@@ -0,0 +1,249 @@
+"""
+Comptage exact des variantes par profil de lésés (sans construire de Solution)
+"""
+from typing import List, Dict, Tuple, Optional, Iterable
+from collections import Counter, defaultdict
+from itertools import product
+
+from src.models import Participant, Tournament
+from src.schedules import enumerate_schedules
+from src.constants import TEAM_SIZE
+
+# Profil de lésés: ((nom, jours lésés), ...) trié par jours décroissants puis nom
+# (même clé que l'affichage des profils dans app.py)
+ProfileKey = Tuple[Tuple[str, int], ...]
+
+
+def profile_key(shortages: Dict[str, int]) -> ProfileKey:
+    """Clé canonique d'un profil à partir des jours lésés par participant"""
+    return tuple(sorted(
+        ((nom, days) for nom, days in shortages.items() if days > 0),
+        key=lambda item: (-item[1], item[0])
+    ))
+
+
+def solution_profile_key(solution) -> ProfileKey:
+    """Clé de profil d'une Solution"""
+    return profile_key({
+        p.nom: -solution.get_participant_stats(p.nom)['ecart']
+        for p in solution.participants
+    })
+
+
+def count_variants(
+    participants: List[Participant],
+    tournaments: List[Tournament],
+    allow_incomplete: bool = False,
+    profiles: Optional[Iterable[ProfileKey]] = None
+) -> Dict[ProfileKey, int]:
+    """
+    Compte exactement les variantes (affectations admissibles) de chaque profil.
+    
+    Programmation dynamique sur les participants (les couples sont traités
+    ensemble pour respecter l'exclusion par jour):
+    - chaque participant choisit un programme admissible (schedules.py)
+    - état = reste modulo TEAM_SIZE de chaque (tournoi, genre) + profil partiel
+    - un (tournoi, genre) est fermé dès que plus personne ne peut y jouer:
+      les états avec un reste non nul y sont éliminés (équipes complètes)
+    
+    Les participants sont ordonnés femmes, couples, hommes pour fermer les
+    étapes féminines tôt. Les comptes sont des entiers exacts (millions ou plus).
+    
+    Args:
+        participants: Liste des participants
+        tournaments: Liste des tournois actifs
+        allow_incomplete: Même sens que SolverConfig.allow_incomplete
+        profiles: Profils à compter (tous si None). Restreindre aux profils
+            affichés élague fortement l'espace d'états.
+    
+    Returns:
+        Dict profil -> nombre de variantes
+    """
+    slots = [
+        (t.id, genre) for t in tournaments if t.is_etape for genre in ('F', 'M')
+    ] + [(t.id, 'All') for t in tournaments if t.is_open]
+    slot_index = {slot: idx for idx, slot in enumerate(slots)}
+    
+    components = _couple_components(participants)
+    order = [p.nom for component, _ in components for p in component]
+    
+    targets = None
+    if profiles is not None:
+        targets = [dict(profile) for profile in profiles]
+        if not targets:
+            return {}
+    
+    # Fermeture des slots: index du dernier composant pouvant y jouer
+    last_component = {}
+    for idx, (component, _) in enumerate(components):
+        for participant in component:
+            for t in tournaments:
+                slot = (t.id, participant.genre if t.is_etape else 'All')
+                last_component[slot] = idx
+    
+    # État: profil partiel -> {restes par slot -> nombre de variantes}
+    states = {(): {(0,) * len(slots): 1}}
+    processed = 0
+    
+    for idx, (component, pairs) in enumerate(components):
+        options = _component_options(
+            component, pairs, tournaments, slot_index, len(slots), targets
+        )
+        processed += len(component)
+        prefixes = _target_prefixes(targets, order[:processed]) if targets else None
+        closing = [
+            slot_index[slot] for slot, last in last_component.items() if last == idx
+        ] if not allow_incomplete else []
+        transitions = {}  # (restes, incréments) -> nouveaux restes (None si slot fermé incomplet)
+        
+        next_states = defaultdict(lambda: defaultdict(int))
+        for partial, residue_counts in states.items():
+            for shortages, deltas in options.items():
+                new_partial = partial + shortages
+                if prefixes is not None and new_partial not in prefixes:
+                    continue
+                
+                target_counts = next_states[new_partial]
+                for residues, count in residue_counts.items():
+                    for delta, multiplicity in deltas.items():
+                        if allow_incomplete:
+                            new_residues = residues
+                        else:
+                            key = (residues, delta)
+                            if key not in transitions:
+                                transitions[key] = _add_residues(residues, delta, closing)
+                            new_residues = transitions[key]
+                            if new_residues is None:
+                                continue
+                        target_counts[new_residues] += count * multiplicity
+        states = next_states
+    
+    counts = defaultdict(int)
+    for partial, residue_counts in states.items():
+        counts[profile_key(dict(partial))] += sum(residue_counts.values())
+    
+    if targets is not None:
+        wanted = {profile_key(target) for target in targets}
+        return {key: counts.get(key, 0) for key in wanted}
+    return dict(counts)
+
+
+def _couple_components(
+    participants: List[Participant]
+) -> List[Tuple[List[Participant], List[Tuple[str, str]]]]:
+    """
+    Regroupe les participants liés par un couple (composantes connexes).
+    
+    Returns:
+        Liste de (membres, paires de couple), triée femmes seules,
+        composantes mixtes, puis hommes seuls
+    """
+    by_name = {p.nom: p for p in participants}
+    parent = {p.nom: p.nom for p in participants}
+    
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+    
+    pairs = set()
+    for participant in participants:
+        if participant.couple and participant.couple in by_name:
+            pair = tuple(sorted([participant.nom, participant.couple]))
+            pairs.add(pair)
+            parent[find(pair[0])] = find(pair[1])
+    
+    groups = defaultdict(list)
+    for participant in participants:
+        groups[find(participant.nom)].append(participant)
+    
+    components = [
+        (members, sorted(pair for pair in pairs if pair[0] in {m.nom for m in members}))
+        for members in groups.values()
+    ]
+    
+    def rank(component):
+        genres = {p.genre for p in component[0]}
+        return 0 if genres == {'F'} else 2 if genres == {'M'} else 1
+    
+    return sorted(components, key=rank)
+
+
+def _component_options(
+    component: List[Participant],
+    pairs: List[Tuple[str, str]],
+    tournaments: List[Tournament],
+    slot_index: Dict,
+    num_slots: int,
+    targets: Optional[List[Dict[str, int]]]
+) -> Dict[Tuple, Counter]:
+    """
+    Choix possibles d'une composante, agrégés avec leur multiplicité.
+    
+    Returns:
+        Dict jours lésés des membres lésés -> Counter(incréments par slot -> nombre)
+    """
+    days = {t.id: set(t.days) for t in tournaments}
+    member_schedules = []
+    for participant in component:
+        schedules = enumerate_schedules(participant, tournaments)
+        if targets is not None:
+            allowed = {target.get(participant.nom, 0) for target in targets}
+            schedules = [s for s in schedules if s.shortage in allowed]
+        member_schedules.append(schedules)
+    
+    options = defaultdict(Counter)
+    for combination in product(*member_schedules):
+        chosen = {p.nom: s for p, s in zip(component, combination)}
+        
+        # Couple: jamais le même jour
+        if any(
+            _played_days(chosen[a], days) & _played_days(chosen[b], days)
+            for a, b in pairs
+        ):
+            continue
+        
+        delta = [0] * num_slots
+        shortages = ()
+        for participant, schedule in zip(component, combination):
+            for t in tournaments:
+                if t.id in schedule.tournament_ids:
+                    slot = (t.id, participant.genre if t.is_etape else 'All')
+                    delta[slot_index[slot]] += 1
+            if schedule.shortage:
+                shortages += ((participant.nom, schedule.shortage),)
+        
+        options[shortages][tuple(delta)] += 1
+    
+    return options
+
+
+def _add_residues(
+    residues: Tuple[int, ...],
+    delta: Tuple[int, ...],
+    closing: List[int]
+) -> Optional[Tuple[int, ...]]:
+    """Ajoute des joueurs aux restes; None si un slot fermé reste incomplet"""
+    new_residues = tuple((r + d) % TEAM_SIZE for r, d in zip(residues, delta))
+    if any(new_residues[i] for i in closing):
+        return None
+    return new_residues
+
+
+def _played_days(schedule, days: Dict[str, set]) -> set:
+    """Jours du calendrier joués par un programme"""
+    return set().union(*(days[tid] for tid in schedule.tournament_ids))
+
+
+def _target_prefixes(
+    targets: List[Dict[str, int]],
+    processed: List[str]
+) -> set:
+    """Profils partiels (participants déjà traités) compatibles avec une cible"""
+    return {
+        tuple(
+            (nom, target[nom]) for nom in processed if target.get(nom, 0) > 0
+        )
+        for target in targets
+    }
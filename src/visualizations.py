@@ -513,3 +513,83 @@ def create_statistics_overview(solutions: List[Solution]) -> go.Figure:
     )
     
     return fig
+
+
+def create_convergence_chart(convergence: Dict) -> go.Figure:
+    """
+    Convergence du solver: incumbent et borne de la PASS 1, profils et
+    solutions cumulés de la PASS 2 (info['convergence'], voir src/telemetry.py)
+    
+    Args:
+        convergence: Télémétrie du calcul
+    
+    Returns:
+        Figure Plotly
+    """
+    if not convergence or not (convergence.get('pass1') or convergence.get('pass2')):
+        fig = go.Figure()
+        fig.add_annotation(
+            text="Aucune télémétrie disponible",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False
+        )
+        return fig
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('PASS 1: Optimisation', 'PASS 2: Énumération'),
+        specs=[[{}, {'secondary_y': True}]]
+    )
+    
+    pass1 = [p for p in convergence.get('pass1', []) if p['objective'] is not None]
+    times = [p['time'] for p in pass1]
+    fig.add_trace(go.Scatter(
+        name='Meilleure solution',
+        x=times,
+        y=[p['objective'] for p in pass1],
+        mode='lines+markers',
+        line={'shape': 'hv', 'color': '#3498db'}
+    ), row=1, col=1)
+    fig.add_trace(go.Scatter(
+        name='Borne',
+        x=times,
+        y=[p['bound'] for p in pass1],
+        mode='lines',
+        line={'shape': 'hv', 'color': '#95a5a6', 'dash': 'dash'}
+    ), row=1, col=1)
+    
+    pass2 = convergence.get('pass2', [])
+    fig.add_trace(go.Scatter(
+        name='Profils',
+        x=[p['time'] for p in pass2],
+        y=[p['profiles'] for p in pass2],
+        mode='lines',
+        line={'shape': 'hv', 'color': '#2ecc71'}
+    ), row=1, col=2)
+    fig.add_trace(go.Scatter(
+        name='Solutions',
+        x=[p['time'] for p in pass2],
+        y=[p['solutions'] for p in pass2],
+        mode='lines',
+        line={'shape': 'hv', 'color': '#f39c12', 'dash': 'dot'}
+    ), row=1, col=2, secondary_y=True)
+    
+    # Tranches allouées: une courbe plate bien avant la limite = timeout trop long
+    for col, key in ((1, 'pass1_time_limit'), (2, 'pass2_time_limit')):
+        if convergence.get(key):
+            fig.add_vline(
+                x=convergence[key], line_dash='dot', line_color='#e74c3c',
+                row=1, col=col
+            )
+    
+    fig.update_xaxes(title_text='Temps (s)')
+    fig.update_yaxes(title_text='Objectif', row=1, col=1)
+    fig.update_yaxes(title_text='Profils', row=1, col=2)
+    fig.update_yaxes(title_text='Solutions', row=1, col=2, secondary_y=True)
+    fig.update_layout(
+        title='📈 Convergence du Solver',
+        height=350,
+        showlegend=True
+    )
+    
+    return fig
@@ -0,0 +1,37 @@
+"""
+Fixtures partagées des tests
+"""
+import pytest
+
+from src.models import Participant
+from benchmarks.corpus import default_participants, active_tournaments
+
+
+def conflict_roster_participants():
+    """6 participants qui ne peuvent pas tous être satisfaits (sans O3)"""
+    return [
+        Participant("Alice", "F", None, 2, 1, "O3", False),
+        Participant("Betty", "F", "Dan", 2, 1, "O3", False),
+        Participant("Clara", "F", None, 3, 1, "O3", False),
+        Participant("Dan", "M", "Betty", 2, 0, "O3", False),
+        Participant("Ed", "M", None, 1, 1, "O3", False),
+        Participant("Fred", "M", None, 3, 2, "O3", False),
+    ]
+
+
+@pytest.fixture
+def conflict_roster():
+    """Roster de conflit (6 participants)"""
+    return conflict_roster_participants()
+
+
+@pytest.fixture
+def tournaments_sans_o3():
+    """Tournois par défaut sans O3"""
+    return active_tournaments(False)
+
+
+@pytest.fixture
+def default_instance():
+    """Participants et tournois (sans O3) par défaut de l'application"""
+    return default_participants(), active_tournaments(False)
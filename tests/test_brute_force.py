@@ -0,0 +1,77 @@
+"""
+Tests différentiels contre l'oracle par force brute (src/brute_force.py)
+"""
+import pytest
+from src.brute_force import brute_force_profiles, MAX_BRUTE_FORCE_CELLS
+from src.models import Participant, Tournament
+from src.variant_counter import count_variants
+from benchmarks.bench_oracle import ORACLE_MODES, oracle_instances, run_mode, matches_oracle
+from benchmarks.generator import generate_roster
+
+# Une instance à équipes complètes et une à équipes incomplètes
+INSTANCES = {name: instance for name, *instance in oracle_instances()}
+DIFFERENTIAL_INSTANCES = ['couple_strict_incomplet', 'genere_0_complet']
+# Vœu baissé par l'édition rejouée: variantes gardées ET delta non vide
+# (genere_16: delta sous l'ancienne lésion max, énuméré deux fois avant correction)
+INCREMENTAL_INSTANCES = ['genere_0_incomplet', 'genere_16_incomplet']
+
+
+def test_oracle_small_case():
+    """3 joueuses veulent 1 étape: une seule variante, personne n'est lésé"""
+    participants = [
+        Participant(nom, "F", None, 1, 0, "E1", False) for nom in ("Alice", "Betty", "Clara")
+    ]
+    tournaments = [Tournament('E1', 'Étape 1', 'TEST', "etape", [0, 1], ['J1', 'J2'])]
+    
+    oracle = brute_force_profiles(participants, tournaments)
+    
+    assert oracle.num_assignments == 8
+    assert oracle.optimal_max_shortage == 0
+    assert oracle.profile_counts == {(): 1}
+    # Équipes incomplètes: les 8 affectations sont admissibles
+    assert brute_force_profiles(participants, tournaments, allow_incomplete=True).num_feasible == 8
+
+
+def test_oracle_infeasible_and_too_large(tournaments_sans_o3):
+    """Aucune affectation admissible: optimum None; trop de cases: ValueError"""
+    participants, tournaments, allow_incomplete = INSTANCES['couple_strict_complet']
+    assert brute_force_profiles(participants, tournaments, allow_incomplete).optimal_max_shortage is None
+    
+    with pytest.raises(ValueError):
+        brute_force_profiles(generate_roster(MAX_BRUTE_FORCE_CELLS, seed=0), tournaments_sans_o3)
+
+
+@pytest.mark.parametrize("name", [n for n in INSTANCES if INSTANCES[n][2]])
+def test_oracle_matches_variant_counter(name):
+    """Comptes de l'oracle == programmation dynamique (variant_counter)"""
+    participants, tournaments, allow_incomplete = INSTANCES[name]
+    oracle = brute_force_profiles(participants, tournaments, allow_incomplete)
+    
+    counts = count_variants(participants, tournaments, allow_incomplete, profiles=oracle.profiles)
+    
+    assert counts == oracle.profile_counts
+
+
+@pytest.mark.parametrize("mode", list(ORACLE_MODES))
+@pytest.mark.parametrize("name", DIFFERENTIAL_INSTANCES)
+def test_solver_modes_match_oracle(mode, name):
+    """Chaque mode du solver retrouve exactement les profils de l'oracle"""
+    participants, tournaments, allow_incomplete = INSTANCES[name]
+    oracle = brute_force_profiles(participants, tournaments, allow_incomplete)
+    
+    solutions, info, _ = run_mode(mode, participants, tournaments, allow_incomplete)
+    
+    assert matches_oracle(mode, solutions, info, oracle)
+
+
+@pytest.mark.parametrize("name", INCREMENTAL_INSTANCES)
+def test_incremental_all_matches_oracle_counts(name):
+    """Re-résolution incrémentale en mode 'all': chaque variante exactement une fois"""
+    participants, tournaments, allow_incomplete = INSTANCES[name]
+    oracle = brute_force_profiles(participants, tournaments, allow_incomplete)
+    
+    solutions, info, _ = run_mode('incremental_all', participants, tournaments, allow_incomplete)
+    
+    assert info['incremental']
+    assert info['kept'] > 0 and info['delta'] > 0
+    assert matches_oracle('incremental_all', solutions, info, oracle)
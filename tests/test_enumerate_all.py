@@ -316,6 +316,264 @@ def test_max_solutions_limit():
         f"Devrait respecter max_solutions=5, mais trouvé {len(solutions)}"
 
 
+def test_quality_order_truncated_keeps_best_profile(conflict_roster, tournaments_sans_o3):
+    """
+    Test: avec enumeration_order='quality', une énumération tronquée
+    garde le meilleur score de l'espace complet
+    """
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    
+    exhaustive = TournamentSolver(SolverConfig(max_solutions=99999, timeout_seconds=30.0))
+    all_solutions, status, _ = exhaustive.solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    best_score = max(s.get_quality_score() for s in all_solutions)
+    
+    truncated = TournamentSolver(SolverConfig(
+        max_solutions=2,
+        timeout_seconds=30.0,
+        enumeration_order='quality'
+    ))
+    solutions, status, _ = truncated.solve(participants, tournaments)
+    
+    assert len(solutions) > 0
+    assert max(s.get_quality_score() for s in solutions) == best_score
+
+
+def test_diverse_order_maximizes_distance(conflict_roster, tournaments_sans_o3):
+    """
+    Test: enumeration_order='diverse' part de la meilleure variante puis
+    prend la variante la plus éloignée (comparé à l'énumération complète)
+    """
+    from src.solver import hamming_distance
+    
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    
+    exhaustive = TournamentSolver(SolverConfig(
+        max_solutions=0, timeout_seconds=30.0, search_mode='all'
+    ))
+    all_solutions, status, _ = exhaustive.solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    
+    diverse = TournamentSolver(SolverConfig(
+        max_solutions=2, timeout_seconds=30.0, enumeration_order='diverse'
+    ))
+    solutions, status, info = diverse.solve(participants, tournaments)
+    
+    assert status == "FEASIBLE"
+    assert len(solutions) == 2
+    first, second = sorted(solutions, key=lambda s: -s.get_quality_score())
+    assert first.get_quality_score() == max(s.get_quality_score() for s in all_solutions)
+    assert info['min_pairwise_distance'] == hamming_distance(first, second)
+    assert hamming_distance(first, second) == max(
+        hamming_distance(first, s) for s in all_solutions
+    )
+
+
+def test_diverse_order_exhausts_small_space(conflict_roster, tournaments_sans_o3):
+    """Test: si l'espace a moins de k variantes, elles sont toutes trouvées"""
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    
+    exhaustive = TournamentSolver(SolverConfig(
+        max_solutions=0, timeout_seconds=30.0, search_mode='all'
+    ))
+    all_solutions, _, _ = exhaustive.solve(participants, tournaments)
+    
+    diverse = TournamentSolver(SolverConfig(
+        max_solutions=len(all_solutions) + 5,
+        timeout_seconds=60.0,
+        enumeration_order='diverse'
+    ))
+    solutions, status, info = diverse.solve(participants, tournaments)
+    
+    assert status == "OPTIMAL"
+    assert info['min_pairwise_distance'] > 0
+    assert (
+        sorted(str(sorted(s.assignments.items())) for s in solutions)
+        == sorted(str(sorted(s.assignments.items())) for s in all_solutions)
+    )
+
+
+@pytest.mark.parametrize("edit", [
+    ('Alice', {'respect_voeux': True}),
+    ('Clara', {'dispo_jusqu_a': 'E2'}),
+    ('Ed', {'voeux_open': 2}),
+    ('Dan', {'voeux_open': 1}),
+    # Vœu baissé: delta non vide, hors de l'ancien espace ET sous l'ancienne lésion max
+    ('Fred', {'voeux_open': 0}),
+    ('Fred', {'voeux_open': 1}),
+])
+def test_incremental_matches_full_solve(edit, conflict_roster, tournaments_sans_o3):
+    """
+    Test: après une édition du roster, solve_incremental (gardées + delta)
+    donne exactement les variantes d'un solve complet, chacune une seule fois
+    """
+    from dataclasses import replace
+    
+    name, changes = edit
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    solver = TournamentSolver(SolverConfig(
+        max_solutions=0, timeout_seconds=30.0, search_mode='all', keep_enumeration=True
+    ))
+    _, status, previous_info = solver.solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    assert previous_info['enumeration_complete']
+    
+    edited = [replace(p, **changes) if p.nom == name else p for p in participants]
+    solutions, status, info = solver.solve_incremental(edited, tournaments, previous_info)
+    expected, _, _ = solver.solve(edited, tournaments)
+    
+    assert info['incremental'], info.get('incremental_reason')
+    assert status == "OPTIMAL"
+    assert info['kept'] + info['delta'] == len(solutions)
+    assert (
+        sorted(str(sorted(s.assignments.items())) for s in solutions)
+        == sorted(str(sorted(s.assignments.items())) for s in expected)
+    )
+
+
+def test_incremental_falls_back_on_structural_edit(conflict_roster, tournaments_sans_o3):
+    """Test: un participant retiré force un solve complet (raison dans l'info)"""
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    solver = TournamentSolver(SolverConfig(
+        max_solutions=0, timeout_seconds=30.0, keep_enumeration=True
+    ))
+    _, _, previous_info = solver.solve(participants, tournaments)
+    
+    solutions, status, info = solver.solve_incremental(
+        participants[:-1], tournaments, previous_info
+    )
+    
+    assert not info['incremental']
+    assert info['incremental_reason'] == "participants ajoutés ou retirés"
+    assert status == "OPTIMAL"
+    assert solutions
+    assert info['enumeration'] is not None
+
+
+def test_quality_penalty_matches_quality_score(conflict_roster, tournaments_sans_o3):
+    """
+    Test: score = 100 - 10*max_shortage - quality_penalty/2 (solution non parfaite)
+    """
+    from ortools.sat.python import cp_model
+    from src.models import Solution
+    
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    solver = TournamentSolver(SolverConfig(enumeration_order='quality'))
+    
+    for target in [3, 4]:
+        model, x, auxiliary_vars = solver._build_model_for_enumeration(
+            participants, tournaments, target
+        )
+        cp_solver = cp_model.CpSolver()
+        status = cp_solver.Solve(model)
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            continue
+        
+        assignments = {t.id: {'M': [], 'F': [], 'All': []} for t in tournaments}
+        for p in participants:
+            for t in tournaments:
+                if cp_solver.Value(x[(p.nom, t.id)]):
+                    assignments[t.id][p.genre if t.is_etape else 'All'].append(p.nom)
+        solution = Solution(assignments, participants, tournaments)
+        solution.calculate_stats()
+        
+        penalty = cp_solver.Value(auxiliary_vars["quality_penalty"])
+        expected = max(0.0, 100 - 10 * target - penalty / 2)
+        assert solution.get_quality_score() == expected
+
+
+def test_score_filter_in_solver_matches_post_filter(conflict_roster, tournaments_sans_o3):
+    """
+    Test: le seuil compilé dans le solver génère tous les profils au-dessus
+    du seuil (post-filtre inclus) et aucun profil en dessous
+    """
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    min_score = 25
+    
+    def assignment_key(solution):
+        return tuple(sorted(
+            (tid, tuple(sorted(teams['M'] + teams['F'] + teams['All'])))
+            for tid, teams in solution.assignments.items()
+        ))
+    
+    exhaustive = TournamentSolver(SolverConfig(
+        max_solutions=99999, timeout_seconds=30.0, search_mode='all'
+    ))
+    all_solutions, status, _ = exhaustive.solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    post_filtered = {
+        assignment_key(s) for s in all_solutions
+        if s.get_quality_score() >= min_score
+    }
+    
+    filtered = TournamentSolver(SolverConfig(
+        max_solutions=99999,
+        timeout_seconds=30.0,
+        search_mode='all',
+        min_quality_score=min_score,
+        score_filter_in_solver=True
+    ))
+    solutions, status, info = filtered.solve(participants, tournaments)
+    
+    assert status == "OPTIMAL"
+    assert info['score_threshold_infeasible'] is False
+    assert all(s.get_quality_score() >= min_score for s in solutions)
+    # Chaque planning n'est énuméré qu'une fois
+    assert len(solutions) == len({assignment_key(s) for s in solutions})
+    # Lésion max relâchée: à l'optimum, exactement les plannings du post-filtre
+    def max_shortage(solution):
+        return max(
+            max(0, -solution.get_participant_stats(p.nom)['ecart']) for p in participants
+        )
+    optimum = max_shortage(all_solutions[0])
+    at_optimum = [s for s in solutions if max_shortage(s) == optimum]
+    assert len(at_optimum) == len(post_filtered)
+    assert {assignment_key(s) for s in at_optimum} == post_filtered
+    
+    # Seuil inatteignable: signalé sans énumération
+    unreachable = TournamentSolver(SolverConfig(
+        timeout_seconds=30.0, min_quality_score=90, score_filter_in_solver=True
+    ))
+    solutions, _, info = unreachable.solve(participants, tournaments)
+    assert solutions == []
+    assert info['score_threshold_infeasible'] is True
+
+
+@pytest.mark.parametrize("band,settings", [
+    ('objective', {'band_epsilon': 1000}),
+    ('total_shortage', {'band_total_shortage': 0}),
+])
+def test_enumeration_band_partitions_space(band, settings, conflict_roster, tournaments_sans_o3):
+    """
+    Test: bande d'énumération = sous-ensemble de l'espace 'max_shortage',
+    et solutions gardées + exclues = espace complet
+    """
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    
+    exhaustive = TournamentSolver(SolverConfig(
+        max_solutions=99999, timeout_seconds=30.0, search_mode='all'
+    ))
+    all_solutions, status, _ = exhaustive.solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    
+    banded = TournamentSolver(SolverConfig(
+        max_solutions=99999,
+        timeout_seconds=30.0,
+        search_mode='all',
+        enumeration_band=band,
+        **settings
+    ))
+    solutions, status, info = banded.solve(participants, tournaments)
+    
+    assert status == "OPTIMAL"
+    assert 0 < len(solutions) < len(all_solutions)
+    assert info['band_excluded_exact'] is True
+    assert len(solutions) + info['band_excluded'] == len(all_solutions)
+    # La bande garde les meilleures variantes
+    assert max(s.get_quality_score() for s in solutions) == \
+        max(s.get_quality_score() for s in all_solutions)
+
+
 if __name__ == '__main__':
     # Lancer les tests
     pytest.main([__file__, '-v', '-s'])
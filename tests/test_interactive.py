@@ -0,0 +1,106 @@
+"""
+Tests du solver interactif (hypothèses: vœux stricts, forçages, interdictions)
+"""
+from dataclasses import replace
+
+import pytest
+
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from src.interactive_solver import InteractiveSolver
+
+
+def _rebuilt_optimum(config, participants, tournaments, pins=None):
+    """Optimum PASS 1 d'un modèle reconstruit (référence sans hypothèses)"""
+    solver = TournamentSolver(config)
+    model, x, _ = solver._build_model(participants, tournaments)
+    for key, plays in (pins or {}).items():
+        model.Add(x[key] == int(plays))
+    cp_solver = solver._create_pass1_solver(30.0)
+    status = cp_solver.Solve(model)
+    assert cp_solver.StatusName(status) == "OPTIMAL"
+    return int(cp_solver.ObjectiveValue())
+
+
+def test_edits_match_rebuilt_model(default_instance):
+    """Test: chaque édition donne le même optimum qu'un modèle reconstruit"""
+    participants, tournaments = default_instance
+    config = SolverConfig()
+    interactive = InteractiveSolver(config, participants, tournaments)
+    
+    _, status, info = interactive.solve()
+    assert status == "OPTIMAL"
+    assert info['objective'] == _rebuilt_optimum(config, participants, tournaments)
+    
+    # Vœux stricts pour Hugo + Hugo forcé sur E2, interdit sur E1
+    interactive.set_strict('Hugo', True)
+    interactive.pin('Hugo', 'E2')
+    interactive.pin('Hugo', 'E1', plays=False)
+    solution, status, info = interactive.solve()
+    
+    edited = [replace(p, respect_voeux=True) if p.nom == 'Hugo' else p for p in participants]
+    pins = {('Hugo', 'E2'): True, ('Hugo', 'E1'): False}
+    assert status == "OPTIMAL"
+    assert info['num_assumptions'] == 3
+    assert info['objective'] == _rebuilt_optimum(config, edited, tournaments, pins)
+    assert 'Hugo' in solution.assignments['E2']['M']
+    assert 'Hugo' not in solution.assignments['E1']['M']
+    assert solution.get_participant_stats('Hugo')['ecart'] == 0
+    
+    # Retirer les éditions revient à l'optimum initial
+    interactive.set_strict('Hugo', False)
+    interactive.unpin('Hugo', 'E2')
+    interactive.unpin('Hugo', 'E1')
+    _, _, info = interactive.solve()
+    assert info['objective'] == _rebuilt_optimum(config, participants, tournaments)
+
+
+def test_weight_change_matches_rebuilt_model(default_instance):
+    """Test: set_weights (nouveau Minimize, même modèle) == modèle reconstruit"""
+    participants, tournaments = default_instance
+    config = SolverConfig()
+    interactive = InteractiveSolver(config, participants, tournaments)
+    interactive.solve()
+    
+    weights = {'weight_wishes': 200, 'weight_fatigue': 3000, 'weight_incomplete': 50}
+    interactive.set_weights(**weights)
+    _, status, info = interactive.solve()
+    
+    assert status == "OPTIMAL"
+    assert info['objective'] == _rebuilt_optimum(
+        replace(config, **weights), participants, tournaments
+    )
+    with pytest.raises(ValueError):
+        interactive.set_weights(weight_balance=1)
+
+
+def test_conflicting_pins_are_reported(default_instance):
+    """Test: des forçages incompatibles donnent INFEASIBLE et leurs libellés"""
+    participants, tournaments = default_instance
+    interactive = InteractiveSolver(SolverConfig(), participants, tournaments)
+    
+    # Hugo souhaite 1 étape: 3 étapes forcées dépassent ses vœux
+    for tournament_id in ['E1', 'E2', 'E3']:
+        interactive.pin('Hugo', tournament_id)
+    
+    solution, status, info = interactive.solve()
+    
+    assert solution is None
+    assert status == "INFEASIBLE"
+    assert set(info['conflicts']) <= {'Hugo joue E1', 'Hugo joue E2', 'Hugo joue E3'}
+    assert info['conflicts']
+
+
+def test_unknown_names_rejected(default_instance):
+    """Test: participant ou tournoi inconnu lève une erreur explicite"""
+    participants, tournaments = default_instance
+    interactive = InteractiveSolver(SolverConfig(), participants, tournaments)
+    
+    with pytest.raises(ValueError):
+        interactive.set_strict('Personne', True)
+    with pytest.raises(ValueError):
+        interactive.pin('Hugo', 'O3')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
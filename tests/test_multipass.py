@@ -1,9 +1,12 @@
 """
 Tests pour le multipass solver et l'assistant de conflits
 """
+import time
+
 import pytest
 from src.models import Participant, Tournament, SolverConfig
 from src.multipass_solver import MultiPassSolver, ConflictAnalyzer
+from src.background_jobs import SolveJob
 from src.constants import TOURNAMENTS
 
 
@@ -219,6 +222,67 @@ class TestRelaxationCandidates:
             assert impacts == sorted(impacts)  # Doit être trié croissant
 
 
+class TestSolveJob:
+    """Tests du calcul en arrière-plan de l'application"""
+    
+    def test_job_matches_multipass(self, conflict_roster, tournaments_sans_o3):
+        """Le job donne le même résultat que solve_multipass, partiels compris"""
+        config = SolverConfig(allow_incomplete=False, max_solutions=200)
+        expected = MultiPassSolver(config).solve_multipass(conflict_roster, tournaments_sans_o3)
+        
+        job = SolveJob(config, conflict_roster, tournaments_sans_o3)
+        job.start()
+        assert job.wait(120)
+        
+        assert job.error is None
+        assert job.result.status == expected.status
+        assert len(job.result.solutions) == len(expected.solutions)
+        assert len(job.partial_solutions()) > 0
+    
+    def test_latency_budget_fills_provisional(self, conflict_roster, tournaments_sans_o3):
+        """Avec un budget de latence, des plannings provisoires précèdent le résultat"""
+        config = SolverConfig(allow_incomplete=False, max_solutions=50, latency_budget=2.0)
+        job = SolveJob(config, conflict_roster, tournaments_sans_o3)
+        job.start()
+        assert job.wait(120)
+        
+        assert job.provisional
+        assert 'relaxed' in job.provisional_info
+        assert job.result.solutions
+    
+    def test_cancel_keeps_partial_solutions(self, conflict_roster, tournaments_sans_o3):
+        """Annuler une énumération longue garde les solutions déjà trouvées"""
+        config = SolverConfig(allow_incomplete=True, search_mode='all', max_solutions=0)
+        job = SolveJob(config, conflict_roster, tournaments_sans_o3)
+        job.start()
+        
+        deadline = time.time() + 60
+        while not job.partial_solutions() and time.time() < deadline:
+            time.sleep(0.05)
+        job.cancel()
+        
+        assert job.wait(10)
+        assert job.cancelled
+        assert job.result.status == 'cancelled'
+        assert len(job.result.solutions) > 0
+    
+    def test_cancel_during_preview(self, tournaments_sans_o3):
+        """Annuler pendant l'aperçu interrompt CP-SAT et donne un résultat 'cancelled'"""
+        from benchmarks.generator import generate_roster
+        
+        # 150 joueurs: l'aperçu utiliserait tout son budget de latence
+        config = SolverConfig(allow_incomplete=True, latency_budget=60.0)
+        job = SolveJob(config, generate_roster(150, seed=0), tournaments_sans_o3)
+        job.start()
+        time.sleep(0.5)
+        job.cancel()
+        
+        assert job.wait(10)
+        assert job.error is None
+        assert job.result.status == 'cancelled'
+        assert job.result.solutions == job.provisional
+
+
 # Point d'entrée pour pytest
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
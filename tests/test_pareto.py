@@ -0,0 +1,79 @@
+"""
+Tests du solver Pareto (front non dominé des critères)
+"""
+import pytest
+from ortools.sat.python import cp_model
+
+from src.models import SolverConfig
+from src.pareto_solver import ParetoSolver
+
+
+class _CriteriaCollector(cp_model.CpSolverSolutionCallback):
+    """Collecte les valeurs des critères de toutes les solutions"""
+    
+    def __init__(self, criteria):
+        super().__init__()
+        self._criteria = criteria
+        self.values = set()
+    
+    def on_solution_callback(self):
+        self.values.add(tuple(self.Value(expr) for expr in self._criteria))
+
+
+def _brute_force_front(solver, participants, tournaments):
+    """Front de Pareto par énumération de TOUTES les solutions admissibles"""
+    model, _, auxiliary_vars = solver.base_solver._build_model(participants, tournaments)
+    model.ClearObjective()
+    criteria = [sum(terms) for terms in solver._criteria_terms(auxiliary_vars)]
+    
+    collector = _CriteriaCollector(criteria)
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.max_time_in_seconds = 60.0
+    status = cp_solver.SearchForAllSolutions(model, collector)
+    assert status == cp_model.OPTIMAL
+    
+    return {
+        v for v in collector.values
+        if not any(
+            all(a <= b for a, b in zip(w, v)) and w != v
+            for w in collector.values
+        )
+    }
+
+
+def test_front_matches_brute_force(conflict_roster, tournaments_sans_o3):
+    """
+    Test: le balayage retrouve exactement le front de l'énumération complète
+    (équipes complètes: l'espace avec incomplètes est trop grand à énumérer)
+    """
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    solver = ParetoSolver(SolverConfig(
+        max_solutions=0,
+        timeout_seconds=60.0
+    ))
+    
+    points, status, info = solver.solve_front(participants, tournaments)
+    
+    assert status == "OPTIMAL"
+    assert info['front_complete']
+    assert info['num_solves'] == len(points) + 1
+    assert {p.criteria for p in points} == _brute_force_front(solver, participants, tournaments)
+
+
+def test_points_are_consistent_with_solutions(conflict_roster, tournaments_sans_o3):
+    """Test: chaque point correspond aux stats de sa solution et le front est trié"""
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    solver = ParetoSolver(SolverConfig(allow_incomplete=True, timeout_seconds=60.0))
+    
+    points, _, _ = solver.solve_front(participants, tournaments)
+    
+    assert points == sorted(points, key=lambda p: p.criteria)
+    for point in points:
+        ecarts = [point.solution.get_participant_stats(p.nom)['ecart'] for p in participants]
+        assert point.max_shortage == max([-e for e in ecarts if e < 0], default=0)
+        assert point.total_shortage == sum(-e for e in ecarts if e < 0)
+        assert not any(other.dominates(point) for other in points)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -0,0 +1,70 @@
+"""
+Tests du profileur par échantillonnage (src/profiler.py)
+"""
+import threading
+import time
+
+from src.models import SolverConfig
+from src.profiler import SamplingProfiler, profile_directory, PROFILE_ENV
+from src.solver import TournamentSolver
+
+
+def busy_loop(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler:
+    """Tests de l'échantillonneur"""
+    
+    def test_phases_are_stack_roots(self, tmp_path):
+        """Piles sous les phases imbriquées, base au cadre qui entre dans la phase"""
+        profiler = SamplingProfiler(str(tmp_path), interval=0.001)
+        with profiler.phase('outer'):
+            with profiler.phase('inner'):
+                busy_loop(0.1)
+        
+        stacks = profiler.collapsed()
+        assert profiler.num_samples > 0
+        assert all(stack.startswith('outer;') for stack in stacks)
+        assert any(
+            stack.startswith('outer;inner;test_phases_are_stack_roots') and 'busy_loop' in stack
+            for stack in stacks
+        )
+    
+    def test_write_stops_sampler(self, tmp_path):
+        """Un fichier de piles repliées par calcul, plus de thread d'échantillonnage"""
+        profiler = SamplingProfiler(str(tmp_path / 'profils'), interval=0.001)
+        profiler.push('render')
+        busy_loop(0.05)
+        
+        path = profiler.write('render')
+        
+        lines = open(path, encoding='utf-8').read().splitlines()
+        assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+        assert not any(t.name == 'profiler' for t in threading.enumerate())
+    
+    def test_profile_directory(self, monkeypatch):
+        """config.profile_dir d'abord, sinon la variable d'environnement"""
+        monkeypatch.delenv(PROFILE_ENV, raising=False)
+        assert profile_directory(SolverConfig()) is None
+        monkeypatch.setenv(PROFILE_ENV, '/tmp/env')
+        assert profile_directory() == '/tmp/env'
+        assert profile_directory(SolverConfig(profile_dir='/tmp/config')) == '/tmp/config'
+
+
+def test_solve_writes_profile(conflict_roster, tournaments_sans_o3, tmp_path):
+    """Le solve écrit ses piles, avec les phases des passes comme racines"""
+    solver = TournamentSolver(SolverConfig(
+        allow_incomplete=True, timeout_seconds=10, profile_dir=str(tmp_path)
+    ))
+    
+    _, _, info = solver.solve(conflict_roster, tournaments_sans_o3)
+    
+    # Un solve court peut ne laisser que quelques échantillons: racines seulement
+    assert info['profile_path'].startswith(str(tmp_path))
+    roots = {
+        line.split(';')[0] for line in open(info['profile_path'], encoding='utf-8')
+    }
+    assert roots <= {'pass1.build', 'pass1', 'pass2.build', 'pass2.enumeration', 'collector.sort'}
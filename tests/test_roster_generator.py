@@ -0,0 +1,52 @@
+"""
+Tests du générateur de plannings synthétiques (benchmarks/generator.py)
+"""
+import pytest
+from benchmarks.generator import generate_roster
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from src.validation import validate_participants_data, check_couples_consistency
+
+
+class TestRosterGenerator:
+    """Tests des plannings générés"""
+    
+    def test_same_seed_same_roster(self):
+        """Même graine → même planning, autre graine → autre planning"""
+        assert generate_roster(40, seed=3) == generate_roster(40, seed=3)
+        assert generate_roster(40, seed=3) != generate_roster(40, seed=4)
+    
+    @pytest.mark.parametrize("size", [10, 37, 300])
+    def test_roster_is_valid(self, size):
+        """Taille demandée, noms uniques, aucune erreur de validation"""
+        participants = generate_roster(size, seed=size)
+        
+        assert len(participants) == size
+        assert len({p.nom for p in participants}) == size
+        assert validate_participants_data(participants) == []
+        assert check_couples_consistency(participants) == []
+    
+    def test_distribution_parameters(self):
+        """Parts de couples, de femmes et de vœux stricts respectées"""
+        participants = generate_roster(
+            200, seed=1, couples_ratio=0.5, female_ratio=0.3, strict_ratio=0.25
+        )
+        
+        assert sum(p.genre == 'F' for p in participants) == 60
+        assert sum(p.couple is not None for p in participants) == 100
+        assert 30 <= sum(p.respect_voeux for p in participants) <= 70
+        # Couples bornés par le genre minoritaire
+        no_men = generate_roster(20, seed=1, couples_ratio=1.0, female_ratio=1.0)
+        assert all(p.couple is None for p in no_men)
+    
+    def test_generated_roster_solves(self, tournaments_sans_o3):
+        """Un planning généré a des solutions"""
+        participants = generate_roster(20, seed=0)
+        solver = TournamentSolver(SolverConfig(
+            allow_incomplete=True, timeout_seconds=10, max_solutions=5
+        ))
+        
+        solutions, status, _ = solver.solve(participants, tournaments_sans_o3)
+        
+        assert solutions
+        assert status in ("OPTIMAL", "FEASIBLE")
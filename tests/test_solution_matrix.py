@@ -0,0 +1,132 @@
+"""
+Tests de SolutionMatrix (contraintes et critères vectorisés)
+"""
+import pytest
+from ortools.sat.python import cp_model
+
+from src.models import SolverConfig
+from src.solver import TournamentSolver, SolutionCollector
+from src.solution_matrix import SolutionMatrix
+
+# Équipes incomplètes autorisées: l'espace dépasse 10 000 variantes
+ENUMERATION_LIMIT = 2000
+
+
+def _enumerated(participants, tournaments, allow_incomplete,
+                fatigue_encoding='window', mode='all'):
+    """Variantes optimales (vecteurs de x en matrice) et collecteur qui les a vues"""
+    solver = TournamentSolver(SolverConfig(
+        allow_incomplete=allow_incomplete, fatigue_encoding=fatigue_encoding
+    ))
+    model, x, auxiliary_vars = solver._build_model(participants, tournaments)
+    cp_solver = cp_model.CpSolver()
+    cp_solver.Solve(model)
+    optimum = int(cp_solver.Value(auxiliary_vars["max_shortage"]))
+    
+    model, x, auxiliary_vars = solver._build_model_for_enumeration(
+        participants, tournaments, optimum
+    )
+    collector = SolutionCollector(
+        x, tournaments, participants, ENUMERATION_LIMIT, None, mode=mode,
+        fatigue_vars=auxiliary_vars.get("fatigue_penalties"), keep_assignments=True
+    )
+    cp_solver = cp_model.CpSolver()
+    cp_solver.SearchForAllSolutions(model, collector)
+    matrix = SolutionMatrix.from_assignments(collector.assignments, participants, tournaments)
+    return matrix, collector, optimum
+
+
+@pytest.mark.parametrize("allow_incomplete", [False, True])
+def test_enumerated_solutions_are_feasible(allow_incomplete, conflict_roster, tournaments_sans_o3):
+    """Test: les variantes du solver respectent les contraintes vérifiées en bloc"""
+    matrix, _, optimum = _enumerated(conflict_roster, tournaments_sans_o3, allow_incomplete)
+    
+    assert len(matrix) > 0
+    assert matrix.feasible(allow_incomplete).all()
+    assert (matrix.max_shortage() == optimum).all()
+
+
+def test_feasible_rejects_violations(conflict_roster, tournaments_sans_o3):
+    """Test: vœux dépassés et couple le même jour sont rejetés"""
+    matrix, _, _ = _enumerated(conflict_roster, tournaments_sans_o3, False)
+    names = [p.nom for p in matrix.participants]
+    tournament_ids = [t.id for t in matrix.tournaments]
+    
+    plays = matrix.plays[:1].copy()
+    plays[0, names.index('Ed')] = True  # Ed joue tout: vœux dépassés
+    assert not SolutionMatrix(plays, matrix.participants, matrix.tournaments).feasible(True)[0]
+    
+    plays = matrix.plays[:1].copy()
+    plays[0, names.index('Betty'), tournament_ids.index('E1')] = True
+    plays[0, names.index('Dan'), tournament_ids.index('E1')] = True
+    assert not SolutionMatrix(plays, matrix.participants, matrix.tournaments).feasible(True)[0]
+
+
+def test_roundtrip_matches_collector(conflict_roster, tournaments_sans_o3):
+    """Test: to_solutions reproduit les Solution du collecteur"""
+    matrix, collector, _ = _enumerated(conflict_roster, tournaments_sans_o3, False)
+    
+    def key(solutions):
+        return sorted(str(sorted(s.assignments.items())) for s in solutions)
+    
+    rebuilt = matrix.to_solutions()
+    assert key(rebuilt) == key(collector.get_solutions())
+    
+    back = SolutionMatrix.from_solutions(rebuilt, matrix.participants, matrix.tournaments)
+    assert back.assignments() == matrix.assignments()
+
+
+@pytest.mark.parametrize("fatigue_encoding", ['window', 'run_length'])
+def test_best_per_profile_matches_collector(fatigue_encoding, conflict_roster, tournaments_sans_o3):
+    """Test: l'objectif vectorisé donne le même meilleur objectif par profil"""
+    matrix, collector, _ = _enumerated(
+        conflict_roster, tournaments_sans_o3, True, fatigue_encoding, mode='unique_profiles'
+    )
+    
+    rows = matrix.best_per_profile(fatigue_encoding)
+    objectives = matrix.objective(fatigue_encoding)
+    
+    assert len(rows) == collector.get_profile_count()
+    assert sorted(int(objectives[row]) for row in rows) == sorted(
+        objective for _, objective in collector._profile_signatures.values()
+    )
+
+
+def test_rerank_matches_solve_with_new_weights(conflict_roster, tournaments_sans_o3):
+    """Test: reclasser l'énumération gardée == résoudre avec les nouveaux poids"""
+    from dataclasses import replace
+    from src.variant_counter import solution_profile_key
+    
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    config = SolverConfig(max_solutions=0, timeout_seconds=30.0, keep_enumeration=True)
+    solutions, status, info = TournamentSolver(config).solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    
+    weights = {'weight_wishes': 100, 'weight_fatigue': 5000, 'weight_incomplete': 1}
+    reweighted = TournamentSolver(replace(config, **weights))
+    reranked, rerank_info = reweighted.rerank(solutions, info)
+    expected, _, _ = reweighted.solve(participants, tournaments)
+    
+    def best_objectives(found):
+        matrix = SolutionMatrix.from_solutions(found, participants, tournaments)
+        objectives = matrix.objective(weights=weights)
+        return {solution_profile_key(s): int(o) for s, o in zip(found, objectives)}
+    
+    assert rerank_info['reselected']
+    assert rerank_info['objectives'] == sorted(rerank_info['objectives'])
+    assert best_objectives(reranked) == best_objectives(expected)
+
+
+def test_reindex_by_name(conflict_roster, tournaments_sans_o3):
+    """Test: reindex suit les noms dans les deux sens"""
+    matrix, _, _ = _enumerated(conflict_roster, tournaments_sans_o3, False)
+    reordered = list(reversed(matrix.participants))
+    
+    reindexed = matrix.reindex(reordered)
+    
+    assert (reindexed.days_played() == matrix.days_played()[:, ::-1]).all()
+    assert reindexed.reindex(matrix.participants).assignments() == matrix.assignments()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
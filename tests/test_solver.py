@@ -1,11 +1,17 @@
 """
 Tests de non-régression pour l'organisateur d'Estivales
 """
+import threading
+import time
+from dataclasses import replace
+
 import pytest
 from src.models import Participant, Tournament, SolverConfig, Solution
-from src.solver import TournamentSolver, analyze_solutions
+from src.solver import TournamentSolver, analyze_solutions, assignment_key
 from src.validation import validate_participants_data, check_couples_consistency
-from src.constants import TOURNAMENTS, DEFAULT_PARTICIPANTS, PARTICIPANT_COLUMNS
+from src.constants import (
+    TOURNAMENTS, DEFAULT_PARTICIPANTS, PARTICIPANT_COLUMNS, SEARCH_STRATEGIES, SOLVER_PROFILES
+)
 
 
 class TestModels:
@@ -371,6 +377,418 @@ class TestSolverFatigue:
             f"La meilleure solution a {alice_stats['max_consecutifs']} jours consécutifs (>3)"
 
 
+class TestFatigueEncoding:
+    """Tests de l'encodage 'run_length' (séries consécutives exactes)"""
+    
+    def test_run_length_same_optimum_as_window(self):
+        """Les deux encodages trouvent le même optimum sur un cas de fatigue"""
+        alice = Participant("Alice", "F", None, 3, 0, "O3", False)
+        tournaments = [Tournament(**t) for t in TOURNAMENTS]
+        
+        scores = {}
+        for encoding in ['window', 'run_length']:
+            config = SolverConfig(
+                max_solutions=20,
+                timeout_seconds=30.0,
+                fatigue_encoding=encoding
+            )
+            solutions, status, info = TournamentSolver(config).solve([alice], tournaments)
+            assert len(solutions) > 0
+            scores[encoding] = info['optimal_score']
+        
+        assert scores['window'] == scores['run_length']
+    
+    def test_max_run_matches_solution_stats(self):
+        """max_run du modèle == max_consecutifs calculé par Solution"""
+        participants = [
+            Participant.from_dict(dict(zip(PARTICIPANT_COLUMNS, data)))
+            for data in DEFAULT_PARTICIPANTS
+        ]
+        tournaments = [Tournament(**t) for t in TOURNAMENTS]
+        
+        config = SolverConfig(allow_incomplete=True, fatigue_encoding='run_length')
+        solver = TournamentSolver(config)
+        model, x, auxiliary_vars = solver._build_model(participants, tournaments)
+        
+        cp_solver = solver._create_pass1_solver(10.0)
+        status = cp_solver.Solve(model)
+        assert cp_solver.StatusName(status) in ["OPTIMAL", "FEASIBLE"]
+        
+        assignments = {t.id: {'M': [], 'F': [], 'All': []} for t in tournaments}
+        for p in participants:
+            for t in tournaments:
+                if cp_solver.Value(x[(p.nom, t.id)]):
+                    assignments[t.id][p.genre if t.is_etape else 'All'].append(p.nom)
+        solution = Solution(assignments, participants, tournaments)
+        
+        fatigue_penalties = auxiliary_vars["fatigue_penalties"]
+        for p, penalty in zip(participants, fatigue_penalties):
+            stats = solution.get_participant_stats(p.nom)
+            assert cp_solver.Value(auxiliary_vars[f"max_run_{p.nom}"]) == stats['max_consecutifs']
+            assert cp_solver.Value(penalty) == max(0, stats['max_consecutifs'] - 3)
+
+
+class TestScheduleTable:
+    """Tests de la formulation 'schedule_table' (programmes admissibles)"""
+    
+    def test_schedules_respect_wishes_and_availability(self):
+        """Les programmes respectent disponibilité, vœux max et vœux stricts"""
+        from src.schedules import enumerate_schedules
+        
+        tournaments = [Tournament(**t) for t in TOURNAMENTS]
+        strict = Participant("Alice", "F", None, 2, 1, "E2", True)
+        schedules = enumerate_schedules(strict, tournaments)
+        
+        # Dispo jusqu'à E2: E1, O1, E2 seulement; strict 2E+1O: un seul programme
+        assert [set(s.tournament_ids) for s in schedules] == [{'E1', 'O1', 'E2'}]
+        assert schedules[0].days_played == 5
+        assert schedules[0].shortage == 0
+        assert schedules[0].max_run == 5
+        
+        flexible = Participant("Bob", "M", None, 1, 1, "O3", False)
+        schedules = enumerate_schedules(flexible, tournaments)
+        # 0 ou 1 étape parmi 3, 0 ou 1 open parmi 3
+        assert len(schedules) == 4 * 4
+    
+    @pytest.mark.parametrize("encoding", ['window', 'run_length'])
+    def test_same_optimum_and_solutions_as_x_vars(self, encoding, conflict_roster,
+                                                  tournaments_sans_o3):
+        """Même optimum PASS 1 et mêmes solutions PASS 2 que la formulation x_vars"""
+        participants, tournaments = conflict_roster, tournaments_sans_o3
+        
+        results = {}
+        for formulation in ['x_vars', 'schedule_table']:
+            config = SolverConfig(
+                max_solutions=0,
+                timeout_seconds=30.0,
+                search_mode='all',
+                fatigue_encoding=encoding,
+                formulation=formulation
+            )
+            solutions, status, info = TournamentSolver(config).solve(participants, tournaments)
+            assert status == "OPTIMAL"
+            results[formulation] = (
+                info['optimal_score'],
+                sorted(str(sorted(s.assignments.items())) for s in solutions)
+            )
+        
+        assert results['x_vars'] == results['schedule_table']
+
+
+class TestProfileSampling:
+    """Tests de l'exploration et de l'échantillonnage des variantes d'un profil"""
+    
+    def test_explore_profile_matches_exact_count(self, default_instance):
+        """L'exploration en profondeur énumère exactement les variantes comptées"""
+        from src.variant_counter import count_variants, profile_key, solution_profile_key
+        
+        participants, tournaments = default_instance
+        profile = {'Sophie S': -2, 'Sébastien S': -2, 'Lise': -1, 'Robin': -1,
+                   'Sophie L': -1, 'Sylvain': -1, 'Sébastien A': -1}
+        key = profile_key({nom: -ecart for nom, ecart in profile.items()})
+        
+        solver = TournamentSolver(SolverConfig(max_solutions=0, timeout_seconds=60.0))
+        solutions, status, _ = solver.explore_profile_in_depth(participants, tournaments, profile)
+        
+        assert status == "OPTIMAL"
+        assert {solution_profile_key(s) for s in solutions} == {key}
+        assert len({str(sorted(s.assignments.items())) for s in solutions}) == len(solutions)
+        assert len(solutions) == count_variants(participants, tournaments, profiles=[key])[key]
+    
+    def test_samples_are_distinct_variants_of_profile(self, default_instance):
+        """Les variantes tirées sont distinctes et appartiennent au profil"""
+        from src.variant_counter import profile_key, solution_profile_key
+        
+        participants, tournaments = default_instance
+        profile = {'Sophie S': -2, 'Sébastien S': -2, 'Lise': -1, 'Robin': -1,
+                   'Sophie L': -1, 'Sylvain': -1, 'Sébastien A': -1}
+        key = profile_key({nom: -ecart for nom, ecart in profile.items()})
+        
+        solver = TournamentSolver(SolverConfig(timeout_seconds=60.0))
+        solutions, status, info = solver.sample_profile_variants(
+            participants, tournaments, profile, num_samples=10, seed=0
+        )
+        
+        assert status == "FEASIBLE"
+        assert info['variant_count'] > 10
+        assert info['xor_constraints'] > 0
+        assert len(solutions) == 10
+        assert {solution_profile_key(s) for s in solutions} == {key}
+        assert len({str(sorted(s.assignments.items())) for s in solutions}) == 10
+    
+    def test_small_profile_returns_all_variants(self, default_instance):
+        """Si le profil a moins de variantes que demandé, elles sont toutes renvoyées"""
+        participants, tournaments = default_instance
+        profile = {'Sophie S': -2, 'Sébastien S': -2, 'Lise': -1, 'Robin': -1,
+                   'Sophie L': -1, 'Sylvain': -1, 'Sébastien A': -1}
+        
+        solver = TournamentSolver(SolverConfig(max_solutions=0, timeout_seconds=60.0))
+        all_variants, _, _ = solver.explore_profile_in_depth(participants, tournaments, profile)
+        sampled, status, info = solver.sample_profile_variants(
+            participants, tournaments, profile, num_samples=len(all_variants) + 1
+        )
+        
+        assert status == "OPTIMAL"
+        assert info['xor_constraints'] == 0
+        assert (
+            sorted(str(sorted(s.assignments.items())) for s in sampled)
+            == sorted(str(sorted(s.assignments.items())) for s in all_variants)
+        )
+    
+    def test_empty_cells_stop_early(self, default_instance, monkeypatch):
+        """Des cellules XOR toujours vides arrêtent le tirage bien avant le timeout"""
+        import src.solver
+        
+        # Cellules visées minuscules: ~17 XOR, presque toutes les cellules sont vides
+        monkeypatch.setattr(src.solver, 'SAMPLE_CELL_SIZE', 0.01)
+        participants, tournaments = default_instance
+        profile = {'Sophie S': -2, 'Sébastien S': -2, 'Lise': -1, 'Robin': -1,
+                   'Sophie L': -1, 'Sylvain': -1, 'Sébastien A': -1}
+        
+        solver = TournamentSolver(SolverConfig(timeout_seconds=120.0))
+        solutions, status, info = solver.sample_profile_variants(
+            participants, tournaments, profile, num_samples=10, seed=0
+        )
+        
+        assert info['gave_up']
+        assert len(solutions) < 10
+        assert status in ("FEASIBLE", "UNKNOWN")
+        assert info['elapsed_time'] < 60.0
+
+
+class TestNeighborhood:
+    """Tests de l'exploration du voisinage d'une solution choisie"""
+    
+    @staticmethod
+    def _all_solutions(participants, tournaments):
+        solver = TournamentSolver(SolverConfig(
+            max_solutions=0, timeout_seconds=30.0, search_mode='all'
+        ))
+        solutions, status, _ = solver.solve(participants, tournaments)
+        assert status == "OPTIMAL"
+        return solutions
+    
+    @pytest.mark.parametrize("same_profile", [False, True])
+    def test_neighborhood_matches_brute_force(self, same_profile, conflict_roster,
+                                              tournaments_sans_o3):
+        """Le voisinage est exactement la boule de Hamming (hors référence)"""
+        from src.solver import hamming_distance
+        from src.variant_counter import solution_profile_key
+        
+        solutions = self._all_solutions(conflict_roster, tournaments_sans_o3)
+        reference = solutions[0]
+        radius = 6
+        
+        solver = TournamentSolver(SolverConfig(max_solutions=0, timeout_seconds=10.0))
+        neighbors, status, info = solver.explore_neighborhood(reference, radius, same_profile)
+        
+        expected = [
+            s for s in solutions
+            if 0 < hamming_distance(reference, s) <= radius and (
+                not same_profile
+                or solution_profile_key(s) == solution_profile_key(reference)
+            )
+        ]
+        assert status == "OPTIMAL"
+        assert len(expected) > 0
+        assert (
+            sorted(str(sorted(s.assignments.items())) for s in neighbors)
+            == sorted(str(sorted(s.assignments.items())) for s in expected)
+        )
+        assert info['distances'] == sorted(info['distances'])
+        assert info['distances'] == [hamming_distance(reference, s) for s in neighbors]
+
+
+class TestSearchStrategy:
+    """Tests des stratégies de branchement et profils de paramètres PASS 1"""
+    
+    def test_all_strategies_reach_same_optimum(self, default_instance):
+        """Toutes les stratégies prouvent le même optimum"""
+        participants, tournaments = default_instance
+        
+        objectives = set()
+        for strategy in SEARCH_STRATEGIES:
+            solver = TournamentSolver(SolverConfig(allow_incomplete=True, search_strategy=strategy))
+            model, _, _ = solver._build_model(participants, tournaments)
+            cp_solver = solver._create_pass1_solver(30.0)
+            status = cp_solver.Solve(model)
+            assert cp_solver.StatusName(status) == "OPTIMAL", strategy
+            objectives.add(int(cp_solver.ObjectiveValue()))
+        
+        assert len(objectives) == 1
+    
+    def test_all_profiles_reach_same_optimum(self, default_instance):
+        """Tous les profils de paramètres prouvent le même optimum"""
+        participants, tournaments = default_instance
+        
+        objectives = set()
+        for profile in SOLVER_PROFILES:
+            solver = TournamentSolver(SolverConfig(allow_incomplete=True, solver_profile=profile))
+            model, _, _ = solver._build_model(participants, tournaments)
+            cp_solver = solver._create_pass1_solver(30.0)
+            status = cp_solver.Solve(model)
+            assert cp_solver.StatusName(status) == "OPTIMAL", profile
+            assert 1 <= cp_solver.parameters.num_search_workers <= SOLVER_PROFILES[profile]['max_workers']
+            objectives.add(int(cp_solver.ObjectiveValue()))
+        
+        assert len(objectives) == 1
+    
+    def test_unknown_profile_rejected(self):
+        """Un profil inconnu lève une erreur explicite"""
+        with pytest.raises(ValueError):
+            TournamentSolver(SolverConfig(solver_profile='turbo'))._create_pass1_solver(1.0)
+    
+    def test_unknown_strategy_rejected(self):
+        """Une stratégie inconnue lève une erreur explicite"""
+        solver = TournamentSolver(SolverConfig(search_strategy='random'))
+        alice = Participant("Alice", "F", None, 1, 0, "O3", False)
+        
+        with pytest.raises(ValueError):
+            solver._build_model([alice], [Tournament(**TOURNAMENTS[0])])
+
+
+class TestSolveIter:
+    """Tests de l'API streaming solve_iter"""
+    
+    def test_streamed_profiles_match_solve(self, conflict_roster, tournaments_sans_o3):
+        """Les profils streamés finissent sur les mêmes solutions que solve()"""
+        config = SolverConfig(allow_incomplete=False, max_solutions=500)
+        expected, status, _ = TournamentSolver(config).solve(conflict_roster, tournaments_sans_o3)
+        
+        events = list(TournamentSolver(config).solve_iter(conflict_roster, tournaments_sans_o3))
+        
+        assert events[-1].kind == 'done'
+        assert events[-1].status == status
+        assert all(e.kind == 'profile' for e in events[:-1])
+        # Dernière variante streamée de chaque profil = variante gardée
+        latest = {e.profile: e.solution for e in events[:-1]}
+        done = events[-1].solutions
+        assert len(latest) == len(done) == len(expected)
+        assert (
+            sorted(str(sorted(s.assignments.items())) for s in latest.values())
+            == sorted(str(sorted(s.assignments.items())) for s in done)
+        )
+    
+    def test_close_stops_search(self, conflict_roster, tournaments_sans_o3):
+        """Fermer le générateur après la 1re solution arrête l'énumération"""
+        solver = TournamentSolver(SolverConfig(
+            allow_incomplete=True, search_mode='all', max_solutions=0
+        ))
+        
+        start = time.time()
+        stream = solver.solve_iter(conflict_roster, tournaments_sans_o3)
+        first = next(stream)
+        stream.close()
+        
+        assert first.kind == 'solution'
+        assert first.solution is not None
+        assert time.time() - start < 10.0
+        assert not any(t.name == 'solve_iter' for t in threading.enumerate())
+    
+    def test_backpressure_keeps_all_solutions(self, conflict_roster, tournaments_sans_o3):
+        """Une file de 1 élément ralentit le solver sans perdre de solution"""
+        config = SolverConfig(allow_incomplete=False, search_mode='all', max_solutions=200)
+        
+        events = list(TournamentSolver(config).solve_iter(
+            conflict_roster, tournaments_sans_o3, max_pending=1
+        ))
+        
+        streamed = [e for e in events if e.kind == 'solution']
+        assert len(streamed) == len(events[-1].solutions) > 0
+    
+    def test_stop_event_cancels(self, default_instance):
+        """Un stop_event déjà positionné annule avant PASS 2"""
+        participants, tournaments = default_instance
+        stop = threading.Event()
+        stop.set()
+        
+        solutions, status, info = TournamentSolver(SolverConfig()).solve(
+            participants, tournaments, stop_event=stop
+        )
+        
+        assert solutions == []
+        assert status == "CANCELLED"
+        assert info['stopped']
+
+
+class TestProvisional:
+    """Tests du mode anytime (solve_provisional)"""
+    
+    def test_proven_optimum_not_provisional(self, default_instance):
+        """Dans le budget, le meilleur planning a l'optimum de solve()"""
+        participants, tournaments = default_instance
+        solver = TournamentSolver(SolverConfig(latency_budget=10.0))
+        
+        solutions, status, info = solver.solve_provisional(participants, tournaments)
+        _, _, full_info = solver.solve(participants, tournaments)
+        
+        assert status == "OPTIMAL"
+        assert not info['provisional']
+        assert info['objective'] == full_info['optimal_score']
+        assert solutions
+    
+    def test_tiny_budget_is_provisional_and_fast(self, default_instance):
+        """Un budget minuscule rend vite, sans prétendre à l'optimum"""
+        participants, tournaments = default_instance
+        solver = TournamentSolver(SolverConfig(latency_budget=0.01))
+        
+        start = time.time()
+        solutions, status, info = solver.solve_provisional(participants, tournaments)
+        
+        assert time.time() - start < 2.0
+        assert info['provisional'] or status == "OPTIMAL"
+    
+    def test_strict_conflict_gives_relaxed_guess(self, conflict_roster, tournaments_sans_o3):
+        """Vœux stricts infaisables: estimation relaxée marquée comme telle"""
+        strict = [replace(p, respect_voeux=True) for p in conflict_roster]
+        solver = TournamentSolver(SolverConfig(latency_budget=5.0))
+        
+        solutions, status, info = solver.solve_provisional(strict, tournaments_sans_o3)
+        
+        assert info['relaxed']
+        assert info['provisional']
+        assert solutions
+        assert all(s.participants == strict for s in solutions)
+
+
+class TestDeterministic:
+    """Tests du mode déterministe (graine et ordre stables)"""
+    
+    def test_identical_runs(self, default_instance):
+        """Deux solves déterministes donnent les mêmes plannings dans le même ordre"""
+        participants, tournaments = default_instance
+        config = SolverConfig(deterministic=True, max_solutions=20)
+        
+        runs = [TournamentSolver(config).solve(participants, tournaments) for _ in range(2)]
+        
+        (first, status, info), (second, status_2, info_2) = runs
+        assert [assignment_key(s) for s in first] == [assignment_key(s) for s in second]
+        assert status == status_2
+        assert info['optimal_score'] == info_2['optimal_score']
+    
+    def test_stable_order_of_ties(self, conflict_roster, tournaments_sans_o3):
+        """Mode 'all': égalités de score triées par contenu du planning"""
+        config = SolverConfig(
+            deterministic=True, allow_incomplete=False, search_mode='all', max_solutions=0
+        )
+        
+        solutions, _, _ = TournamentSolver(config).solve(conflict_roster, tournaments_sans_o3)
+        
+        keys = [(-s.get_quality_score(), assignment_key(s)) for s in solutions]
+        assert keys == sorted(keys)
+    
+    def test_solver_parameters(self):
+        """Déterministe: 1 worker et graine fixe; graine seule: workers inchangés"""
+        deterministic = TournamentSolver(SolverConfig(deterministic=True))._create_pass1_solver(5.0)
+        seeded_solver = TournamentSolver(SolverConfig(random_seed=42))
+        seeded = seeded_solver._create_pass1_solver(5.0)
+        
+        assert deterministic.parameters.num_search_workers == 1
+        assert deterministic.parameters.max_deterministic_time == 5.0
+        assert seeded.parameters.random_seed == 42
+        assert seeded.parameters.num_search_workers == seeded_solver._search_workers()
+
+
 class TestDefaultData:
     """Tests avec les données par défaut"""
     
@@ -0,0 +1,58 @@
+"""
+Tests de la télémétrie de convergence (src/telemetry.py)
+"""
+import pytest
+from src.models import SolverConfig
+from src.solver import TournamentSolver
+from src.telemetry import ConvergenceTelemetry, PASS2_SAMPLE_SECONDS
+
+
+class TestConvergenceTelemetry:
+    """Tests des séries temporelles"""
+    
+    def test_pass1_log_lines(self):
+        """Lignes #N: incumbent; lignes #Bound: borne (leur "best" en retard est ignoré)"""
+        telemetry = ConvergenceTelemetry()
+        for line in [
+            "#Bound   0.05s best:inf   next:[100,900] initial_domain",
+            "#1       0.06s best:300 next:[100,299] main",
+            "#2       0.08s best:200 next:[100,199] main",
+            "#Bound   0.09s best:300 next:[150,299] bool_main (num_cores=1)",
+            "#Done    0.10s best:200 next:[] main",
+            "Starting search at 0.05s with 1 worker.",
+        ]:
+            telemetry.on_pass1_log(line)
+        
+        info = telemetry.to_info()
+        assert [(p['objective'], p['bound']) for p in info['pass1']] == [
+            (None, 100), (300, 100), (200, 100), (200, 150)
+        ]
+        assert info['pass1_last_improvement'] == pytest.approx(0.08)
+        assert info['pass1_final_gap'] == pytest.approx(0.25)
+    
+    def test_pass2_sampling(self):
+        """Un point par intervalle, point final et dernier nouveau profil gardés"""
+        telemetry = ConvergenceTelemetry()
+        for i in range(10):
+            telemetry.on_pass2_solution(i * PASS2_SAMPLE_SECONDS / 4, min(i, 5), i + 1)
+        telemetry.finish_pass2(1.0, 5, 10, time_limit=2.0)
+        
+        info = telemetry.to_info()
+        assert len(info['pass2']) == 4
+        assert info['pass2'][-1] == {'time': 1.0, 'profiles': 5, 'solutions': 10}
+        assert info['pass2_last_new_profile'] == pytest.approx(5 * PASS2_SAMPLE_SECONDS / 4)
+        assert info['pass2_solutions_per_second'] == pytest.approx(10.0)
+
+
+def test_solve_reports_convergence(conflict_roster, tournaments_sans_o3):
+    """info['convergence']: PASS 1 convergée vers la borne, PASS 2 cumulée"""
+    solver = TournamentSolver(SolverConfig(allow_incomplete=True, timeout_seconds=10))
+    
+    solutions, _, info = solver.solve(conflict_roster, tournaments_sans_o3)
+    
+    convergence = info['convergence']
+    assert convergence['pass1'][-1]['objective'] is not None
+    assert convergence['pass1_last_improvement'] <= convergence['pass1_time_limit']
+    assert convergence['pass2'][-1]['profiles'] == len(solutions)
+    solutions_seen = [p['solutions'] for p in convergence['pass2']]
+    assert solutions_seen == sorted(solutions_seen)
@@ -0,0 +1,109 @@
+"""
+Tests de la répartition du temps entre les passes (src/time_budget.py)
+"""
+import time
+
+import pytest
+from src.models import SolverConfig
+from src.multipass_solver import MultiPassSolver
+from src.solver import TournamentSolver
+from src.time_budget import (
+    TimeBudget,
+    PhaseHistory,
+    PASS1_DEFAULT_MAX,
+    PROBE_MAX_SECONDS,
+    MIN_PHASE_SECONDS,
+    relative_gap
+)
+
+
+class TestTimeBudget:
+    """Tests des tranches par phase"""
+    
+    def test_pass1_default_slice(self):
+        """Sans historique: min(30, restant / 3) comme avant"""
+        assert TimeBudget(30.0, PhaseHistory()).pass1(100) == pytest.approx(10.0, abs=0.05)
+        assert TimeBudget(300.0, PhaseHistory()).pass1(100) == pytest.approx(PASS1_DEFAULT_MAX)
+    
+    def test_history_extends_pass1_up_to_half(self):
+        """Une PASS 1 coupée avant preuve allonge la tranche suivante, au plus la moitié"""
+        history = PhaseHistory()
+        TimeBudget(300.0, history).record_pass1(500, 30.0, gap=0.2)
+        
+        assert TimeBudget(300.0, history).pass1(500) == pytest.approx(120.0, abs=0.1)
+        assert TimeBudget(100.0, history).pass1(500) == pytest.approx(50.0, abs=0.1)
+        # Autre taille d'instance: pas d'historique
+        assert TimeBudget(300.0, history).pass1(50) == pytest.approx(PASS1_DEFAULT_MAX)
+    
+    def test_fast_history_never_shortens_pass1(self):
+        """Une PASS 1 rapide ne raccourcit pas la tranche (optimum à prouver)"""
+        history = PhaseHistory()
+        TimeBudget(300.0, history).record_pass1(500, 0.01, gap=0.0)
+        
+        assert TimeBudget(30.0, history).pass1(500) == pytest.approx(10.0, abs=0.05)
+    
+    def test_slices_never_exceed_deadline(self):
+        """Aucune tranche ne dépasse le temps restant"""
+        budget = TimeBudget(2.0, PhaseHistory())
+        
+        assert budget.pass2() <= 2.0
+        assert budget.child(10.0).deadline <= budget.deadline
+        assert budget.probe(1) <= min(PROBE_MAX_SECONDS, 1.0)
+        
+        expired = TimeBudget(0.0, PhaseHistory())
+        assert expired.expired
+        # Échéance passée: plus de tranche minimale, rien au-delà de l'échéance
+        assert expired.pass2() == 0.0
+        assert expired.band_count() == 0.0
+        assert TimeBudget(1.0, PhaseHistory()).allot('test', 0.0) == MIN_PHASE_SECONDS
+    
+    def test_probes_share_remaining_time(self):
+        """Beaucoup de sondes se partagent la moitié du restant"""
+        budget = TimeBudget(10.0, PhaseHistory())
+        
+        assert budget.probe(20) == pytest.approx(0.25, abs=0.01)
+    
+    def test_relative_gap(self):
+        """Écart relatif incumbent / borne"""
+        assert relative_gap(100, 100) == 0
+        assert relative_gap(200, 100) == 0.5
+
+
+class TestDeadline:
+    """L'échéance globale est tenue de bout en bout"""
+    
+    def test_solve_reports_allocation(self, default_instance):
+        """info['time_allocation']: tranche de chaque passe, dans le timeout"""
+        participants, tournaments = default_instance
+        
+        _, _, info = TournamentSolver(SolverConfig(timeout_seconds=20.0)).solve(
+            participants, tournaments
+        )
+        
+        allocation = dict(info['time_allocation'])
+        assert list(allocation) == ['pass1', 'pass2']
+        assert allocation['pass1'] <= 20.0 / 3 + 0.05
+        # Tranches = plafonds: la PASS 2 reçoit ce que la PASS 1 n'a pas utilisé
+        assert allocation['pass2'] < 20.0
+        assert info['elapsed_time'] < 20.0
+    
+    def test_enumeration_and_sort_within_timeout(self, default_instance):
+        """Mode 'all': énumération coupée par l'échéance, tri compris dans le timeout"""
+        participants, tournaments = default_instance
+        config = SolverConfig(search_mode='all', max_solutions=0, timeout_seconds=5.0)
+        
+        start = time.time()
+        solutions, _, info = TournamentSolver(config).solve(participants, tournaments)
+        
+        assert len(solutions) > 100
+        assert time.time() - start < 5.0
+        assert info['timing_summary']['collector.sort'] < 0.05
+    
+    def test_multipass_respects_timeout(self, conflict_roster, tournaments_sans_o3):
+        """Solve strict, sondes et relaxations tiennent dans timeout_seconds"""
+        config = SolverConfig(allow_incomplete=False, max_solutions=0, timeout_seconds=3.0)
+        
+        start = time.time()
+        MultiPassSolver(config).solve_multipass(conflict_roster, tournaments_sans_o3)
+        
+        assert time.time() - start < 3.0 + 1.0
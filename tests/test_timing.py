@@ -0,0 +1,97 @@
+"""
+Tests des spans de temps des phases (src/timing.py)
+"""
+import json
+import time
+
+import pytest
+from src.models import Participant, SolverConfig
+from src.multipass_solver import MultiPassSolver
+from src.solver import TournamentSolver
+from src.timing import PhaseTimer
+
+BUILD_FAMILIES = [
+    'build.couples', 'build.teams', 'build.availability', 'build.wishes',
+    'build.days', 'build.deviations', 'build.fatigue'
+]
+
+
+class TestPhaseTimer:
+    """Tests de la chronologie"""
+    
+    def test_spans_accumulate_and_summary(self):
+        """Spans ordonnés, spans cumulés comptent leurs appels, totaux par nom"""
+        timer = PhaseTimer()
+        with timer.span('a', 'test', detail=1):
+            time.sleep(0.01)
+        timer.accumulate('b', 'test', 0.5)
+        timer.accumulate('b', 'test', 0.25)
+        with timer.span('a', 'test'):
+            pass
+        
+        spans = timer.spans
+        assert [s['name'] for s in spans].count('a') == 2
+        assert all(spans[i]['start'] <= spans[i + 1]['start'] for i in range(len(spans) - 1))
+        b = next(s for s in spans if s['name'] == 'b')
+        assert b['duration'] == pytest.approx(0.75)
+        assert b['args'] == {'calls': 2, 'aggregated': True}
+        assert timer.summary()['a'] >= 0.01
+    
+    def test_chrome_trace(self, tmp_path):
+        """Événements complets (ph X) en microsecondes"""
+        timer = PhaseTimer()
+        timer.add('a', 'test', timer.origin + 1.0, 0.5, detail=1)
+        path = tmp_path / 'trace.json'
+        
+        timer.write_chrome_trace(str(path))
+        
+        event = json.loads(path.read_text())['traceEvents'][0]
+        assert event['ph'] == 'X'
+        assert event['ts'] == pytest.approx(1e6)
+        assert event['dur'] == pytest.approx(5e5)
+        assert event['args'] == {'detail': 1}
+
+
+class TestSolverTimings:
+    """Tests des spans renvoyés par les solvers"""
+    
+    def test_solve_reports_phase_spans(self, conflict_roster, tournaments_sans_o3, tmp_path):
+        """Familles de contraintes, presolve/recherche par passe, collecteur, trace écrite"""
+        path = tmp_path / 'solve.json'
+        solver = TournamentSolver(SolverConfig(
+            allow_incomplete=True, timeout_seconds=10, timing_trace_path=str(path)
+        ))
+        
+        _, _, info = solver.solve(conflict_roster, tournaments_sans_o3)
+        
+        summary = info['timing_summary']
+        for name in BUILD_FAMILIES + [
+            'pass1.build', 'pass1.presolve', 'pass1.search',
+            'pass2.build', 'pass2.presolve', 'pass2.search',
+            'collector.callback', 'collector.stats'
+        ]:
+            assert name in summary, name
+        # Chaque famille est construite pour les deux modèles (PASS 1 et PASS 2)
+        assert sum(s['name'] == 'build.couples' for s in info['timings']) == 2
+        assert summary['pass1.presolve'] + summary['pass1.search'] <= info['elapsed_time']
+        trace = json.loads(path.read_text())
+        assert len(trace['traceEvents']) == len(info['timings'])
+    
+    def test_multipass_reports_probes(self, tournaments_sans_o3, tmp_path):
+        """Une sonde par option testée, dans la trace de tout le calcul"""
+        participants = [
+            Participant("Alice", "F", None, 2, 1, "O3", False),
+            Participant("Betty", "F", None, 1, 1, "O3", True),
+            Participant("Clara", "F", None, 2, 0, "O3", True),
+        ]
+        path = tmp_path / 'multipass.json'
+        config = SolverConfig(timeout_seconds=20, timing_trace_path=str(path))
+        
+        result = MultiPassSolver(config).solve_multipass(participants, tournaments_sans_o3)
+        
+        probes = [s for s in result.solver_info['timings'] if s['name'] == 'probe']
+        assert [(s['args']['participant'], s['args']['option']) for s in probes] == [
+            ('Alice', 'open'), ('Alice', 'etape')
+        ]
+        names = {e['name'] for e in json.loads(path.read_text())['traceEvents']}
+        assert {'multipass', 'probe', 'pass1.search'} <= names
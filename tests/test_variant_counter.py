@@ -0,0 +1,88 @@
+"""
+Tests du comptage exact des variantes par profil
+"""
+import pytest
+from collections import Counter
+
+from src.models import Participant, Tournament, SolverConfig
+from src.solver import TournamentSolver
+from src.variant_counter import count_variants, solution_profile_key, profile_key
+from src.constants import TOURNAMENTS
+
+
+def _tournaments():
+    return [Tournament(**t) for t in TOURNAMENTS if t['id'] != 'O3']
+
+
+def _enumerated_counts(participants, tournaments, allow_incomplete):
+    """Variantes par profil, par énumération complète (mode 'all')"""
+    config = SolverConfig(
+        allow_incomplete=allow_incomplete,
+        max_solutions=0,
+        timeout_seconds=60.0,
+        search_mode='all'
+    )
+    solutions, status, _ = TournamentSolver(config).solve(participants, tournaments)
+    assert status == "OPTIMAL"
+    return Counter(solution_profile_key(s) for s in solutions)
+
+
+def test_counts_match_enumeration_strict_teams(conflict_roster, tournaments_sans_o3):
+    """Test: comptes DP == énumération complète (équipes complètes, couple)"""
+    participants, tournaments = conflict_roster, tournaments_sans_o3
+    
+    expected = _enumerated_counts(participants, tournaments, False)
+    counts = count_variants(participants, tournaments, False, profiles=list(expected))
+    
+    assert counts == dict(expected)
+
+
+def test_counts_match_enumeration_incomplete_teams():
+    """Test: comptes DP == énumération complète (équipes incomplètes autorisées)"""
+    participants = [
+        Participant("Alice", "F", "Bob", 1, 1, "O3", False),
+        Participant("Bob", "M", "Alice", 2, 0, "O3", False),
+        Participant("Clara", "F", None, 1, 0, "E2", True),
+    ]
+    tournaments = _tournaments()
+    
+    expected = _enumerated_counts(participants, tournaments, True)
+    counts = count_variants(participants, tournaments, True, profiles=list(expected))
+    
+    assert counts == dict(expected)
+
+
+def test_all_profiles_and_solver_integration():
+    """Test: sans filtre de profils, tous les profils; info['variant_counts'] du solver"""
+    participants = [
+        Participant("Alice", "F", None, 1, 0, "O3", False),
+        Participant("Betty", "F", None, 1, 0, "O3", False),
+        Participant("Clara", "F", None, 1, 0, "O3", False),
+    ]
+    tournaments = _tournaments()
+    
+    counts = count_variants(participants, tournaments, False)
+    # Les 3 jouent la même étape (3 choix) ou personne ne joue d'étape
+    assert counts[profile_key({})] == 3
+    assert counts[profile_key({'Alice': 2, 'Betty': 2, 'Clara': 2})] == 1
+    assert sum(counts.values()) == 4
+    
+    config = SolverConfig(max_solutions=10, timeout_seconds=10.0, count_variants=True)
+    solutions, _, info = TournamentSolver(config).solve(participants, tournaments)
+    assert info['variant_counts'] == {profile_key({}): 3}
+    assert not info['variant_counts_unfiltered']
+
+
+def test_counts_flagged_unfiltered_with_band_or_score():
+    """Test: avec une bande ou un score minimum, les comptes sont marqués 'toutes bandes'"""
+    participants = [
+        Participant(nom, "F", None, 1, 0, "O3", False) for nom in ("Alice", "Betty", "Clara")
+    ]
+    for changes in ({'enumeration_band': 'objective'}, {'min_quality_score': 50}):
+        config = SolverConfig(timeout_seconds=10.0, count_variants=True, **changes)
+        _, _, info = TournamentSolver(config).solve(participants, _tournaments())
+        assert info['variant_counts_unfiltered'], changes
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])